@@ -1,18 +1,53 @@
 """Catalog routes for browsing karaoke songs."""
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, computed_field
+import asyncio
+import base64
+import binascii
+import json
+import logging
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime
+from typing import Annotated
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, Field, computed_field
 from starlette.requests import Request
+from starlette.responses import Response
 
+from backend.api.deps import get_firestore, get_settings
+from backend.config import BackendSettings
 from backend.i18n import get_locale_from_request, t
+from backend.services.firestore_service import FirestoreService
 from backend.services.karaoke_link_service import (
     KaraokeLinkService,
     get_karaoke_link_service,
 )
 from karaoke_decide.services.bigquery_catalog import BigQueryCatalogService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Upper bound on a song's brand count (fits uint16; real values are well under 100)
+MAX_BRAND_COUNT = 2**16 - 1
+
+# Serialized /songs/popular responses keyed by (limit, min_brands). The catalog
+# tables are refreshed outside this process, so nothing invalidates these entries;
+# after a refresh each one is served stale for at most the TTL.
+POPULAR_CACHE_TTL_SECONDS = 3600
+POPULAR_CACHE_MAX_ENTRIES = 64
+# Least recently used entries are evicted first once POPULAR_CACHE_MAX_ENTRIES is reached.
+_popular_cache: OrderedDict[tuple[int, int], tuple[float, bytes]] = OrderedDict()
+
+# Materialized catalog stats, refreshed from BigQuery once per catalog sync interval
+CATALOG_META_COLLECTION = "catalog_meta"
+CATALOG_STATS_DOC_ID = "stats"
+CATALOG_STATS_MAX_AGE_SECONDS = 3600
+# Held while recomputing stats, so concurrent requests for a stale doc share one BigQuery scan
+_catalog_stats_lock = asyncio.Lock()
+
 # Lazy initialization for testability
 _catalog_service: BigQueryCatalogService | None = None
 _karaoke_link_service: KaraokeLinkService | None = None
@@ -26,6 +61,11 @@ def get_catalog_service() -> BigQueryCatalogService:
     return _catalog_service
 
 
+def clear_popular_cache() -> None:
+    """Drop all cached /songs/popular responses (used to isolate tests)."""
+    _popular_cache.clear()
+
+
 def _get_karaoke_link_service() -> KaraokeLinkService:
     """Get or create karaoke link service (lazy initialization)."""
     global _karaoke_link_service
@@ -41,7 +81,7 @@ class SongResponse(BaseModel):
     artist: str
     title: str
     brands: list[str]
-    brand_count: int
+    brand_count: int = Field(ge=0, le=MAX_BRAND_COUNT)
     is_popular: bool = False
 
 
@@ -49,19 +89,20 @@ class CatalogSearchResponse(BaseModel):
     """Paginated catalog search response."""
 
     songs: list[SongResponse]
-    total: int
+    total: int | None = None  # Only counted when include_total=true
     page: int
     per_page: int
     has_more: bool
+    next_cursor: str | None = None  # Pass back as `cursor` to fetch the next page
 
 
 class CatalogStatsResponse(BaseModel):
     """Catalog statistics."""
 
-    total_songs: int
-    unique_artists: int
-    max_brand_count: int
-    avg_brand_count: float
+    total_songs: int = Field(ge=0)
+    unique_artists: int = Field(ge=0)
+    max_brand_count: int = Field(ge=0, le=MAX_BRAND_COUNT)
+    avg_brand_count: float = Field(ge=0)
 
 
 class KaraokeLinkResponse(BaseModel):
@@ -144,13 +185,35 @@ class TrackSearchResponse(BaseModel):
     total: int
 
 
+def _encode_cursor(brand_count: int, song_id: int) -> str:
+    """Encode the last row's sort key as an opaque search cursor."""
+    payload = json.dumps({"bc": brand_count, "id": song_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[int, int]:
+    """Decode a search cursor back into its (brand_count, id) sort key.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(payload["bc"]), int(payload["id"])
+    except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
 @router.get("/songs", response_model=CatalogSearchResponse)
 async def search_catalog(
+    request: Request,
     q: str | None = Query(None, description="Search query (artist or title)"),
     artist: str | None = Query(None, description="Filter by artist"),
     min_brands: int = Query(0, ge=0, description="Minimum brand count"),
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (deprecated, use cursor)"),
     per_page: int = Query(20, ge=1, le=100, description="Results per page"),
+    cursor: str | None = Query(None, description="next_cursor from the previous search page"),
+    include_total: bool = Query(False, description="Also count all matching songs (extra query)"),
 ) -> CatalogSearchResponse:
     """Search and browse the karaoke catalog.
 
@@ -158,25 +221,52 @@ async def search_catalog(
     - q: Search term matching artist or title
     - artist: Exact artist match
     - min_brands: Minimum number of karaoke brands (popularity filter)
+
+    Search results are paged with `cursor`/`next_cursor` (keyset pagination).
+    `page` is still honoured for older clients but costs a scan of every
+    skipped row. Only `q` searches are cursor-paged; a cursor sent with
+    `artist` or without `q` is rejected with 400 rather than ignored.
+
+    `total` is null unless `include_total=true`, since counting needs a second
+    query over the whole catalog; use `has_more` to drive paging.
     """
     offset = (page - 1) * per_page
-
+    after: tuple[int, int] | None = None
+    if cursor:
+        try:
+            if artist or not q:
+                raise ValueError("Cursors only page q searches")
+            after = _decode_cursor(cursor)
+        except ValueError:
+            locale = get_locale_from_request(request)
+            raise HTTPException(status_code=400, detail=t(locale, "catalog.invalidCursor"))
+
+    next_cursor: str | None = None
+    total: int | None = None
     service = get_catalog_service()
     if artist:
         results = service.get_songs_by_artist(artist, limit=per_page)
+        if include_total:
+            total = service.count_matching_songs(artist=artist)
     elif q:
         results = service.search_songs(
             query=q,
             limit=per_page + 1,  # Get one extra to check has_more
             offset=offset,
             min_brands=min_brands,
+            after=after,
         )
+        if len(results) > per_page:
+            last = results[per_page - 1]
+            next_cursor = _encode_cursor(last.brand_count, last.id)
+        if include_total:
+            total = service.count_matching_songs(query=q, min_brands=min_brands)
     else:
         # Default: popular songs
-        results = service.get_popular_songs(
-            limit=per_page + 1,
-            min_brands=max(min_brands, 3),  # At least 3 brands for popular
-        )
+        popular_min_brands = max(min_brands, 3)  # At least 3 brands for popular
+        results = service.get_popular_songs(limit=per_page + 1, min_brands=popular_min_brands)
+        if include_total:
+            total = service.count_matching_songs(min_brands=popular_min_brands)
 
     has_more = len(results) > per_page
     songs = results[:per_page]
@@ -193,10 +283,11 @@ async def search_catalog(
             )
             for s in songs
         ],
-        total=len(songs),  # Would need separate count query for exact total
+        total=total,
         page=page,
         per_page=per_page,
         has_more=has_more,
+        next_cursor=next_cursor,
     )
 
 
@@ -204,20 +295,42 @@ async def search_catalog(
 async def get_popular_songs(
     limit: int = Query(50, ge=1, le=200, description="Number of songs"),
     min_brands: int = Query(5, ge=1, description="Minimum brand count"),
-) -> list[SongResponse]:
-    """Get the most popular karaoke songs by brand coverage."""
-    results = get_catalog_service().get_popular_songs(limit=limit, min_brands=min_brands)
-    return [
-        SongResponse(
-            id=s.id,
-            artist=s.artist,
-            title=s.title,
-            brands=s.brands.split(",") if s.brands else [],
-            brand_count=s.brand_count,
-            is_popular=True,
-        )
-        for s in results
-    ]
+) -> Response:
+    """Get the most popular karaoke songs by brand coverage.
+
+    The serialized body is cached per (limit, min_brands) for
+    POPULAR_CACHE_TTL_SECONDS, so repeat requests skip BigQuery and JSON encoding.
+    The cache holds at most POPULAR_CACHE_MAX_ENTRIES keys and evicts the least
+    recently used one first.
+    """
+    key = (limit, min_brands)
+    now = time.monotonic()
+    cached = _popular_cache.get(key)
+    if cached is not None and now - cached[0] < POPULAR_CACHE_TTL_SECONDS:
+        _popular_cache.move_to_end(key)
+        return Response(content=cached[1], media_type="application/json")
+
+    # The BigQuery client is blocking, so run the query in a worker thread
+    results = await asyncio.to_thread(get_catalog_service().get_popular_songs, limit=limit, min_brands=min_brands)
+    body = orjson.dumps(
+        [
+            SongResponse(
+                id=s.id,
+                artist=s.artist,
+                title=s.title,
+                brands=s.brands.split(",") if s.brands else [],
+                brand_count=s.brand_count,
+                is_popular=True,
+            ).model_dump()
+            for s in results
+        ]
+    )
+
+    _popular_cache[key] = (now, body)
+    _popular_cache.move_to_end(key)
+    if len(_popular_cache) > POPULAR_CACHE_MAX_ENTRIES:
+        _popular_cache.popitem(last=False)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/songs/{song_id}", response_model=SongResponse)
@@ -246,8 +359,9 @@ async def get_song_links(song_id: int, request: Request) -> SongLinksResponse:
     - YouTube search for existing karaoke videos
     - Nomad Karaoke Generator for creating custom videos
     """
-    # First get the song to verify it exists and get artist/title
-    song = get_catalog_service().get_song_by_id(song_id)
+    # First get the song to verify it exists and get artist/title. The BigQuery
+    # client is blocking, so run it in a worker thread to keep the event loop free.
+    song = await asyncio.to_thread(get_catalog_service().get_song_by_id, song_id)
     if not song:
         locale = get_locale_from_request(request)
         raise HTTPException(status_code=404, detail=t(locale, "catalog.songNotFound"))
@@ -272,11 +386,62 @@ async def get_song_links(song_id: int, request: Request) -> SongLinksResponse:
     )
 
 
+async def _read_fresh_catalog_stats(
+    firestore: FirestoreService, settings: BackendSettings
+) -> CatalogStatsResponse | None:
+    """Return the materialized stats, or None if the document is missing, stale or invalid."""
+    try:
+        doc = await firestore.get_document(CATALOG_META_COLLECTION, CATALOG_STATS_DOC_ID)
+        if doc and doc.get("computed_at"):
+            age_hours = (datetime.now(UTC) - datetime.fromisoformat(doc["computed_at"])).total_seconds() / 3600
+            if age_hours < settings.catalog_sync_interval_hours:
+                # A partial or hand-edited doc fails here and is recomputed instead of 500ing
+                return CatalogStatsResponse.model_validate(doc)
+    except Exception as e:
+        logger.warning(f"Failed to read materialized catalog stats: {e}")
+    return None
+
+
+async def _load_catalog_stats(firestore: FirestoreService, settings: BackendSettings) -> CatalogStatsResponse:
+    """Read materialized catalog stats, recomputing them from BigQuery when stale.
+
+    The stats document is rewritten at most once per catalog_sync_interval_hours,
+    so a typical request costs a single Firestore read instead of COUNT/DISTINCT
+    scans over the whole catalog. Recomputes run one at a time in a worker
+    thread; requests that waited on the lock re-read the document it wrote.
+    """
+    stats = await _read_fresh_catalog_stats(firestore, settings)
+    if stats is not None:
+        return stats
+
+    async with _catalog_stats_lock:
+        stats = await _read_fresh_catalog_stats(firestore, settings)
+        if stats is not None:
+            return stats
+
+        # The BigQuery client is blocking, so run the scan off the event loop
+        stats = CatalogStatsResponse.model_validate(await asyncio.to_thread(get_catalog_service().get_stats))
+        try:
+            await firestore.set_document(
+                CATALOG_META_COLLECTION,
+                CATALOG_STATS_DOC_ID,
+                {**stats.model_dump(), "computed_at": datetime.now(UTC).isoformat()},
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store materialized catalog stats: {e}")
+        return stats
+
+
 @router.get("/stats", response_model=CatalogStatsResponse)
-async def get_catalog_stats() -> CatalogStatsResponse:
+async def get_catalog_stats(
+    response: Response,
+    firestore: Annotated[FirestoreService, Depends(get_firestore)],
+    settings: Annotated[BackendSettings, Depends(get_settings)],
+) -> CatalogStatsResponse:
     """Get catalog statistics."""
-    stats = get_catalog_service().get_stats()
-    return CatalogStatsResponse(**stats)
+    stats = await _load_catalog_stats(firestore, settings)
+    response.headers["Cache-Control"] = f"public, max-age={CATALOG_STATS_MAX_AGE_SECONDS}"
+    return stats
 
 
 class ArtistIndexEntry(BaseModel):
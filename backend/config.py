@@ -1,12 +1,20 @@
 """Backend-specific configuration."""
 
-from functools import lru_cache
+from functools import cache
+
+from pydantic_settings import SettingsConfigDict
 
 from karaoke_decide.core.config import Settings
 
 
 class BackendSettings(Settings):
-    """Extended settings for the backend API."""
+    """Extended settings for the backend API.
+
+    Frozen: the cached instance from get_backend_settings() is shared across
+    requests, so fields can't be reassigned after load.
+    """
+
+    model_config = SettingsConfigDict(frozen=True)
 
     # Rate limiting
     rate_limit_requests: int = 100
@@ -14,12 +22,14 @@ class BackendSettings(Settings):
 
     # Catalog sync
     catalog_sync_interval_hours: int = 24
+    # Directory for the memory-mapped catalog lookup cache; empty disables it
+    catalog_cache_dir: str = ""
 
     # Magic link (24 hours to allow time for email delivery and user action)
     magic_link_expiration_minutes: int = 1440
 
 
-@lru_cache
+@cache
 def get_backend_settings() -> BackendSettings:
     """Get cached backend settings instance."""
     return BackendSettings()
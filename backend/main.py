@@ -7,9 +7,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from backend.api.routes import internal_api_router, router
 from backend.config import get_backend_settings
+from backend.middleware import ETagMiddleware
 from backend.services.catalog_lookup import get_catalog_lookup
 from karaoke_decide.services.bigquery_catalog import BigQueryCatalogService
 
@@ -32,14 +34,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Pre-load karaoke catalog into memory for instant matching
     # This makes sync ~100x faster by avoiding BigQuery queries per track
+    cache_dir = settings.catalog_cache_dir
     try:
         catalog_lookup = get_catalog_lookup()
-        bigquery_service = BigQueryCatalogService()
-        catalog_lookup.load_from_bigquery(bigquery_service)
+        # Workers sharing a cache directory map the same files instead of each rebuilding;
+        # caches older than the catalog sync interval are rebuilt from BigQuery
+        max_age_hours = settings.catalog_sync_interval_hours
+        loaded_from_cache = bool(cache_dir) and catalog_lookup.load_from_cache(cache_dir, max_age_hours=max_age_hours)
+        if not loaded_from_cache:
+            bigquery_service = BigQueryCatalogService()
+            catalog_lookup.load_from_bigquery(bigquery_service)
         logger.info(f"Catalog loaded: {catalog_lookup.entry_count:,} songs ready for instant matching")
     except Exception as e:
         logger.error(f"Failed to load catalog: {e}")
         # Don't fail startup - sync will fall back to BigQuery queries
+    else:
+        if cache_dir and not loaded_from_cache:
+            try:
+                catalog_lookup.save_cache(cache_dir)
+            except Exception as e:
+                # The catalog is loaded; only the next start loses the cache
+                logger.warning(f"Failed to write catalog cache to {cache_dir}: {e}")
 
     yield
 
@@ -56,10 +71,15 @@ def create_app() -> FastAPI:
         description="Help people discover and choose the perfect karaoke songs",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/api/docs" if not settings.is_production else None,
         redoc_url="/api/redoc" if not settings.is_production else None,
     )
 
+    # Conditional GET for cacheable catalog reads. Added before CORS so CORS is the
+    # outer layer and its headers reach 304 responses too.
+    app.add_middleware(ETagMiddleware)
+
     # CORS configuration
     app.add_middleware(
         CORSMiddleware,
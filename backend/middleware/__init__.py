@@ -0,0 +1,5 @@
+"""HTTP middleware for Karaoke Decide backend."""
+
+from backend.middleware.etag import ETagMiddleware
+
+__all__ = ["ETagMiddleware"]
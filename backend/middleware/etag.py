@@ -0,0 +1,97 @@
+"""ETag / conditional GET middleware for cacheable catalog reads.
+
+Catalog stats and popular songs only change when the catalog is re-synced,
+so clients that poll them can revalidate with If-None-Match and get an
+empty 304 instead of the full JSON body.
+"""
+
+import re
+
+import xxhash
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Read-only catalog endpoints whose responses are safe to revalidate
+ETAG_PATH_PATTERN = re.compile(r"^/api/catalog/(?:stats|songs/popular|songs/\d+)$")
+
+# Headers a 304 must repeat from the 200 it stands in for (RFC 9110 section 15.4.5)
+NOT_MODIFIED_HEADERS = ("cache-control", "vary", "expires", "content-location", "date")
+
+
+def compute_etag(body: bytes) -> str:
+    """Return a strong, quoted ETag for a response body."""
+    return f'"{xxhash.xxh3_64_hexdigest(body)}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ETagMiddleware:
+    """Add ETags to GET responses on catalog read endpoints and answer 304s.
+
+    A plain ASGI middleware: requests to other paths are handed straight to the
+    app, and only matching 200 responses are buffered to hash their body.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET" or not ETAG_PATH_PATTERN.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Message = {}
+        chunks: list[bytes] = []
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+            elif message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    await self._send_buffered(send, start, b"".join(chunks), if_none_match)
+            else:
+                await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+    @staticmethod
+    async def _send_buffered(send: Send, start: Message, body: bytes, if_none_match: str | None) -> None:
+        """Send a buffered 200 with its ETag, or an empty 304 if the client's copy matches."""
+        etag = compute_etag(body)
+        headers = MutableHeaders(scope=start)
+
+        if if_none_match and _etag_matches(if_none_match, etag):
+            not_modified = MutableHeaders()
+            for name in NOT_MODIFIED_HEADERS:
+                for value in headers.getlist(name):
+                    not_modified.append(name, value)
+            not_modified["ETag"] = etag
+            await send({"type": "http.response.start", "status": 304, "headers": not_modified.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers["ETag"] = etag
+        headers["Content-Length"] = str(len(body))
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
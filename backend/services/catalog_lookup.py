@@ -1,17 +1,47 @@
 """In-memory catalog lookup for instant track matching.
 
-Loads the entire karaoke catalog into a dictionary on startup,
-enabling O(1) lookups instead of BigQuery queries during sync.
+Loads the entire karaoke catalog into a trie on startup,
+enabling fast lookups instead of BigQuery queries during sync.
 """
 
+import json
 import logging
+import mmap
+import os
 import re
+import shutil
+import tempfile
+import threading
 import time
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from functools import cache, lru_cache
+from itertools import accumulate, pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import marisa_trie
+import rbloom
+
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+
+    _HAS_RAPIDFUZZ = True
+except ImportError:  # pragma: no cover - exercised only without rapidfuzz installed
+    _HAS_RAPIDFUZZ = False
+
+try:
+    import hyperscan
+
+    _HAS_HYPERSCAN = True
+except ImportError:  # pragma: no cover - hyperscan only ships x86_64 wheels
+    _HAS_HYPERSCAN = False
 
 if TYPE_CHECKING:
-    from karaoke_decide.services.bigquery_catalog import BigQueryCatalogService
+    from karaoke_decide.services.bigquery_catalog import BigQueryCatalogService, SongResult
 
 logger = logging.getLogger(__name__)
 
@@ -45,21 +75,131 @@ ARTIST_REMOVE_PATTERNS = [
     r"\s*\bwith\b\s+.*$",  # with Another Artist
 ]
 
-# Compiled patterns
+# Fuzzy fallback: max edit distance between normalized titles by the same artist.
+# Short titles are excluded since a couple of edits can turn them into a different song.
+FUZZY_MAX_DISTANCE = 2
+FUZZY_MIN_TITLE_LENGTH = 8
+
+# Memoized normalizations; sync batches repeat the same artists and titles many times
+NORMALIZE_CACHE_SIZE = 65536
+
+# Separator between normalized artist and title in index keys (never survives normalization)
+KEY_SEPARATOR = "\x1f"
+
+# False-positive rate of the Bloom filter that screens exact-key misses before the trie
+BLOOM_ERROR_RATE = 0.001
+
+# Keys this short are also kept in a flat dict, where hashing beats a trie walk
+SHORT_KEY_MAX_LENGTH = 8
+
+# On-disk catalog cache (see CatalogLookup.save_cache). Bump the version whenever
+# the layout or key normalization changes so stale caches are rebuilt.
+CATALOG_CACHE_VERSION = 2
+# Symlink in the cache directory naming the build directory that holds the live files
+CATALOG_CACHE_CURRENT = "current"
+CATALOG_CACHE_BUILD_PREFIX = "build-"
+CATALOG_CACHE_META = "meta.json"
+CATALOG_CACHE_TRIE = "catalog.marisa"
+# Numeric columns, stored as raw native-endian arrays: file name -> array typecode
+CATALOG_CACHE_COLUMNS: dict[str, Literal["q", "H", "I"]] = {
+    "ids.q": "q",
+    "brand_counts.H": "H",
+    "brand_ids.H": "H",
+    "brand_offsets.I": "I",
+}
+# String columns, stored as one UTF-8 text plus character offsets: attribute -> file stem
+CATALOG_CACHE_STRINGS = {"_artists": "artists", "_titles": "titles"}
+
+# Compiled patterns, applied in turn like TrackMatcher does. A single alternation would
+# differ on nested groups: "Song (Live at (feat. Y) Wembley)" strips the feat. group
+# first and then the whole live group, leaving "song" rather than "song wembley".
 _compiled_title_patterns = [re.compile(p, re.IGNORECASE) for p in TITLE_REMOVE_PATTERNS]
 _compiled_artist_patterns = [re.compile(p, re.IGNORECASE) for p in ARTIST_REMOVE_PATTERNS]
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9 ]")
+# Characters the Hyperscan prefilter can't vouch for (see _strip_candidates)
+_UNSCANNABLE_RE = re.compile(r"[^\x20-\x7e\n]")
 
+# ASCII fast path for _NON_ALNUM_RE: map every ASCII char outside [a-z0-9 ] to a space
+_NON_ALNUM_TABLE = str.maketrans(
+    {chr(c): " " for c in range(128) if not (chr(c).islower() or chr(c).isdigit() or chr(c) == " ")}
+)
 
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def _normalize_text(text: str) -> str:
     """Normalize text for matching (same as TrackMatcher)."""
     if not text:
         return ""
     result = text.lower()
-    result = re.sub(r"[^a-z0-9 ]", " ", result)
-    result = re.sub(r"\s+", " ", result)
-    return result.strip()
+    # Must match BigQuery: r'[^a-z0-9 ]'
+    if result.isascii():
+        result = result.translate(_NON_ALNUM_TABLE)
+    else:
+        result = _NON_ALNUM_RE.sub(" ", result)
+    # Collapse whitespace and strip
+    return " ".join(result.split())
+
+
+# Per-thread DP rows reused by _bounded_levenshtein to avoid per-call allocation
+_levenshtein_rows = threading.local()
+
 
+def _bounded_levenshtein(a: str, b: str, max_dist: int = FUZZY_MAX_DISTANCE) -> int:
+    """Levenshtein distance computed only within a diagonal band of width max_dist.
 
+    Pure-Python fallback for when rapidfuzz is unavailable. Only cells with
+    |i - j| <= max_dist are filled, and the scan stops as soon as a whole row
+    exceeds max_dist.
+
+    Returns:
+        The edit distance if it is <= max_dist, otherwise max_dist + 1.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    n, m = len(a), len(b)
+    over = max_dist + 1
+    if m - n > max_dist:
+        return over
+    if n == 0:
+        return m
+
+    size = m + 1
+    rows = getattr(_levenshtein_rows, "rows", None)
+    if rows is None or len(rows[0]) < size:
+        rows = (array("i", bytes(4 * size)), array("i", bytes(4 * size)))
+        _levenshtein_rows.rows = rows
+    prev, curr = rows
+
+    for j in range(size):
+        prev[j] = j if j <= max_dist else over
+
+    for i in range(1, n + 1):
+        lo = max(1, i - max_dist)
+        hi = min(m, i + max_dist)
+        curr[lo - 1] = i if lo == 1 else over
+        row_min = curr[lo - 1]
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            cost = prev[j - 1] + (ca != b[j - 1])
+            if prev[j] + 1 < cost:
+                cost = prev[j] + 1
+            if curr[j - 1] + 1 < cost:
+                cost = curr[j - 1] + 1
+            if cost > over:
+                cost = over
+            curr[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if hi < m:
+            curr[hi + 1] = over
+        if row_min > max_dist:
+            return over
+        prev, curr = curr, prev
+
+    return min(prev[m], over)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def _normalize_title(title: str) -> str:
     """Normalize a track title for matching."""
     if not title:
@@ -70,6 +210,7 @@ def _normalize_title(title: str) -> str:
     return _normalize_text(result)
 
 
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def _normalize_artist(artist: str) -> str:
     """Normalize an artist name for matching."""
     if not artist:
@@ -80,9 +221,99 @@ def _normalize_artist(artist: str) -> str:
     return _normalize_text(result)
 
 
+@cache
+def _strip_database(patterns: tuple[str, ...]) -> "hyperscan.Database":
+    """Compile strip patterns into a single Hyperscan block-mode database.
+
+    MULTILINE lets the end-anchored artist patterns match at each line of a
+    newline-joined batch.
+    """
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode() for pattern in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE] * len(patterns),
+    )
+    return database
+
+
+def _strip_candidates(texts: list[str], patterns: list[str]) -> set[int]:
+    """Indexes of texts that any of the strip patterns may match, in one Hyperscan pass.
+
+    Texts are scanned as one newline-joined buffer and each match is credited to
+    the line holding its last byte. Every `re` match inside a line is also reported
+    for that line, so the result is a superset of the rows `re.sub` would change.
+    Texts with characters outside printable ASCII (where `re`'s Unicode case
+    folding and whitespace classes differ from Hyperscan's) are always returned.
+    """
+    joined = "\n".join(texts)
+    # Line i starts after the earlier lines' text plus one newline each
+    starts = [offset + i for i, offset in enumerate(accumulate(map(len, texts), initial=0))]
+    candidates = {bisect_right(starts, m.start()) - 1 for m in _UNSCANNABLE_RE.finditer(joined)}
+    ends: list[int] = []
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: object) -> None:
+        ends.append(end)
+
+    # "replace" keeps one byte per character, so offsets still line up with starts
+    _strip_database(tuple(patterns)).scan(joined.encode("ascii", "replace"), match_event_handler=on_match)
+    candidates.update(bisect_right(starts, end - 1) - 1 for end in ends)
+    return candidates
+
+
+def _normalize_columns(artists: list[str], titles: list[str]) -> tuple[list[str], list[str]]:
+    """Normalize whole artist and title columns at catalog load.
+
+    With Hyperscan, one scan per column picks out the few rows carrying a strip
+    pattern; only those go through the `re` substitutions, the rest just get
+    _normalize_text. Results are identical to _normalize_artist/_normalize_title.
+    """
+    if not _HAS_HYPERSCAN:
+        return [_normalize_artist(a) for a in artists], [_normalize_title(t) for t in titles]
+
+    artist_rows = _strip_candidates(artists, ARTIST_REMOVE_PATTERNS)
+    title_rows = _strip_candidates(titles, TITLE_REMOVE_PATTERNS)
+    return (
+        [_normalize_artist(a) if i in artist_rows else _normalize_text(a) for i, a in enumerate(artists)],
+        [_normalize_title(t) if i in title_rows else _normalize_text(t) for i, t in enumerate(titles)],
+    )
+
+
+def _clear_normalize_caches() -> None:
+    """Drop all memoized normalizations."""
+    _normalize_text.cache_clear()
+    _normalize_title.cache_clear()
+    _normalize_artist.cache_clear()
+    CatalogLookup._make_key.cache_clear()
+
+
+def _map_column(path: Path, typecode: Literal["q", "H", "I"]) -> Sequence[int]:
+    """Map a raw array file read-only, so worker processes share its pages."""
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return array(typecode)
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast(typecode)
+
+
+def _read_strings(directory: Path, stem: str) -> list[str]:
+    """Read a string column written by _write_strings."""
+    text = (directory / f"{stem}.txt").read_text(encoding="utf-8")
+    offsets = array("I", (directory / f"{stem}.offsets.I").read_bytes())
+    return [text[start:end] for start, end in pairwise(offsets)]
+
+
+def _write_strings(directory: Path, stem: str, values: list[str]) -> None:
+    """Write a string column as one text file plus an array of character offsets."""
+    offsets = array("I", accumulate(map(len, values), initial=0))
+    (directory / f"{stem}.txt").write_text("".join(values), encoding="utf-8")
+    (directory / f"{stem}.offsets.I").write_bytes(offsets.tobytes())
+
+
 @dataclass
 class CatalogEntry:
-    """Lightweight catalog entry for in-memory storage."""
+    """Catalog entry returned by lookups (materialized on demand from column storage)."""
 
     id: int
     artist: str
@@ -94,15 +325,35 @@ class CatalogEntry:
 class CatalogLookup:
     """In-memory catalog for instant track matching.
 
-    Loads the entire karaoke catalog (~275K songs) into a dictionary,
-    enabling O(1) lookups during sync instead of BigQuery queries.
+    Loads the entire karaoke catalog (~275K songs) into a marisa-trie keyed by
+    normalized "artist<US>title", giving O(key length) lookups during sync
+    instead of BigQuery queries, plus prefix scans for typeahead.
+
+    Songs are stored column-wise (typed arrays for numbers, parallel lists for
+    strings) and indexed by row number, rather than as one object per song;
+    CatalogEntry objects are only built for rows a lookup returns. Brands are
+    dictionary-encoded: each row holds a slice of small brand IDs into a shared
+    table of the few hundred distinct brand names.
 
-    Memory footprint: ~55 MB for 275K entries.
+    The built index can be saved to a directory and memory-mapped back on the
+    next start (save_cache / load_from_cache), skipping the BigQuery read and
+    normalization pass.
     """
 
     def __init__(self) -> None:
         """Initialize empty catalog lookup."""
-        self._lookup: dict[str, CatalogEntry] = {}
+        self._ids: Sequence[int] = array("q")
+        self._brand_counts: Sequence[int] = array("H")
+        self._artists: list[str] = []
+        self._titles: list[str] = []
+        # Row i's brands are _brand_names[id] for id in _brand_ids[_brand_offsets[i]:_brand_offsets[i + 1]]
+        self._brand_names: list[str] = []
+        self._brand_table: dict[str, int] = {}
+        self._brand_ids: Sequence[int] = array("H")
+        self._brand_offsets: Sequence[int] = array("I", [0])
+        self._trie: marisa_trie.RecordTrie | None = None
+        self._bloom: rbloom.Bloom | None = None
+        self._short_lookup: dict[str, int] = {}
         self._loaded = False
         self._entry_count = 0
 
@@ -132,26 +383,158 @@ class CatalogLookup:
         # Get all songs from BigQuery
         all_songs = bigquery_service.get_all_songs()
 
-        # Build lookup dictionary
-        for song in all_songs:
-            key = self._make_key(song.artist, song.title)
-            self._lookup[key] = CatalogEntry(
-                id=song.id,
-                artist=song.artist,
-                title=song.title,
-                brands=song.brands,
-                brand_count=song.brand_count,
-            )
-
-        self._entry_count = len(self._lookup)
-        self._loaded = True
+        self._load_entries(all_songs)
 
         elapsed = time.time() - start_time
         logger.info(f"Loaded {self._entry_count:,} songs into catalog lookup in {elapsed:.2f}s")
 
+    def load_from_cache(self, cache_dir: str | Path, max_age_hours: float | None = None) -> bool:
+        """Load the catalog from a cache directory written by save_cache.
+
+        The trie and numeric columns are memory-mapped read-only, so processes
+        loading the same cache share one copy through the OS page cache.
+
+        Args:
+            cache_dir: Directory holding the cache files.
+            max_age_hours: Reject caches built longer ago than this (None accepts any age).
+
+        Returns:
+            True if the catalog is loaded; False if the cache is missing, stale
+            or unreadable (the caller should load from BigQuery instead).
+        """
+        if self._loaded:
+            logger.info("Catalog already loaded, skipping")
+            return True
+
+        start_time = time.time()
+        try:
+            # Resolve the symlink once so every file comes from the same build
+            directory = (Path(cache_dir) / CATALOG_CACHE_CURRENT).resolve(strict=True)
+            meta = json.loads((directory / CATALOG_CACHE_META).read_text())
+            if meta.get("version") != CATALOG_CACHE_VERSION:
+                logger.info(f"Catalog cache in {directory} is version {meta.get('version')}, ignoring")
+                return False
+            age_hours = (time.time() - meta["built_at"]) / 3600
+            if max_age_hours is not None and age_hours > max_age_hours:
+                logger.info(f"Catalog cache in {directory} is {age_hours:.1f}h old, ignoring")
+                return False
+            trie = marisa_trie.RecordTrie("<I")
+            trie.mmap(str(directory / CATALOG_CACHE_TRIE))
+            ids, brand_counts, brand_ids, brand_offsets = (
+                _map_column(directory / name, typecode) for name, typecode in CATALOG_CACHE_COLUMNS.items()
+            )
+            artists, titles = (_read_strings(directory, stem) for stem in CATALOG_CACHE_STRINGS.values())
+        except FileNotFoundError:
+            logger.info(f"No catalog cache in {cache_dir}")
+            return False
+        except (OSError, ValueError, KeyError, RuntimeError) as e:
+            logger.warning(f"Failed to read catalog cache in {cache_dir}: {e}")
+            return False
+
+        self._ids, self._brand_counts = ids, brand_counts
+        self._brand_ids, self._brand_offsets = brand_ids, brand_offsets
+        self._artists, self._titles = artists, titles
+        self._brand_names = meta["brand_names"]
+        self._brand_table = {name: brand_id for brand_id, name in enumerate(self._brand_names)}
+        self._trie = trie
+        self._build_key_indexes({key: record[0] for key, record in trie.iteritems()})
+
+        elapsed = time.time() - start_time
+        logger.info(f"Loaded {self._entry_count:,} songs from catalog cache in {elapsed:.2f}s")
+        return True
+
+    def save_cache(self, cache_dir: str | Path) -> None:
+        """Write the loaded catalog to a cache directory for load_from_cache.
+
+        All files go into a fresh build directory, which is then published by
+        atomically replacing the ``current`` symlink. Readers resolve the link
+        once, so they load every file from a single build. The build the link
+        pointed to before is then removed; processes that already mapped it keep
+        their mappings, and a reader caught between resolving the link and
+        opening the files gets a cache miss. When two processes save at once the
+        last swap wins, and the losing build may be left behind.
+
+        Args:
+            cache_dir: Directory to write the cache files to (created if missing).
+        """
+        if not self._loaded or self._trie is None:
+            raise RuntimeError("Catalog not loaded, nothing to cache")
+
+        root = Path(cache_dir)
+        root.mkdir(parents=True, exist_ok=True)
+        directory = Path(tempfile.mkdtemp(prefix=CATALOG_CACHE_BUILD_PREFIX, dir=root))
+        try:
+            # mkdtemp creates the directory owner-only; other users' workers may read the cache
+            directory.chmod(0o755)
+            self._trie.save(str(directory / CATALOG_CACHE_TRIE))
+            columns = [self._ids, self._brand_counts, self._brand_ids, self._brand_offsets]
+            for (name, typecode), column in zip(CATALOG_CACHE_COLUMNS.items(), columns, strict=True):
+                (directory / name).write_bytes(array(typecode, column).tobytes())
+            for attribute, stem in CATALOG_CACHE_STRINGS.items():
+                _write_strings(directory, stem, getattr(self, attribute))
+            meta = {"version": CATALOG_CACHE_VERSION, "built_at": time.time(), "brand_names": self._brand_names}
+            (directory / CATALOG_CACHE_META).write_text(json.dumps(meta))
+
+            link = root / CATALOG_CACHE_CURRENT
+            previous = link.resolve() if link.is_symlink() else None
+            staged_link = root / f"{CATALOG_CACHE_CURRENT}.{os.getpid()}.tmp"
+            staged_link.unlink(missing_ok=True)
+            staged_link.symlink_to(directory.name)
+            os.replace(staged_link, link)
+        except BaseException:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+
+        if previous is not None and previous != directory:
+            shutil.rmtree(previous, ignore_errors=True)
+        logger.info(f"Saved {self._entry_count:,} catalog songs to cache in {directory}")
+
+    def _load_entries(self, entries: "Iterable[CatalogEntry | SongResult]") -> None:
+        """Build the columns, trie, short-key cache and Bloom filter from catalog rows.
+
+        Later rows with the same normalized key replace earlier ones.
+        """
+        rows = list(entries)
+        norm_artists, norm_titles = _normalize_columns([e.artist for e in rows], [e.title for e in rows])
+        ids = array("q")
+        brand_counts = array("H")
+        brand_ids = array("H")
+        brand_offsets = array("I", [0])
+        key_to_index: dict[str, int] = {}
+        for index, (entry, norm_artist, norm_title) in enumerate(zip(rows, norm_artists, norm_titles, strict=True)):
+            ids.append(entry.id)
+            brand_counts.append(entry.brand_count)
+            self._artists.append(entry.artist)
+            self._titles.append(entry.title)
+            brand_ids.extend(self._encode_brands(entry.brands))
+            brand_offsets.append(len(brand_ids))
+            key_to_index[f"{norm_artist}{KEY_SEPARATOR}{norm_title}"] = index
+
+        self._ids, self._brand_counts = ids, brand_counts
+        self._brand_ids, self._brand_offsets = brand_ids, brand_offsets
+        self._trie = marisa_trie.RecordTrie("<I", ((key, (index,)) for key, index in key_to_index.items()))
+        self._build_key_indexes(key_to_index)
+
+        # The build pass filled the caches with catalog strings; start matching fresh
+        _clear_normalize_caches()
+
+    def _build_key_indexes(self, key_to_index: dict[str, int]) -> None:
+        """Build the short-key cache and Bloom filter for the trie's keys."""
+        for key, index in key_to_index.items():
+            if len(key) <= SHORT_KEY_MAX_LENGTH:
+                self._short_lookup[key] = index
+
+        self._bloom = rbloom.Bloom(max(len(key_to_index), 1), BLOOM_ERROR_RATE)
+        self._bloom.update(key_to_index)
+        self._entry_count = len(key_to_index)
+        self._loaded = True
+
     def match(self, artist: str, title: str) -> CatalogEntry | None:
         """Look up a track in the catalog.
 
+        Tries an exact normalized match first, then falls back to the closest
+        title by the same artist within FUZZY_MAX_DISTANCE edits.
+
         Args:
             artist: Track artist name.
             title: Track title.
@@ -163,14 +546,123 @@ class CatalogLookup:
             logger.warning("Catalog not loaded, returning None")
             return None
 
-        key = self._make_key(artist, title)
-        return self._lookup.get(key)
+        # One memoized call on the raw pair covers the (common) exact path
+        entry = self._get(self._make_key(artist, title))
+        if entry is not None:
+            return entry
+
+        return self._fuzzy_match(_normalize_artist(artist), _normalize_title(title))
+
+    def prefix_match(self, prefix: str, limit: int = 10) -> list[CatalogEntry]:
+        """Find catalog entries whose normalized "artist title" starts with prefix.
 
-    def _make_key(self, artist: str, title: str) -> str:
+        Args:
+            prefix: Artist name, optionally followed by the start of a title.
+            limit: Maximum number of entries to return.
+
+        Returns:
+            Matching entries in key order, at most ``limit`` of them.
+        """
+        if not self._loaded or self._trie is None or limit <= 0:
+            return []
+
+        norm_prefix = _normalize_text(prefix)
+        if not norm_prefix:
+            return []
+
+        # Try the prefix as "artist" first, then as "artist title" split at each space
+        candidates = [norm_prefix]
+        for i, char in enumerate(norm_prefix):
+            if char == " ":
+                candidates.append(f"{norm_prefix[:i]}{KEY_SEPARATOR}{norm_prefix[i + 1 :]}")
+
+        results: list[CatalogEntry] = []
+        seen: set[int] = set()
+        for candidate in candidates:
+            for key in self._trie.iterkeys(candidate):
+                index: int = self._trie[key][0][0]
+                if index in seen:
+                    continue
+                seen.add(index)
+                results.append(self._entry_at(index))
+                if len(results) >= limit:
+                    return results
+        return results
+
+    def _encode_brands(self, brands: str) -> list[int]:
+        """Map a comma-separated brands string to brand-table IDs, adding new names."""
+        ids = []
+        for name in brands.split(","):
+            brand_id = self._brand_table.get(name)
+            if brand_id is None:
+                brand_id = len(self._brand_names)
+                self._brand_table[name] = brand_id
+                self._brand_names.append(name)
+            ids.append(brand_id)
+        return ids
+
+    def _brands_at(self, index: int) -> str:
+        """Rebuild the comma-separated brands string stored at a row index."""
+        names = self._brand_names
+        start, end = self._brand_offsets[index], self._brand_offsets[index + 1]
+        return ",".join([names[brand_id] for brand_id in self._brand_ids[start:end]])
+
+    def _entry_at(self, index: int) -> CatalogEntry:
+        """Materialize the CatalogEntry stored at a row index."""
+        return CatalogEntry(
+            id=self._ids[index],
+            artist=self._artists[index],
+            title=self._titles[index],
+            brands=self._brands_at(index),
+            brand_count=self._brand_counts[index],
+        )
+
+    def _get(self, key: str) -> CatalogEntry | None:
+        """Exact key lookup, using the flat dict for short keys."""
+        if len(key) <= SHORT_KEY_MAX_LENGTH:
+            index = self._short_lookup.get(key)
+            return self._entry_at(index) if index is not None else None
+        # Most lookups during sync miss; the Bloom filter rejects them far faster than a trie walk
+        if self._trie is None or self._bloom is None or key not in self._bloom:
+            return None
+        records: list[tuple[int]] | None = self._trie.get(key)
+        if not records:
+            return None
+        return self._entry_at(records[0][0])
+
+    def _fuzzy_match(self, norm_artist: str, norm_title: str) -> CatalogEntry | None:
+        """Find the closest title by the same artist within FUZZY_MAX_DISTANCE edits."""
+        if len(norm_title) < FUZZY_MIN_TITLE_LENGTH or self._trie is None:
+            return None
+
+        # The artist's titles are the trie keys under "artist<US>"; no separate per-artist index
+        prefix = f"{norm_artist}{KEY_SEPARATOR}"
+        titles = {key[len(prefix) :]: record[0] for key, record in self._trie.iteritems(prefix)}
+        if not titles:
+            return None
+
+        if _HAS_RAPIDFUZZ:
+            best = process.extractOne(
+                norm_title,
+                titles.keys(),
+                scorer=Levenshtein.distance,
+                score_cutoff=FUZZY_MAX_DISTANCE,
+            )
+            return self._entry_at(titles[best[0]]) if best is not None else None
+
+        best_index: int | None = None
+        best_dist = FUZZY_MAX_DISTANCE + 1
+        for candidate, index in titles.items():
+            dist = _bounded_levenshtein(norm_title, candidate)
+            if dist < best_dist:
+                best_index, best_dist = index, dist
+        return self._entry_at(best_index) if best_index is not None else None
+
+    @staticmethod
+    @lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+    def _make_key(artist: str, title: str) -> str:
         """Create normalized lookup key from artist and title."""
-        norm_artist = _normalize_artist(artist)
-        norm_title = _normalize_title(title)
-        return f"{norm_artist}:{norm_title}"
+        return f"{_normalize_artist(artist)}{KEY_SEPARATOR}{_normalize_title(title)}"
 
 
 # Global singleton instance
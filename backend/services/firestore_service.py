@@ -1,11 +1,27 @@
 """Firestore database service."""
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from google.cloud import firestore
 
 from backend.config import BackendSettings
 
+# One AsyncClient (and so one gRPC channel) per (project, database) for the whole
+# process. get_firestore builds a FirestoreService per request, and a fresh client
+# each time would repeat the channel setup and TLS handshake.
+_shared_clients: dict[tuple[str, str], firestore.AsyncClient] = {}
+
+
+def _get_shared_client(project: str, database: str) -> firestore.AsyncClient:
+    """Get or create the process-wide Firestore client for a project/database."""
+    key = (project, database)
+    client = _shared_clients.get(key)
+    if client is None:
+        client = firestore.AsyncClient(project=project, database=database)
+        _shared_clients[key] = client
+    return client
+
 
 class FirestoreService:
     """Service for Firestore database operations."""
@@ -16,11 +32,11 @@ class FirestoreService:
 
     @property
     def client(self) -> firestore.AsyncClient:
-        """Get or create Firestore client."""
+        """Get the shared Firestore client."""
         if self._client is None:
-            self._client = firestore.AsyncClient(
-                project=self.settings.google_cloud_project,
-                database=self.settings.firestore_database,
+            self._client = _get_shared_client(
+                self.settings.google_cloud_project,
+                self.settings.firestore_database,
             )
         return self._client
 
@@ -37,6 +53,22 @@ class FirestoreService:
             return {"id": doc.id, **data}
         return None
 
+    async def get_documents(self, collection: str, doc_ids: list[str]) -> list[dict[str, Any]]:
+        """Get several documents by ID in one batched read.
+
+        Missing documents are skipped, and results are not guaranteed to be in
+        the order of ``doc_ids``.
+        """
+        if not doc_ids:
+            return []
+        col = self.collection(collection)
+        refs = [col.document(doc_id) for doc_id in doc_ids]
+        docs = []
+        async for doc in self.client.get_all(refs):
+            if doc.exists:
+                docs.append({"id": doc.id, **(doc.to_dict() or {})})
+        return docs
+
     async def set_document(
         self,
         collection: str,
@@ -58,7 +90,7 @@ class FirestoreService:
         doc_ref = self.collection(collection).document(doc_id)
         await doc_ref.delete()
 
-    async def query_documents(
+    async def iter_documents(
         self,
         collection: str,
         filters: list[tuple[str, str, Any]] | None = None,
@@ -66,19 +98,14 @@ class FirestoreService:
         order_direction: str = "ASCENDING",
         limit: int | None = None,
         offset: int | None = None,
-    ) -> list[dict[str, Any]]:
-        """Query documents with filters.
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream documents matching a query one at a time.
 
-        Args:
-            collection: Collection name
-            filters: List of (field, operator, value) tuples
-            order_by: Field to order by
-            order_direction: ASCENDING or DESCENDING
-            limit: Max documents to return
-            offset: Number of documents to skip
+        Takes the same arguments as query_documents, but yields each document as
+        Firestore delivers it instead of collecting the whole result set first.
 
-        Returns:
-            List of document dictionaries with IDs
+        Yields:
+            Document dictionaries with IDs
         """
         query: firestore.AsyncCollectionReference | firestore.AsyncQuery = self.collection(collection)
 
@@ -96,12 +123,42 @@ class FirestoreService:
         if limit:
             query = query.limit(limit)
 
-        docs = []
         async for doc in query.stream():
-            data = doc.to_dict() or {}
-            docs.append({"id": doc.id, **data})
+            yield {"id": doc.id, **(doc.to_dict() or {})}
 
-        return docs
+    async def query_documents(
+        self,
+        collection: str,
+        filters: list[tuple[str, str, Any]] | None = None,
+        order_by: str | None = None,
+        order_direction: str = "ASCENDING",
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query documents with filters.
+
+        Args:
+            collection: Collection name
+            filters: List of (field, operator, value) tuples
+            order_by: Field to order by
+            order_direction: ASCENDING or DESCENDING
+            limit: Max documents to return
+            offset: Number of documents to skip
+
+        Returns:
+            List of document dictionaries with IDs
+        """
+        return [
+            doc
+            async for doc in self.iter_documents(
+                collection,
+                filters=filters,
+                order_by=order_by,
+                order_direction=order_direction,
+                limit=limit,
+                offset=offset,
+            )
+        ]
 
     async def count_documents(
         self,
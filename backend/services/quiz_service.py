@@ -1306,6 +1306,12 @@ class QuizService:
             for row in results
         ]
 
+    async def _existing_user_song_ids(self, user_id: str, song_ids: list[str]) -> set[str]:
+        """Return the UserSong IDs that already exist for these songs, in one batched read."""
+        user_song_ids = list(dict.fromkeys(f"{user_id}:{song_id}" for song_id in song_ids))
+        docs = await self.firestore.get_documents(self.USER_SONGS_COLLECTION, user_song_ids)
+        return {doc["id"] for doc in docs}
+
     async def submit_quiz(
         self,
         user_id: str,
@@ -1346,6 +1352,7 @@ class QuizService:
         songs_added = 0
         known_song_ids = known_song_ids or []
         known_artists = known_artists or []
+        existing_ids: set[str] = set()
 
         # If artist_affinities is provided, merge with known_artists for backward compat
         # Artist affinities takes precedence (new format with affinity levels)
@@ -1361,13 +1368,12 @@ class QuizService:
         # If artists were selected, get their top songs
         if known_artists:
             artist_songs = self._get_songs_by_artists(known_artists, limit_per_artist=5)
+            existing_ids |= await self._existing_user_song_ids(user_id, [song["id"] for song in artist_songs])
             for song in artist_songs:
                 user_song_id = f"{user_id}:{song['id']}"
 
                 # Check if already exists
-                existing = await self.firestore.get_document(self.USER_SONGS_COLLECTION, user_song_id)
-
-                if existing is None:
+                if user_song_id not in existing_ids:
                     user_song_data = {
                         "id": user_song_id,
                         "user_id": user_id,
@@ -1391,17 +1397,17 @@ class QuizService:
                         user_song_data,
                     )
                     songs_added += 1
+                    existing_ids.add(user_song_id)
 
         # Also handle direct song selections (legacy support)
         if known_song_ids:
             song_details = self._get_songs_by_ids(known_song_ids)
 
+            existing_ids |= await self._existing_user_song_ids(user_id, [song["id"] for song in song_details])
             for song in song_details:
                 user_song_id = f"{user_id}:{song['id']}"
 
-                existing = await self.firestore.get_document(self.USER_SONGS_COLLECTION, user_song_id)
-
-                if existing is None:
+                if user_song_id not in existing_ids:
                     user_song_data = {
                         "id": user_song_id,
                         "user_id": user_id,
@@ -1425,6 +1431,7 @@ class QuizService:
                         user_song_data,
                     )
                     songs_added += 1
+                    existing_ids.add(user_song_id)
 
         # Update user profile with quiz data
         await self._update_user_quiz_data(
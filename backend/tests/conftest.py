@@ -1,12 +1,19 @@
 """Shared test fixtures for backend tests."""
 
+import importlib
 import sys
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from copy import deepcopy
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import Response
+from pytest_asyncio import is_async_test
 
 # Mock google.cloud.tasks_v2 before any imports that need it
 _mock_tasks_v2 = MagicMock()
@@ -15,12 +22,76 @@ sys.modules["google.cloud.tasks_v2"] = _mock_tasks_v2
 
 import backend.api.deps  # noqa: E402, F401
 import backend.api.routes.catalog  # noqa: E402, F401
+from backend.api.deps import get_firestore  # noqa: E402
+from backend.api.routes.catalog import clear_popular_cache  # noqa: E402
 from backend.config import BackendSettings  # noqa: E402
+from backend.services.auth_service import AuthService  # noqa: E402
 from backend.services.playlist_service import PlaylistInfo  # noqa: E402
 from backend.services.quiz_service import QuizStatus, QuizSubmitResult  # noqa: E402
 from karaoke_decide.core.models import QuizSong, Recommendation, User, UserSong  # noqa: E402
 
 
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every collected async test on one session-scoped event loop.
+
+    Auto mode marks async tests implicitly; re-marking them with a session loop
+    scope avoids creating and closing a fresh loop for each test.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def app_instance() -> FastAPI:
+    """Import the FastAPI app once per test session.
+
+    Clients are built without entering ``with TestClient(...)``, so the lifespan
+    catalog warm-up never runs in tests.
+    """
+    app: FastAPI = importlib.import_module("backend.main").app
+    return app
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_app(app_instance: FastAPI) -> None:
+    """Serve one request per session so the first test doesn't pay the app's cold start.
+
+    /api/health has no dependencies to mock, and the client is not entered as a
+    context manager, so the lifespan catalog load still never runs.
+    """
+    TestClient(app_instance).get("/api/health")
+
+
+DependencyOverrides = dict[Callable[..., Any], Callable[..., Any]]
+
+
+@pytest.fixture(scope="session")
+def override_deps(app_instance: FastAPI) -> Callable[[DependencyOverrides], AbstractContextManager[None]]:
+    """Context manager factory that overrides app dependencies for its duration.
+
+    Only the given keys are touched: their previous overrides (or absence) are
+    restored on exit, even if the body raises, so overrides installed by other
+    fixtures survive.
+    """
+
+    @contextmanager
+    def _override(overrides: DependencyOverrides) -> Iterator[None]:
+        saved = {dep: app_instance.dependency_overrides.get(dep) for dep in overrides}
+        app_instance.dependency_overrides.update(overrides)
+        try:
+            yield
+        finally:
+            for dep, previous in saved.items():
+                if previous is None:
+                    app_instance.dependency_overrides.pop(dep, None)
+                else:
+                    app_instance.dependency_overrides[dep] = previous
+
+    return _override
+
+
 @pytest.fixture
 def mock_backend_settings() -> BackendSettings:
     """Create mock backend settings for testing."""
@@ -80,26 +151,35 @@ def mock_email_service() -> MagicMock:
     return mock
 
 
+@pytest.fixture(scope="session")
+def shared_auth_service_mock() -> MagicMock:
+    """Autospec'd AuthService mock, built once per session since autospec is slow."""
+    mock: MagicMock = create_autospec(AuthService, instance=True)
+    return mock
+
+
 @pytest.fixture
 def mock_auth_service(
+    shared_auth_service_mock: MagicMock,
     sample_user: User,
     mock_firestore_service: MagicMock,
     mock_email_service: MagicMock,
 ) -> MagicMock:
-    """Create a mock auth service for API tests."""
-    mock = MagicMock()
+    """Mock auth service for API tests, cleared of the last test's calls and effects."""
+    mock = shared_auth_service_mock
+    mock.reset_mock(return_value=True, side_effect=True)
 
     # Mock send_magic_link
-    mock.send_magic_link = AsyncMock(return_value=True)
+    mock.send_magic_link.return_value = True
 
     # Mock verify_magic_link
-    mock.verify_magic_link = AsyncMock(return_value="test@example.com")
+    mock.verify_magic_link.return_value = "test@example.com"
 
     # Mock get_or_create_user
-    mock.get_or_create_user = AsyncMock(return_value=sample_user)
+    mock.get_or_create_user.return_value = sample_user
 
     # Mock get_user_by_id
-    mock.get_user_by_id = AsyncMock(return_value=sample_user)
+    mock.get_user_by_id.return_value = sample_user
 
     # Mock generate_jwt
     mock.generate_jwt.return_value = ("test-jwt-token", 86400)
@@ -113,20 +193,20 @@ def mock_auth_service(
     }
 
     # Mock update_user_profile
-    mock.update_user_profile = AsyncMock(return_value=sample_user)
+    mock.update_user_profile.return_value = sample_user
 
     # Mock firestore service (needed for verify endpoint to check guest upgrade)
     mock.firestore = mock_firestore_service
     mock.MAGIC_LINKS_COLLECTION = "magic_links"
 
     # Mock upgrade_guest_to_verified
-    mock.upgrade_guest_to_verified = AsyncMock(return_value=sample_user)
+    mock.upgrade_guest_to_verified.return_value = sample_user
 
     # Mock create_guest_user
-    mock.create_guest_user = AsyncMock(return_value=sample_user)
+    mock.create_guest_user.return_value = sample_user
 
     # Mock generate_guest_jwt
-    mock.generate_guest_jwt = MagicMock(return_value=("test-guest-jwt-token", 2592000))
+    mock.generate_guest_jwt.return_value = ("test-guest-jwt-token", 2592000)
 
     return mock
 
@@ -197,6 +277,9 @@ def mock_catalog_service(sample_catalog_rows: list[MagicMock]) -> MagicMock:
 
     mock_service.get_song_by_id.side_effect = get_song_by_id
 
+    # Mock count_matching_songs
+    mock_service.count_matching_songs.return_value = 1234
+
     # Mock get_stats
     mock_service.get_stats.return_value = {
         "total_songs": 275809,
@@ -209,22 +292,29 @@ def mock_catalog_service(sample_catalog_rows: list[MagicMock]) -> MagicMock:
 
 
 @pytest.fixture
-def client(mock_catalog_service: MagicMock) -> Generator[TestClient, None, None]:
-    """Create test client with mocked catalog service."""
-    with patch(
-        "backend.api.routes.catalog.get_catalog_service",
-        return_value=mock_catalog_service,
+def client(
+    mock_catalog_service: MagicMock,
+    mock_firestore_service: MagicMock,
+    app_instance: FastAPI,
+    override_deps: Callable[[DependencyOverrides], AbstractContextManager[None]],
+) -> Generator[TestClient, None, None]:
+    """Create test client with mocked catalog and Firestore services."""
+    clear_popular_cache()
+    with (
+        override_deps({get_firestore: lambda: mock_firestore_service}),
+        patch(
+            "backend.api.routes.catalog.get_catalog_service",
+            return_value=mock_catalog_service,
+        ),
     ):
-        # Import app inside the patch context
-        from backend.main import app
-
-        yield TestClient(app)
+        yield TestClient(app_instance)
 
 
 @pytest.fixture
 def auth_client(
     mock_catalog_service: MagicMock,
     mock_auth_service: MagicMock,
+    app_instance: FastAPI,
 ) -> Generator[TestClient, None, None]:
     """Create test client with mocked auth and catalog services."""
     with (
@@ -237,10 +327,30 @@ def auth_client(
             return_value=mock_auth_service,
         ),
     ):
-        # Import app inside the patch context
-        from backend.main import app
+        yield TestClient(app_instance)
 
-        yield TestClient(app)
+
+@pytest.fixture
+def make_auth_failure_case(
+    auth_client: TestClient,
+    mock_auth_service: MagicMock,
+) -> Callable[..., Response]:
+    """Build auth-failure requests against the shared auth client.
+
+    Configures ``mock_auth_service.<attr>`` with ``effect`` (raised if it is an
+    exception, returned otherwise) and issues the request, so failure-path tests
+    don't need to rebuild the patched client themselves.
+    """
+
+    def _make(attr: str, effect: Any, url: str, method: str = "get", **request_kwargs: Any) -> Response:
+        mocked = getattr(mock_auth_service, attr)
+        if isinstance(effect, BaseException):
+            mocked.side_effect = effect
+        else:
+            mocked.return_value = effect
+        return auth_client.request(method.upper(), url, **request_kwargs)
+
+    return _make
 
 
 @pytest.fixture
@@ -363,6 +473,7 @@ def quiz_client(
     mock_catalog_service: MagicMock,
     mock_auth_service: MagicMock,
     mock_quiz_service: MagicMock,
+    app_instance: FastAPI,
 ) -> Generator[TestClient, None, None]:
     """Create test client with mocked quiz service."""
     with (
@@ -379,9 +490,7 @@ def quiz_client(
             return_value=mock_quiz_service,
         ),
     ):
-        from backend.main import app
-
-        yield TestClient(app)
+        yield TestClient(app_instance)
 
 
 @pytest.fixture
@@ -389,6 +498,7 @@ def recommendations_client(
     mock_catalog_service: MagicMock,
     mock_auth_service: MagicMock,
     mock_recommendation_service: MagicMock,
+    app_instance: FastAPI,
 ) -> Generator[TestClient, None, None]:
     """Create test client with mocked recommendation service."""
     with (
@@ -405,9 +515,7 @@ def recommendations_client(
             return_value=mock_recommendation_service,
         ),
     ):
-        from backend.main import app
-
-        yield TestClient(app)
+        yield TestClient(app_instance)
 
 
 @pytest.fixture
@@ -456,6 +564,7 @@ def playlist_client(
     mock_catalog_service: MagicMock,
     mock_auth_service: MagicMock,
     mock_playlist_service: MagicMock,
+    app_instance: FastAPI,
 ) -> Generator[TestClient, None, None]:
     """Create test client with mocked playlist service."""
     with (
@@ -472,122 +581,131 @@ def playlist_client(
             return_value=mock_playlist_service,
         ),
     ):
-        from backend.main import app
-
-        yield TestClient(app)
+        yield TestClient(app_instance)
+
+
+USER_DATA_SERVICE_RETURNS: dict[str, Any] = {
+    "get_data_summary": {
+        "services": {
+            "spotify": {
+                "connected": True,
+                "username": "testuser",
+                "tracks_synced": 50,
+                "songs_synced": 200,
+                "artists_synced": 5,
+            },
+            "lastfm": {"connected": False, "artists_synced": 0},
+        },
+        "artists": {"total": 10, "by_source": {"spotify": 5, "lastfm": 3, "quiz": 2, "manual": 0}},
+        "songs": {"total": 100, "with_karaoke": 80, "known_songs": 5},
+        "preferences": {"completed": True, "decade": "1990s", "energy": "high", "genres": ["rock"]},
+    },
+    "get_preferences": {
+        "decade_preference": "1990s",
+        "energy_preference": "high",
+        "genres": ["rock", "pop"],
+    },
+    "update_preferences": {
+        "decade_preference": "2000s",
+        "energy_preference": "medium",
+        "genres": ["electronic"],
+    },
+    "get_all_artists": {
+        "artists": [
+            {
+                "artist_name": "Queen",
+                "sources": ["spotify"],
+                "spotify_rank": 1,
+                "spotify_time_range": "medium_term",
+                "lastfm_rank": None,
+                "lastfm_playcount": None,
+                "popularity": 80,
+                "genres": ["rock"],
+                "is_excluded": False,
+                "is_manual": False,
+            },
+            {
+                "artist_name": "The Beatles",
+                "sources": ["quiz"],
+                "spotify_rank": None,
+                "spotify_time_range": None,
+                "lastfm_rank": None,
+                "lastfm_playcount": None,
+                "popularity": None,
+                "genres": [],
+                "is_excluded": False,
+                "is_manual": True,
+            },
+        ],
+        "total": 2,
+        "page": 1,
+        "per_page": 100,
+        "has_more": False,
+    },
+    "add_artist": {
+        "artists": ["Queen", "New Artist"],
+        "added": "New Artist",
+    },
+    "remove_artist": {
+        "removed": "Queen",
+        "removed_from": ["quiz"],
+        "success": True,
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def shared_user_data_service_mock() -> MagicMock:
+    """User data service mock, built once per module."""
+    mock = MagicMock()
+    for name in USER_DATA_SERVICE_RETURNS:
+        setattr(mock, name, AsyncMock())
+    return mock
 
 
 @pytest.fixture
-def mock_user_data_service() -> MagicMock:
-    """Mock user data service for API tests."""
-    mock = MagicMock()
-    mock.get_data_summary = AsyncMock(
-        return_value={
-            "services": {
-                "spotify": {
-                    "connected": True,
-                    "username": "testuser",
-                    "tracks_synced": 50,
-                    "songs_synced": 200,
-                    "artists_synced": 5,
-                },
-                "lastfm": {"connected": False, "artists_synced": 0},
-            },
-            "artists": {"total": 10, "by_source": {"spotify": 5, "lastfm": 3, "quiz": 2, "manual": 0}},
-            "songs": {"total": 100, "with_karaoke": 80, "known_songs": 5},
-            "preferences": {"completed": True, "decade": "1990s", "energy": "high", "genres": ["rock"]},
-        }
-    )
-    mock.get_preferences = AsyncMock(
-        return_value={
-            "decade_preference": "1990s",
-            "energy_preference": "high",
-            "genres": ["rock", "pop"],
-        }
-    )
-    mock.update_preferences = AsyncMock(
-        return_value={
-            "decade_preference": "2000s",
-            "energy_preference": "medium",
-            "genres": ["electronic"],
-        }
-    )
-    mock.get_all_artists = AsyncMock(
-        return_value={
-            "artists": [
-                {
-                    "artist_name": "Queen",
-                    "sources": ["spotify"],
-                    "spotify_rank": 1,
-                    "spotify_time_range": "medium_term",
-                    "lastfm_rank": None,
-                    "lastfm_playcount": None,
-                    "popularity": 80,
-                    "genres": ["rock"],
-                    "is_excluded": False,
-                    "is_manual": False,
-                },
-                {
-                    "artist_name": "The Beatles",
-                    "sources": ["quiz"],
-                    "spotify_rank": None,
-                    "spotify_time_range": None,
-                    "lastfm_rank": None,
-                    "lastfm_playcount": None,
-                    "popularity": None,
-                    "genres": [],
-                    "is_excluded": False,
-                    "is_manual": True,
-                },
-            ],
-            "total": 2,
-            "page": 1,
-            "per_page": 100,
-            "has_more": False,
-        }
-    )
-    mock.add_artist = AsyncMock(
-        return_value={
-            "artists": ["Queen", "New Artist"],
-            "added": "New Artist",
-        }
-    )
-    mock.remove_artist = AsyncMock(
-        return_value={
-            "removed": "Queen",
-            "removed_from": ["quiz"],
-            "success": True,
-        }
-    )
+def mock_user_data_service(shared_user_data_service_mock: MagicMock) -> MagicMock:
+    """Mock user data service for API tests, cleared of the last test's calls and effects."""
+    mock = shared_user_data_service_mock
+    mock.reset_mock(return_value=True, side_effect=True)
+    for name, value in USER_DATA_SERVICE_RETURNS.items():
+        getattr(mock, name).return_value = deepcopy(value)
     return mock
 
 
+@pytest.fixture(scope="module")
+def my_data_http(
+    shared_user_data_service_mock: MagicMock,
+    shared_auth_service_mock: MagicMock,
+    override_deps: Callable[[DependencyOverrides], AbstractContextManager[None]],
+    app_instance: FastAPI,
+) -> Generator[TestClient, None, None]:
+    """Test client serving the shared user data and auth mocks, built once per module."""
+
+    async def get_user_data_service_override() -> MagicMock:
+        return shared_user_data_service_mock
+
+    async def get_auth_service_override() -> MagicMock:
+        return shared_auth_service_mock
+
+    with override_deps(
+        {
+            backend.api.deps.get_user_data_service_dep: get_user_data_service_override,
+            backend.api.deps.get_auth_service_dep: get_auth_service_override,
+        }
+    ):
+        yield TestClient(app_instance)
+
+
 @pytest.fixture
 def my_data_client(
-    mock_catalog_service: MagicMock,
+    my_data_http: TestClient,
     mock_auth_service: MagicMock,
     mock_user_data_service: MagicMock,
-) -> Generator[TestClient, None, None]:
-    """Create test client with mocked user data service."""
-    mock_bigquery_catalog = MagicMock()
-    with (
-        patch(
-            "backend.api.routes.catalog.get_catalog_service",
-            return_value=mock_catalog_service,
-        ),
-        patch(
-            "backend.api.deps.get_auth_service",
-            return_value=mock_auth_service,
-        ),
-        patch(
-            "backend.api.deps.get_user_data_service",
-            return_value=mock_user_data_service,
-        ),
-        patch(
-            "backend.api.deps.get_bigquery_catalog",
-            return_value=mock_bigquery_catalog,
-        ),
-    ):
-        from backend.main import app
+) -> TestClient:
+    """The shared my data client.
 
-        yield TestClient(app)
+    Requesting the mock fixtures resets the shared auth and user data mocks to
+    their defaults, so per-test overrides never leak into the next test.
+    """
+    return my_data_http
@@ -1,13 +1,16 @@
 """Tests for admin routes."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager
 from datetime import UTC, datetime
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from backend.api.deps import get_admin_user, get_auth_service_dep, get_current_user, get_firestore
 from backend.services.auth_service import AuthService
 from karaoke_decide.core.models import User
 
@@ -66,10 +69,10 @@ def sample_target_user() -> User:
 @pytest.fixture
 def mock_auth_service(sample_target_user: User) -> MagicMock:
     """Create a mock auth service for impersonation testing."""
-    mock = MagicMock(spec=AuthService)
-    mock.get_user_by_id = AsyncMock(return_value=sample_target_user)
-    mock.generate_jwt = MagicMock(return_value=("test-token-123", 604800))
-    mock.generate_guest_jwt = MagicMock(return_value=("guest-token-123", 2592000))
+    mock: MagicMock = create_autospec(AuthService, instance=True)
+    mock.get_user_by_id.return_value = sample_target_user
+    mock.generate_jwt.return_value = ("test-token-123", 604800)
+    mock.generate_guest_jwt.return_value = ("guest-token-123", 2592000)
     return mock
 
 
@@ -88,27 +91,25 @@ def admin_client(
     mock_admin_firestore_service: MagicMock,
     sample_admin_user: User,
     mock_catalog_service: MagicMock,
+    app_instance: FastAPI,
+    override_deps: Callable[..., AbstractContextManager[None]],
 ) -> Generator[TestClient, None, None]:
     """Create test client with admin user."""
-    with patch(
-        "backend.api.routes.catalog.get_catalog_service",
-        return_value=mock_catalog_service,
-    ):
-        from backend.api.deps import get_current_user, get_firestore
-        from backend.main import app
-
-        async def override_get_current_user() -> User:
-            return sample_admin_user
-
-        async def override_get_firestore() -> MagicMock:
-            return mock_admin_firestore_service
 
-        app.dependency_overrides[get_current_user] = override_get_current_user
-        app.dependency_overrides[get_firestore] = override_get_firestore
+    async def override_get_current_user() -> User:
+        return sample_admin_user
 
-        yield TestClient(app)
+    async def override_get_firestore() -> MagicMock:
+        return mock_admin_firestore_service
 
-        app.dependency_overrides.clear()
+    with (
+        patch(
+            "backend.api.routes.catalog.get_catalog_service",
+            return_value=mock_catalog_service,
+        ),
+        override_deps({get_current_user: override_get_current_user, get_firestore: override_get_firestore}),
+    ):
+        yield TestClient(app_instance)
 
 
 @pytest.fixture
@@ -116,27 +117,25 @@ def non_admin_client(
     mock_admin_firestore_service: MagicMock,
     sample_non_admin_user: User,
     mock_catalog_service: MagicMock,
+    app_instance: FastAPI,
+    override_deps: Callable[..., AbstractContextManager[None]],
 ) -> Generator[TestClient, None, None]:
     """Create test client with non-admin user."""
-    with patch(
-        "backend.api.routes.catalog.get_catalog_service",
-        return_value=mock_catalog_service,
-    ):
-        from backend.api.deps import get_current_user, get_firestore
-        from backend.main import app
-
-        async def override_get_current_user() -> User:
-            return sample_non_admin_user
-
-        async def override_get_firestore() -> MagicMock:
-            return mock_admin_firestore_service
 
-        app.dependency_overrides[get_current_user] = override_get_current_user
-        app.dependency_overrides[get_firestore] = override_get_firestore
+    async def override_get_current_user() -> User:
+        return sample_non_admin_user
 
-        yield TestClient(app)
+    async def override_get_firestore() -> MagicMock:
+        return mock_admin_firestore_service
 
-        app.dependency_overrides.clear()
+    with (
+        patch(
+            "backend.api.routes.catalog.get_catalog_service",
+            return_value=mock_catalog_service,
+        ),
+        override_deps({get_current_user: override_get_current_user, get_firestore: override_get_firestore}),
+    ):
+        yield TestClient(app_instance)
 
 
 class TestAdminAuthorization:
@@ -692,32 +691,18 @@ class TestAdminImpersonate:
         mock_admin_firestore_service: MagicMock,
         mock_auth_service: MagicMock,
         sample_admin_user: User,
-        mock_catalog_service: MagicMock,
+        app_instance: FastAPI,
+        override_deps: Callable[..., AbstractContextManager[None]],
     ) -> Generator[TestClient, None, None]:
         """Create test client with admin user and auth service mock."""
-        with patch(
-            "backend.api.routes.catalog.get_catalog_service",
-            return_value=mock_catalog_service,
+        with override_deps(
+            {
+                get_admin_user: lambda: sample_admin_user,
+                get_firestore: lambda: mock_admin_firestore_service,
+                get_auth_service_dep: lambda: mock_auth_service,
+            }
         ):
-            from backend.api.deps import get_auth_service_dep, get_current_user, get_firestore
-            from backend.main import app
-
-            async def override_get_current_user() -> User:
-                return sample_admin_user
-
-            async def override_get_firestore() -> MagicMock:
-                return mock_admin_firestore_service
-
-            async def override_get_auth_service() -> MagicMock:
-                return mock_auth_service
-
-            app.dependency_overrides[get_current_user] = override_get_current_user
-            app.dependency_overrides[get_firestore] = override_get_firestore
-            app.dependency_overrides[get_auth_service_dep] = override_get_auth_service
-
-            yield TestClient(app)
-
-            app.dependency_overrides.clear()
+            yield TestClient(app_instance)
 
     def test_impersonate_requires_admin(self, non_admin_client: TestClient) -> None:
         """Non-admin users should get 403 for impersonate endpoint."""
@@ -1,10 +1,12 @@
 """Tests for auth API endpoints."""
 
-from collections.abc import Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Callable, Generator
+from unittest.mock import MagicMock, patch
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import Response
 
 from backend.services.auth_service import AuthenticationError
 
@@ -13,6 +15,7 @@ from backend.services.auth_service import AuthenticationError
 def auth_client_with_mocks(
     mock_catalog_service: MagicMock,
     mock_auth_service: MagicMock,
+    app_instance: FastAPI,
 ) -> Generator[TestClient, None, None]:
     """Create test client with mocked auth service."""
     with (
@@ -25,9 +28,7 @@ def auth_client_with_mocks(
             return_value=mock_auth_service,
         ),
     ):
-        from backend.main import app
-
-        yield TestClient(app)
+        yield TestClient(app_instance)
 
 
 class TestRequestMagicLink:
@@ -73,29 +74,16 @@ class TestRequestMagicLink:
 
     def test_email_failure_returns_500(
         self,
-        mock_catalog_service: MagicMock,
-        mock_auth_service: MagicMock,
+        make_auth_failure_case: Callable[..., Response],
     ) -> None:
         """Should return 500 when email fails to send."""
-        mock_auth_service.send_magic_link = AsyncMock(return_value=False)
-
-        with (
-            patch(
-                "backend.api.routes.catalog.get_catalog_service",
-                return_value=mock_catalog_service,
-            ),
-            patch(
-                "backend.api.deps.get_auth_service",
-                return_value=mock_auth_service,
-            ),
-        ):
-            from backend.main import app
-
-            client = TestClient(app)
-            response = client.post(
-                "/api/auth/magic-link",
-                json={"email": "test@example.com"},
-            )
+        response = make_auth_failure_case(
+            "send_magic_link",
+            False,
+            "/api/auth/magic-link",
+            "post",
+            json={"email": "test@example.com"},
+        )
 
         assert response.status_code == 500
 
@@ -121,29 +109,16 @@ class TestVerifyMagicLink:
 
     def test_invalid_token_returns_401(
         self,
-        mock_catalog_service: MagicMock,
-        mock_auth_service: MagicMock,
+        make_auth_failure_case: Callable[..., Response],
     ) -> None:
         """Should return 401 for invalid token."""
-        mock_auth_service.verify_magic_link = AsyncMock(side_effect=AuthenticationError("Invalid or expired token"))
-
-        with (
-            patch(
-                "backend.api.routes.catalog.get_catalog_service",
-                return_value=mock_catalog_service,
-            ),
-            patch(
-                "backend.api.deps.get_auth_service",
-                return_value=mock_auth_service,
-            ),
-        ):
-            from backend.main import app
-
-            client = TestClient(app)
-            response = client.post(
-                "/api/auth/verify",
-                json={"token": "invalid-token"},
-            )
+        response = make_auth_failure_case(
+            "verify_magic_link",
+            AuthenticationError("Invalid or expired token"),
+            "/api/auth/verify",
+            "post",
+            json={"token": "invalid-token"},
+        )
 
         assert response.status_code == 401
         assert "Invalid or expired token" in response.json()["detail"]
@@ -191,29 +166,15 @@ class TestGetCurrentUser:
 
     def test_invalid_token_returns_401(
         self,
-        mock_catalog_service: MagicMock,
-        mock_auth_service: MagicMock,
+        make_auth_failure_case: Callable[..., Response],
     ) -> None:
         """Should return 401 for invalid token."""
-        mock_auth_service.validate_jwt.side_effect = AuthenticationError("Invalid token")
-
-        with (
-            patch(
-                "backend.api.routes.catalog.get_catalog_service",
-                return_value=mock_catalog_service,
-            ),
-            patch(
-                "backend.api.deps.get_auth_service",
-                return_value=mock_auth_service,
-            ),
-        ):
-            from backend.main import app
-
-            client = TestClient(app)
-            response = client.get(
-                "/api/auth/me",
-                headers={"Authorization": "Bearer invalid-token"},
-            )
+        response = make_auth_failure_case(
+            "validate_jwt",
+            AuthenticationError("Invalid token"),
+            "/api/auth/me",
+            headers={"Authorization": "Bearer invalid-token"},
+        )
 
         assert response.status_code == 401
 
@@ -265,30 +226,17 @@ class TestUpdateProfile:
 
     def test_user_not_found_returns_404(
         self,
-        mock_catalog_service: MagicMock,
-        mock_auth_service: MagicMock,
+        make_auth_failure_case: Callable[..., Response],
     ) -> None:
         """Should return 404 if user not found during update."""
-        mock_auth_service.update_user_profile = AsyncMock(return_value=None)
-
-        with (
-            patch(
-                "backend.api.routes.catalog.get_catalog_service",
-                return_value=mock_catalog_service,
-            ),
-            patch(
-                "backend.api.deps.get_auth_service",
-                return_value=mock_auth_service,
-            ),
-        ):
-            from backend.main import app
-
-            client = TestClient(app)
-            response = client.put(
-                "/api/auth/profile",
-                headers={"Authorization": "Bearer valid-token"},
-                json={"display_name": "Test"},
-            )
+        response = make_auth_failure_case(
+            "update_user_profile",
+            None,
+            "/api/auth/profile",
+            "put",
+            headers={"Authorization": "Bearer valid-token"},
+            json={"display_name": "Test"},
+        )
 
         assert response.status_code == 404
 
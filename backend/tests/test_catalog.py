@@ -1,6 +1,20 @@
 """Tests for catalog API endpoints."""
 
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from backend.api.routes import catalog
+from backend.api.routes.catalog import SongResponse, _load_catalog_stats
+from backend.config import BackendSettings
 
 
 class TestSearchCatalog:
@@ -50,7 +64,60 @@ class TestSearchCatalog:
         assert data["page"] == 2
         assert data["per_page"] == 10
         assert "has_more" in data
-        assert "total" in data
+        assert data["total"] is None
+        assert "next_cursor" in data
+
+    def test_search_include_total(self, client: TestClient, mock_catalog_service: MagicMock) -> None:
+        """Test total is only counted when include_total=true."""
+        client.get("/api/catalog/songs?q=love")
+        mock_catalog_service.count_matching_songs.assert_not_called()
+
+        response = client.get("/api/catalog/songs?q=love&min_brands=2&include_total=true")
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1234
+        mock_catalog_service.count_matching_songs.assert_called_once_with(query="love", min_brands=2)
+
+    def test_search_cursor_round_trips(self, client: TestClient, mock_catalog_service: MagicMock) -> None:
+        """Test next_cursor resumes the search after the last returned song."""
+        response = client.get("/api/catalog/songs?q=love&per_page=2")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["has_more"] is True
+        last = data["songs"][-1]
+
+        response = client.get(f"/api/catalog/songs?q=love&per_page=2&cursor={data['next_cursor']}")
+
+        assert response.status_code == 200
+        after = mock_catalog_service.search_songs.call_args.kwargs["after"]
+        assert after == (last["brand_count"], last["id"])
+
+    def test_search_invalid_cursor_returns_400(self, client: TestClient) -> None:
+        """Test a malformed cursor is rejected."""
+        response = client.get("/api/catalog/songs?q=love&cursor=not-a-cursor")
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            pytest.param("", id="popular"),
+            pytest.param("artist=Queen&", id="artist"),
+            pytest.param("q=love&artist=Queen&", id="artist_with_q"),
+        ],
+    )
+    def test_cursor_without_search_returns_400(
+        self, client: TestClient, mock_catalog_service: MagicMock, params: str
+    ) -> None:
+        """Test a cursor on a listing that is not cursor-paged is rejected rather than ignored."""
+        cursor = client.get("/api/catalog/songs?q=love&per_page=2").json()["next_cursor"]
+
+        response = client.get(f"/api/catalog/songs?{params}cursor={cursor}")
+
+        assert response.status_code == 400
+        mock_catalog_service.get_songs_by_artist.assert_not_called()
+        mock_catalog_service.get_popular_songs.assert_not_called()
 
     def test_search_min_brands_filter(self, client: TestClient) -> None:
         """Test min_brands filter returns only popular songs."""
@@ -76,6 +143,63 @@ class TestGetPopularSongs:
         for song in data:
             assert song["is_popular"] is True
 
+    def test_popular_uses_cache_on_repeat(self, client: TestClient, mock_catalog_service: MagicMock) -> None:
+        """Test repeat popular requests are served from the serialized cache."""
+        first = client.get("/api/catalog/songs/popular?limit=3&min_brands=5")
+        second = client.get("/api/catalog/songs/popular?limit=3&min_brands=5")
+        client.get("/api/catalog/songs/popular?limit=4&min_brands=5")
+
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert mock_catalog_service.get_popular_songs.call_count == 2
+
+    def test_popular_query_off_event_loop(self, client: TestClient, mock_catalog_service: MagicMock) -> None:
+        """Test a popular songs cache miss runs the blocking BigQuery call in a worker thread."""
+        rows = mock_catalog_service.get_popular_songs.return_value
+        loops_seen: list[bool] = []
+
+        def probe(**kwargs: Any) -> list[MagicMock]:
+            try:
+                asyncio.get_running_loop()
+                loops_seen.append(True)
+            except RuntimeError:
+                loops_seen.append(False)
+            return rows  # type: ignore[no-any-return]
+
+        mock_catalog_service.get_popular_songs.side_effect = probe
+
+        response = client.get("/api/catalog/songs/popular?limit=5")
+
+        assert response.status_code == 200
+        assert loops_seen == [False]
+
+    def test_popular_cache_evicts_least_recently_used(
+        self, client: TestClient, mock_catalog_service: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a cache hit refreshes an entry so the least recently used one is evicted."""
+        monkeypatch.setattr(catalog, "POPULAR_CACHE_MAX_ENTRIES", 2)
+        client.get("/api/catalog/songs/popular?limit=1")
+        client.get("/api/catalog/songs/popular?limit=2")
+        client.get("/api/catalog/songs/popular?limit=1")  # Hit: limit=2 is now least recent
+        client.get("/api/catalog/songs/popular?limit=3")  # Evicts limit=2
+        mock_catalog_service.get_popular_songs.reset_mock()
+
+        client.get("/api/catalog/songs/popular?limit=1")
+        client.get("/api/catalog/songs/popular?limit=2")
+
+        mock_catalog_service.get_popular_songs.assert_called_once_with(limit=2, min_brands=5)
+
+    def test_popular_songs_304_on_matching_etag(self, client: TestClient, mock_catalog_service: MagicMock) -> None:
+        """Test popular songs answers a matching conditional GET with an empty 304 from the cache."""
+        etag = client.get("/api/catalog/songs/popular?limit=5").headers["etag"]
+
+        response = client.get("/api/catalog/songs/popular?limit=5", headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+        mock_catalog_service.get_popular_songs.assert_called_once()
+
     def test_get_popular_songs_respects_limit(self, client: TestClient) -> None:
         """Test getting popular songs respects limit parameter."""
         response = client.get("/api/catalog/songs/popular?limit=3&min_brands=5")
@@ -88,6 +212,16 @@ class TestGetPopularSongs:
 class TestGetSong:
     """Tests for the single song endpoint."""
 
+    def test_song_response_bounds_brand_count(self) -> None:
+        """Test brand_count is limited to the uint16 range."""
+        with pytest.raises(ValidationError):
+            SongResponse(id=1, artist="A", title="T", brands=[], brand_count=2**16)
+
+    def test_get_song_uses_orjson(self, app_instance: FastAPI) -> None:
+        """Test catalog routes render with ORJSONResponse by default."""
+        route = next(r for r in app_instance.routes if getattr(r, "path", "") == "/api/catalog/songs/{song_id}")
+        assert route.response_class is ORJSONResponse  # type: ignore[attr-defined]
+
     def test_get_song_found(self, client: TestClient) -> None:
         """Test getting a song by ID when found."""
         # Use ID 1 which exists in mock data
@@ -106,6 +240,7 @@ class TestGetSong:
         response = client.get("/api/catalog/songs/999999999")
 
         assert response.status_code == 404
+        assert "etag" not in response.headers
         data = response.json()
         assert "not found" in data["detail"].lower()
 
@@ -128,10 +263,162 @@ class TestGetCatalogStats:
         assert data["total_songs"] == 275809
         assert data["unique_artists"] == 50000
 
+    def test_stats_served_from_materialized_doc(
+        self,
+        client: TestClient,
+        mock_catalog_service: MagicMock,
+        mock_firestore_service: MagicMock,
+    ) -> None:
+        """Test fresh materialized stats cost one Firestore read and no BigQuery query."""
+        mock_firestore_service.get_document.return_value = {
+            "id": "stats",
+            "total_songs": 100,
+            "unique_artists": 40,
+            "max_brand_count": 8,
+            "avg_brand_count": 1.5,
+            "computed_at": datetime.now(UTC).isoformat(),
+        }
+
+        response = client.get("/api/catalog/stats")
+
+        assert response.status_code == 200
+        assert response.json()["total_songs"] == 100
+        assert response.headers["cache-control"] == "public, max-age=3600"
+        mock_firestore_service.get_document.assert_awaited_once_with("catalog_meta", "stats")
+        mock_catalog_service.get_stats.assert_not_called()
+        mock_firestore_service.set_document.assert_not_called()
+
+    def test_stats_refreshes_stale_doc(
+        self,
+        client: TestClient,
+        mock_catalog_service: MagicMock,
+        mock_firestore_service: MagicMock,
+    ) -> None:
+        """Test stats older than the sync interval are recomputed and stored."""
+        mock_firestore_service.get_document.return_value = {
+            "total_songs": 100,
+            "unique_artists": 40,
+            "max_brand_count": 8,
+            "avg_brand_count": 1.5,
+            "computed_at": (datetime.now(UTC) - timedelta(hours=25)).isoformat(),
+        }
+
+        response = client.get("/api/catalog/stats")
+
+        assert response.json()["total_songs"] == 275809
+        mock_catalog_service.get_stats.assert_called_once()
+        collection, doc_id, data = mock_firestore_service.set_document.call_args.args
+        assert (collection, doc_id) == ("catalog_meta", "stats")
+        assert data["total_songs"] == 275809
+        assert "computed_at" in data
+
+    def test_stats_recomputes_invalid_doc(
+        self,
+        client: TestClient,
+        mock_catalog_service: MagicMock,
+        mock_firestore_service: MagicMock,
+    ) -> None:
+        """Test a fresh but partial stats doc is recomputed instead of failing the request."""
+        mock_firestore_service.get_document.return_value = {
+            "total_songs": 100,
+            "computed_at": datetime.now(UTC).isoformat(),
+        }
+
+        response = client.get("/api/catalog/stats")
+
+        assert response.status_code == 200
+        assert response.json()["total_songs"] == 275809
+        mock_catalog_service.get_stats.assert_called_once()
+        mock_firestore_service.set_document.assert_awaited_once()
+
+    async def test_concurrent_stale_stats_recompute_once_off_loop(
+        self,
+        client: TestClient,
+        mock_catalog_service: MagicMock,
+        mock_firestore_service: MagicMock,
+        mock_backend_settings: BackendSettings,
+    ) -> None:
+        """Test concurrent requests for missing stats share one recompute, run in a worker thread."""
+        stats = mock_catalog_service.get_stats.return_value
+        loops_seen: list[bool] = []
+
+        def slow_get_stats() -> dict[str, Any]:
+            try:
+                asyncio.get_running_loop()
+                loops_seen.append(True)
+            except RuntimeError:
+                loops_seen.append(False)
+            time.sleep(0.05)
+            return stats  # type: ignore[no-any-return]
+
+        async def store(collection: str, doc_id: str, data: dict[str, Any]) -> None:
+            mock_firestore_service.get_document.return_value = data
+
+        mock_catalog_service.get_stats.side_effect = slow_get_stats
+        mock_firestore_service.set_document.side_effect = store
+
+        results = await asyncio.gather(
+            *(_load_catalog_stats(mock_firestore_service, mock_backend_settings) for _ in range(3))
+        )
+
+        assert [result.total_songs for result in results] == [275809] * 3
+        assert loops_seen == [False]
+        mock_firestore_service.set_document.assert_awaited_once()
+
+    def test_stats_has_etag(self, client: TestClient) -> None:
+        """Test stats responses carry an ETag."""
+        response = client.get("/api/catalog/stats")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+
+    def test_stats_304_on_matching_etag(self, client: TestClient) -> None:
+        """Test stats returns 304 with no body, repeating the 200's caching headers."""
+        origin = {"Origin": "http://localhost:3000"}
+        full = client.get("/api/catalog/stats", headers=origin)
+        etag = full.headers["etag"]
+
+        response = client.get("/api/catalog/stats", headers={**origin, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.headers["cache-control"] == full.headers["cache-control"] == "public, max-age=3600"
+        assert response.headers["vary"] == full.headers["vary"]
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.content == b""
+
+    def test_stats_200_on_stale_etag(self, client: TestClient) -> None:
+        """Test stats returns the full body when If-None-Match is stale."""
+        response = client.get("/api/catalog/stats", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.json()["total_songs"] == 275809
+
 
 class TestGetSongLinks:
     """Tests for the song links endpoint."""
 
+    def test_get_song_links_lookup_off_event_loop(self, client: TestClient, mock_catalog_service: MagicMock) -> None:
+        """Test the blocking BigQuery lookup doesn't run on the event loop."""
+        lookup = mock_catalog_service.get_song_by_id.side_effect
+        loops_seen: list[bool] = []
+
+        def probe(song_id: int) -> MagicMock | None:
+            try:
+                asyncio.get_running_loop()
+                loops_seen.append(True)
+            except RuntimeError:
+                loops_seen.append(False)
+            return lookup(song_id)  # type: ignore[no-any-return]
+
+        mock_catalog_service.get_song_by_id.side_effect = probe
+
+        response = client.get("/api/catalog/songs/1/links")
+
+        assert response.status_code == 200
+        assert loops_seen == [False]
+
     def test_get_song_links_found(self, client: TestClient) -> None:
         """Test getting karaoke links for a song."""
         # Use ID 1 which exists in mock data (Queen - Bohemian Rhapsody)
@@ -1,15 +1,24 @@
 """Tests for CatalogLookup service."""
 
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
 import pytest
 
+from backend.services import catalog_lookup
 from backend.services.catalog_lookup import (
     CatalogEntry,
     CatalogLookup,
+    _bounded_levenshtein,
     _normalize_artist,
+    _normalize_columns,
     _normalize_text,
     _normalize_title,
     get_catalog_lookup,
 )
+from backend.services.track_matcher import TrackMatcher
+from karaoke_decide.services.bigquery_catalog import SongResult
 
 
 class TestNormalizeFunctions:
@@ -21,6 +30,18 @@ class TestNormalizeFunctions:
         assert _normalize_text("  spaced  out  ") == "spaced out"
         assert _normalize_text("It's") == "it s"
 
+    def test_normalize_text_basic_cached(self) -> None:
+        """Test repeated normalizations are served from the cache."""
+        _normalize_title.cache_clear()
+        _normalize_title("Song (Live)")
+        _normalize_title("Song (Live)")
+        assert _normalize_title.cache_info().hits > 0
+
+    def test_normalize_text_non_ascii(self) -> None:
+        """Test non-ASCII characters are replaced like BigQuery's [^a-z0-9 ]."""
+        assert _normalize_text("Beyoncé\tCafé") == "beyonc caf"
+        assert _normalize_text("Motörhead") == "mot rhead"
+
     def test_normalize_title_removes_patterns(self) -> None:
         """Test title normalization removes common patterns."""
         assert _normalize_title("Song (feat. Artist)") == "song"
@@ -28,12 +49,53 @@ class TestNormalizeFunctions:
         assert _normalize_title("Song (Live)") == "song"
         assert _normalize_title("Song (Radio Edit)") == "song"
 
+    def test_normalize_title_matches_track_matcher_on_nested_groups(self) -> None:
+        """Test title patterns apply in turn, like TrackMatcher, so nested groups strip fully."""
+        title = "Song (Live at (feat. Y) Wembley)"
+        assert _normalize_title(title) == "song"
+        assert _normalize_title(title) == TrackMatcher(MagicMock()).normalize_title(title)
+
     def test_normalize_artist_removes_featured(self) -> None:
         """Test artist normalization removes featured artists."""
         assert _normalize_artist("Artist feat. Other") == "artist"
         assert _normalize_artist("Artist ft. Other") == "artist"
         assert _normalize_artist("Simon & Garfunkel") == "simon garfunkel"
 
+    def test_bounded_levenshtein_within_band(self) -> None:
+        """Test bounded Levenshtein returns exact distances up to max_dist."""
+        assert _bounded_levenshtein("bohemian rhapsody", "bohemian rhapsody") == 0
+        assert _bounded_levenshtein("bohemian rhapsody", "bohemain rhapsody") == 2
+        assert _bounded_levenshtein("", "ab") == 2
+
+    def test_bounded_levenshtein_exceeds_band(self) -> None:
+        """Test bounded Levenshtein caps distances above max_dist at max_dist + 1."""
+        assert _bounded_levenshtein("bohemian rhapsody", "bohemain rhapsodie", max_dist=2) == 3
+        assert _bounded_levenshtein("hey jude", "hey jude and more", max_dist=2) == 3
+
+    @pytest.mark.skipif(not catalog_lookup._HAS_HYPERSCAN, reason="hyperscan not installed")
+    def test_normalize_columns_matches_per_row(self) -> None:
+        """Test the Hyperscan prefilter gives the same results as per-row normalization."""
+        artists = ["Queen", "Artist feat. Other", "Withers", "Sam with Tom", "Beyoncé ft. Jay", "A\x1ffeat.\x1fB", ""]
+        titles = [
+            "Bohemian Rhapsody",
+            "Song (feat. Artist)",
+            "Song - Remastered 2011",
+            "Live Forever",
+            "Song (Liveſ)",
+            "Song - Remaſtered",
+            "",
+        ]
+
+        assert _normalize_columns(artists, titles) == (
+            [_normalize_artist(a) for a in artists],
+            [_normalize_title(t) for t in titles],
+        )
+
+    def test_normalize_columns_without_hyperscan(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test column normalization falls back to the re path."""
+        monkeypatch.setattr(catalog_lookup, "_HAS_HYPERSCAN", False)
+        assert _normalize_columns(["Queen feat. Bowie"], ["Song (Live)"]) == (["queen"], ["song"])
+
 
 class TestCatalogLookup:
     """Tests for CatalogLookup class."""
@@ -59,6 +121,44 @@ class TestCatalogLookup:
         assert key1 == key2
         assert key1 == key3  # Patterns should be stripped
 
+    def test_load_from_bigquery_builds_columns(self) -> None:
+        """Test loading SongResult rows stores them column-wise and matches return entries."""
+        bigquery_service = MagicMock()
+        bigquery_service.get_all_songs.return_value = [
+            SongResult(id=1, artist="Queen", title="Bohemian Rhapsody", brands="Zoom,Sunfly", brand_count=2),
+            SongResult(id=2, artist="ABBA", title="Waterloo", brands="Zoom", brand_count=1),
+        ]
+        lookup = CatalogLookup()
+
+        lookup.load_from_bigquery(bigquery_service)
+
+        assert lookup.is_loaded
+        assert lookup.entry_count == 2
+        assert list(lookup._ids) == [1, 2]
+        assert lookup.match("abba", "waterloo") == CatalogEntry(
+            id=2, artist="ABBA", title="Waterloo", brands="Zoom", brand_count=1
+        )
+
+    def test_load_from_cache_missing(self, tmp_path: Path) -> None:
+        """Test loading from an empty cache directory reports a miss."""
+        lookup = CatalogLookup()
+        assert not lookup.load_from_cache(tmp_path / "missing")
+        assert not lookup.is_loaded
+
+    def test_save_cache_requires_loaded_catalog(self, tmp_path: Path) -> None:
+        """Test saving an unloaded catalog raises instead of writing an empty cache."""
+        with pytest.raises(RuntimeError):
+            CatalogLookup().save_cache(tmp_path)
+
+    def test_load_clears_normalize_caches(self) -> None:
+        """Test loading the catalog resets the normalization caches."""
+        _normalize_title("Warm The Cache")
+        CatalogLookup()._load_entries(
+            [CatalogEntry(id=1, artist="Queen", title="Bohemian Rhapsody", brands="Zoom", brand_count=1)]
+        )
+        assert _normalize_title.cache_info().currsize == 0
+        assert CatalogLookup._make_key.cache_info().currsize == 0
+
 
 class TestCatalogLookupWithData:
     """Tests for CatalogLookup with pre-loaded data."""
@@ -67,25 +167,31 @@ class TestCatalogLookupWithData:
     def loaded_lookup(self) -> CatalogLookup:
         """Create a CatalogLookup with test data."""
         lookup = CatalogLookup()
-        # Manually set lookup data for testing
-        lookup._lookup = {
-            "queen:bohemian rhapsody": CatalogEntry(
-                id=123,
-                artist="Queen",
-                title="Bohemian Rhapsody",
-                brands="Sound Choice,Zoom",
-                brand_count=2,
-            ),
-            "the beatles:hey jude": CatalogEntry(
-                id=456,
-                artist="The Beatles",
-                title="Hey Jude",
-                brands="Karaoke Version",
-                brand_count=1,
-            ),
-        }
-        lookup._loaded = True
-        lookup._entry_count = 2
+        lookup._load_entries(
+            [
+                CatalogEntry(
+                    id=123,
+                    artist="Queen",
+                    title="Bohemian Rhapsody",
+                    brands="Sound Choice,Zoom",
+                    brand_count=2,
+                ),
+                CatalogEntry(
+                    id=456,
+                    artist="The Beatles",
+                    title="Hey Jude",
+                    brands="Karaoke Version",
+                    brand_count=1,
+                ),
+                CatalogEntry(
+                    id=789,
+                    artist="ABBA",
+                    title="SOS",
+                    brands="Zoom",
+                    brand_count=1,
+                ),
+            ]
+        )
         return lookup
 
     def test_match_finds_song(self, loaded_lookup: CatalogLookup) -> None:
@@ -96,6 +202,30 @@ class TestCatalogLookupWithData:
         assert result.artist == "Queen"
         assert result.title == "Bohemian Rhapsody"
 
+    def test_match_finds_near_miss(self, loaded_lookup: CatalogLookup) -> None:
+        """Test match falls back to a close title by the same artist."""
+        result = loaded_lookup.match("Queen", "Bohemain Rhapsody")
+        assert result is not None
+        assert result.id == 123
+
+    def test_match_near_miss_without_rapidfuzz(
+        self, loaded_lookup: CatalogLookup, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the pure-Python fallback accepts distance 2 and rejects distance 3."""
+        monkeypatch.setattr(catalog_lookup, "_HAS_RAPIDFUZZ", False)
+        result = loaded_lookup.match("Queen", "Bohemain Rhapsody")
+        assert result is not None
+        assert result.id == 123
+        assert loaded_lookup.match("Queen", "Bohemain Rhapsodie") is None
+
+    def test_match_fuzzy_requires_same_artist(self, loaded_lookup: CatalogLookup) -> None:
+        """Test the fuzzy fallback never crosses artists."""
+        assert loaded_lookup.match("Queens", "Bohemain Rhapsody") is None
+
+    def test_match_fuzzy_skips_short_titles(self, loaded_lookup: CatalogLookup) -> None:
+        """Test short titles must match exactly."""
+        assert loaded_lookup.match("The Beatles", "Hey Jud") is None
+
     def test_match_is_case_insensitive(self, loaded_lookup: CatalogLookup) -> None:
         """Test match is case insensitive."""
         result = loaded_lookup.match("QUEEN", "BOHEMIAN RHAPSODY")
@@ -113,6 +243,95 @@ class TestCatalogLookupWithData:
         result = loaded_lookup.match("Unknown Artist", "Unknown Song")
         assert result is None
 
+    def test_brands_round_trip_through_brand_table(self, loaded_lookup: CatalogLookup) -> None:
+        """Test brands are dictionary-encoded once and rebuilt exactly."""
+        queen = loaded_lookup.match("Queen", "Bohemian Rhapsody")
+        abba = loaded_lookup.match("ABBA", "SOS")
+        assert queen is not None and abba is not None
+        assert queen.brands == "Sound Choice,Zoom"
+        assert abba.brands == "Zoom"
+        assert loaded_lookup._brand_names == ["Sound Choice", "Zoom", "Karaoke Version"]
+
+    def test_match_unknown_skips_trie(self, loaded_lookup: CatalogLookup) -> None:
+        """Test the Bloom filter rejects unknown keys before the trie is walked."""
+        trie = MagicMock(wraps=loaded_lookup._trie)
+        loaded_lookup._trie = trie
+
+        assert loaded_lookup.match("Unknown Artist", "Unknown Song") is None
+        trie.get.assert_not_called()
+
+        assert loaded_lookup.match("Queen", "Bohemian Rhapsody") is not None
+        trie.get.assert_called_once()
+
+    def test_match_short_key(self, loaded_lookup: CatalogLookup) -> None:
+        """Test short keys resolve through the flat side-cache."""
+        result = loaded_lookup.match("ABBA", "SOS")
+        assert result is not None
+        assert result.id == 789
+
+    def test_prefix_match(self, loaded_lookup: CatalogLookup) -> None:
+        """Test prefix_match finds entries by artist and partial title."""
+        assert [e.id for e in loaded_lookup.prefix_match("Que")] == [123]
+        assert [e.id for e in loaded_lookup.prefix_match("the beatles he")] == [456]
+        assert [e.id for e in loaded_lookup.prefix_match("abba")] == [789]
+        assert loaded_lookup.prefix_match("queen hey") == []
+
+    def test_cache_round_trip(self, loaded_lookup: CatalogLookup, tmp_path: Path) -> None:
+        """Test a saved cache loads back memory-mapped and answers the same lookups."""
+        loaded_lookup.save_cache(tmp_path)
+        cached = CatalogLookup()
+
+        assert cached.load_from_cache(tmp_path)
+        assert isinstance(cached._ids, memoryview)
+        assert cached.entry_count == 3
+        for artist, title in [("Queen", "Bohemian Rhapsody"), ("ABBA", "SOS"), ("Queen", "Bohemain Rhapsody")]:
+            assert cached.match(artist, title) == loaded_lookup.match(artist, title)
+        assert cached.prefix_match("the beatles he") == loaded_lookup.prefix_match("the beatles he")
+        assert cached.match("Unknown Artist", "Unknown Song") is None
+
+    def test_save_cache_swaps_builds(self, loaded_lookup: CatalogLookup, tmp_path: Path) -> None:
+        """Test re-saving publishes a new build, removes the old one, and leaves mapped readers working."""
+        loaded_lookup.save_cache(tmp_path)
+        cached = CatalogLookup()
+        assert cached.load_from_cache(tmp_path)
+        first_build = (tmp_path / catalog_lookup.CATALOG_CACHE_CURRENT).resolve()
+
+        loaded_lookup.save_cache(tmp_path)
+
+        builds = list(tmp_path.glob(f"{catalog_lookup.CATALOG_CACHE_BUILD_PREFIX}*"))
+        assert builds == [(tmp_path / catalog_lookup.CATALOG_CACHE_CURRENT).resolve()]
+        assert builds[0] != first_build
+        assert cached.match("Queen", "Bohemian Rhapsody") == loaded_lookup.match("Queen", "Bohemian Rhapsody")
+        assert CatalogLookup().load_from_cache(tmp_path)
+
+    def test_load_from_cache_rejects_stale_version(self, loaded_lookup: CatalogLookup, tmp_path: Path) -> None:
+        """Test a cache written with another format version is ignored."""
+        loaded_lookup.save_cache(tmp_path)
+        meta_path = tmp_path / catalog_lookup.CATALOG_CACHE_CURRENT / catalog_lookup.CATALOG_CACHE_META
+        meta = json.loads(meta_path.read_text())
+        meta_path.write_text(json.dumps({**meta, "version": catalog_lookup.CATALOG_CACHE_VERSION - 1}))
+
+        cached = CatalogLookup()
+        assert not cached.load_from_cache(tmp_path)
+        assert not cached.is_loaded
+
+    def test_load_from_cache_rejects_expired_cache(self, loaded_lookup: CatalogLookup, tmp_path: Path) -> None:
+        """Test a cache built longer ago than max_age_hours is ignored, and accepted without a limit."""
+        loaded_lookup.save_cache(tmp_path)
+        meta_path = tmp_path / catalog_lookup.CATALOG_CACHE_CURRENT / catalog_lookup.CATALOG_CACHE_META
+        meta = json.loads(meta_path.read_text())
+        meta_path.write_text(json.dumps({**meta, "built_at": meta["built_at"] - 2 * 3600}))
+
+        assert not CatalogLookup().load_from_cache(tmp_path, max_age_hours=1)
+        assert CatalogLookup().load_from_cache(tmp_path, max_age_hours=3)
+        assert CatalogLookup().load_from_cache(tmp_path)
+
+    def test_prefix_match_respects_limit(self, loaded_lookup: CatalogLookup) -> None:
+        """Test prefix_match stops at limit."""
+        assert loaded_lookup.prefix_match("", limit=5) == []
+        assert len(loaded_lookup.prefix_match("q", limit=1)) == 1
+        assert loaded_lookup.prefix_match("q", limit=0) == []
+
 
 class TestGetCatalogLookup:
     """Tests for get_catalog_lookup singleton function."""
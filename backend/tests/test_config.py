@@ -3,6 +3,9 @@
 import os
 from unittest.mock import patch
 
+import pytest
+from pydantic import ValidationError
+
 from backend.config import BackendSettings, get_backend_settings
 
 
@@ -38,6 +41,12 @@ class TestBackendSettings:
             settings = BackendSettings()
             assert settings.rate_limit_requests == 50
 
+    def test_is_frozen(self) -> None:
+        """Test settings can't be reassigned after load."""
+        settings = BackendSettings()
+        with pytest.raises(ValidationError):
+            settings.rate_limit_requests = 1
+
 
 class TestGetBackendSettings:
     """Tests for get_backend_settings function."""
@@ -1,14 +1,40 @@
 """Tests for Firestore service."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import Generator, Iterable, Iterator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from backend.config import BackendSettings
+from backend.services import firestore_service as firestore_service_module
 from backend.services.firestore_service import FirestoreService
 
 
+class _AsyncIter:
+    """Async iterator over plain items, standing in for Firestore's async streams."""
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        self._it = iter(items)
+
+    def __aiter__(self) -> "_AsyncIter":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_clients() -> Generator[None, None, None]:
+    """Don't let a patched AsyncClient leak into other tests via the shared client cache."""
+    firestore_service_module._shared_clients.clear()
+    yield
+    firestore_service_module._shared_clients.clear()
+
+
 @pytest.fixture
 def mock_settings() -> BackendSettings:
     """Create mock settings."""
@@ -51,6 +77,14 @@ class TestFirestoreServiceInit:
         assert client1 is client2
         mock_async_client.assert_called_once()
 
+    @patch("backend.services.firestore_service.firestore.AsyncClient")
+    def test_client_shared_across_instances(self, mock_async_client: MagicMock, mock_settings: BackendSettings) -> None:
+        """Test services for the same project/database share one client."""
+        client1 = FirestoreService(mock_settings).client
+        client2 = FirestoreService(mock_settings).client
+        assert client1 is client2
+        mock_async_client.assert_called_once_with(project="test-project", database="(default)")
+
 
 class TestFirestoreServiceCollection:
     """Tests for collection method."""
@@ -110,6 +144,34 @@ class TestFirestoreServiceGetDocument:
         assert result is None
 
 
+class TestFirestoreServiceGetDocuments:
+    """Tests for get_documents method."""
+
+    @pytest.mark.asyncio
+    @patch("backend.services.firestore_service.firestore.AsyncClient")
+    async def test_get_documents_batched(
+        self, mock_async_client: MagicMock, firestore_service: FirestoreService
+    ) -> None:
+        """Test get_documents fetches all IDs in one get_all call and skips missing docs."""
+        mock_client = mock_async_client.return_value
+        found = MagicMock(exists=True, id="doc1")
+        found.to_dict.return_value = {"name": "Doc 1"}
+        missing = MagicMock(exists=False, id="doc2")
+
+        mock_client.get_all = MagicMock(return_value=_AsyncIter([found, missing]))
+
+        result = await firestore_service.get_documents("users", ["doc1", "doc2"])
+
+        assert result == [{"id": "doc1", "name": "Doc 1"}]
+        mock_client.get_all.assert_called_once()
+        assert len(mock_client.get_all.call_args[0][0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_documents_empty(self, firestore_service: FirestoreService) -> None:
+        """Test get_documents skips the RPC for an empty ID list."""
+        assert await firestore_service.get_documents("users", []) == []
+
+
 class TestFirestoreServiceSetDocument:
     """Tests for set_document method."""
 
@@ -188,14 +250,10 @@ class TestFirestoreServiceQueryDocuments:
         mock_client = mock_async_client.return_value
         mock_query = MagicMock()
 
-        # Create async generator for stream
-        async def async_stream() -> AsyncGenerator[MagicMock, None]:
-            doc = MagicMock()
-            doc.id = "user1"
-            doc.to_dict.return_value = {"name": "User 1"}
-            yield doc
-
-        mock_query.stream = async_stream
+        doc = MagicMock()
+        doc.id = "user1"
+        doc.to_dict.return_value = {"name": "User 1"}
+        mock_query.stream = lambda: _AsyncIter([doc])
         mock_client.collection.return_value = mock_query
 
         result = await firestore_service.query_documents("users")
@@ -212,12 +270,8 @@ class TestFirestoreServiceQueryDocuments:
         mock_client = mock_async_client.return_value
         mock_query = MagicMock()
 
-        async def async_stream() -> AsyncGenerator[MagicMock, None]:
-            return
-            yield  # Make it an async generator that yields nothing
-
         mock_query.where.return_value = mock_query
-        mock_query.stream = async_stream
+        mock_query.stream = lambda: _AsyncIter([])
         mock_client.collection.return_value = mock_query
 
         await firestore_service.query_documents(
@@ -236,12 +290,8 @@ class TestFirestoreServiceQueryDocuments:
         mock_client = mock_async_client.return_value
         mock_query = MagicMock()
 
-        async def async_stream() -> AsyncGenerator[MagicMock, None]:
-            return
-            yield
-
         mock_query.order_by.return_value = mock_query
-        mock_query.stream = async_stream
+        mock_query.stream = lambda: _AsyncIter([])
         mock_client.collection.return_value = mock_query
 
         await firestore_service.query_documents(
@@ -261,18 +311,45 @@ class TestFirestoreServiceQueryDocuments:
         mock_client = mock_async_client.return_value
         mock_query = MagicMock()
 
-        async def async_stream() -> AsyncGenerator[MagicMock, None]:
-            return
-            yield
-
         mock_query.limit.return_value = mock_query
-        mock_query.stream = async_stream
+        mock_query.stream = lambda: _AsyncIter([])
         mock_client.collection.return_value = mock_query
 
         await firestore_service.query_documents("users", limit=10)
 
         mock_query.limit.assert_called_once_with(10)
 
+    @pytest.mark.asyncio
+    @patch("backend.services.firestore_service.firestore.AsyncClient")
+    async def test_iter_documents_streams(
+        self, mock_async_client: MagicMock, firestore_service: FirestoreService
+    ) -> None:
+        """Test iter_documents hands each document over before fetching the next."""
+        mock_client = mock_async_client.return_value
+        mock_query = MagicMock()
+        produced = 0
+
+        def produce() -> Iterator[MagicMock]:
+            nonlocal produced
+            for i in range(3):
+                doc = MagicMock()
+                doc.id = f"user{i}"
+                doc.to_dict.return_value = {"name": f"User {i}"}
+                produced += 1
+                yield doc
+
+        mock_query.stream = lambda: _AsyncIter(produce())
+        mock_client.collection.return_value = mock_query
+
+        ids = []
+        max_buffered = 0
+        async for doc in firestore_service.iter_documents("users"):
+            ids.append(doc["id"])
+            max_buffered = max(max_buffered, produced - len(ids) + 1)
+
+        assert ids == ["user0", "user1", "user2"]
+        assert max_buffered == 1
+
 
 class TestFirestoreServiceCountDocuments:
     """Tests for count_documents method."""
@@ -1,12 +1,17 @@
 """Tests for health endpoints."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import AbstractContextManager, ExitStack
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
+from backend.api import deps
 from backend.config import BackendSettings
+from backend.main import app
 
 
 def test_health_check(client: TestClient) -> None:
@@ -18,7 +23,7 @@ def test_health_check(client: TestClient) -> None:
     assert data["service"] == "karaoke-decide"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings() -> BackendSettings:
     """Create mock backend settings."""
     return BackendSettings(
@@ -37,102 +42,125 @@ def mock_firestore_service() -> MagicMock:
     return mock
 
 
-@pytest.fixture
-def deep_health_client(
+@pytest.fixture(scope="module")
+def shared_gcp_mocks() -> SimpleNamespace:
+    """Catalog and Cloud Tasks mocks, built once per module."""
+    catalog = MagicMock()
+    catalog.get_stats.return_value = {"total_songs": 275000}
+
+    queue = SimpleNamespace(name="projects/test/locations/us-central1/queues/sync-queue")
+
+    tasks_client = MagicMock()
+    tasks_client.queue_path.return_value = queue.name
+    tasks_client.get_queue.return_value = queue
+
+    return SimpleNamespace(catalog=catalog, tasks_client=tasks_client, queue=queue)
+
+
+@pytest.fixture(scope="module")
+def deep_health_app(
     mock_settings: BackendSettings,
-    mock_firestore_service: MagicMock,
-) -> Generator[TestClient, None, None]:
-    """Create test client with mocked services for deep health check."""
-    from backend.api import deps
-    from backend.main import app
+    shared_gcp_mocks: SimpleNamespace,
+    override_deps: Callable[..., AbstractContextManager[None]],
+) -> Generator[SimpleNamespace, None, None]:
+    """Wire the app for deep health checks once per module.
+
+    The firestore override returns ``state.firestore``, which
+    deep_health_client_factory points at each test's own mock.
+    """
+    state = SimpleNamespace(firestore=None)
 
     async def get_settings_override() -> BackendSettings:
         return mock_settings
 
     async def get_firestore_override() -> MagicMock:
-        return mock_firestore_service
-
-    app.dependency_overrides[deps.get_settings] = get_settings_override
-    app.dependency_overrides[deps.get_firestore] = get_firestore_override
+        firestore: MagicMock = state.firestore
+        return firestore
 
-    # Mock catalog service and cloud tasks
-    mock_catalog = MagicMock()
-    mock_catalog.get_stats.return_value = {"total_songs": 275000}
+    with ExitStack() as stack:
+        stack.enter_context(
+            override_deps({deps.get_settings: get_settings_override, deps.get_firestore: get_firestore_override})
+        )
+        stack.enter_context(
+            patch("backend.api.routes.catalog.get_catalog_service", return_value=shared_gcp_mocks.catalog)
+        )
+        stack.enter_context(patch("google.cloud.tasks_v2.CloudTasksClient", return_value=shared_gcp_mocks.tasks_client))
+        yield state
 
-    mock_queue = MagicMock()
-    mock_queue.name = "projects/test/locations/us-central1/queues/sync-queue"
 
-    mock_tasks_client = MagicMock()
-    mock_tasks_client.queue_path.return_value = mock_queue.name
-    mock_tasks_client.get_queue.return_value = mock_queue
+@pytest.fixture(scope="module")
+async def deep_health_http(deep_health_app: SimpleNamespace) -> AsyncGenerator[AsyncClient, None]:
+    """Async client for the deep health app, shared by the module's tests."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        yield client
 
-    with (
-        patch("backend.api.routes.catalog.get_catalog_service", return_value=mock_catalog),
-        patch("google.cloud.tasks_v2.CloudTasksClient", return_value=mock_tasks_client),
-    ):
-        yield TestClient(app)
-
-    app.dependency_overrides.clear()
 
+@pytest.fixture
+def deep_health_client_factory(
+    deep_health_app: SimpleNamespace,
+    deep_health_http: AsyncClient,
+    shared_gcp_mocks: SimpleNamespace,
+) -> Generator[Callable[[MagicMock], AsyncClient], None, None]:
+    """Factory returning the shared deep health client, serving the given firestore mock.
+
+    Failures injected into the shared GCP mocks are cleared after each test.
+    """
+
+    def _make(firestore: MagicMock) -> AsyncClient:
+        deep_health_app.firestore = firestore
+        return deep_health_http
+
+    yield _make
+    deep_health_app.firestore = None
+    shared_gcp_mocks.catalog.get_stats.side_effect = None
+    shared_gcp_mocks.tasks_client.get_queue.side_effect = None
+    shared_gcp_mocks.catalog.reset_mock()
+    shared_gcp_mocks.tasks_client.reset_mock()
+
+
+@pytest.mark.parametrize(
+    ("firestore_effect", "expected_status", "firestore_status"),
+    [
+        (None, "healthy", "healthy"),
+        (Exception("Connection refused"), "degraded", "unhealthy"),
+    ],
+    ids=["all_healthy", "firestore_down"],
+)
+async def test_deep_health_check(
+    deep_health_client_factory: Callable[[MagicMock], AsyncClient],
+    mock_firestore_service: MagicMock,
+    firestore_effect: Exception | None,
+    expected_status: str,
+    firestore_status: str,
+) -> None:
+    """Test deep health check is healthy when all services are up and degraded when Firestore fails."""
+    mock_firestore_service.count_documents.side_effect = firestore_effect
+    client = deep_health_client_factory(mock_firestore_service)
 
-def test_deep_health_check_all_healthy(deep_health_client: TestClient) -> None:
-    """Test deep health check returns healthy when all services are up."""
-    response = deep_health_client.get("/api/health/deep")
+    response = await client.get("/api/health/deep")
     assert response.status_code == 200
 
     data = response.json()
-    assert data["status"] == "healthy"
+    assert data["status"] == expected_status
     assert data["service"] == "karaoke-decide"
     assert "timestamp" in data
-    assert "checks" in data
-
-    # Verify all checks passed
-    assert data["checks"]["firestore"]["status"] == "healthy"
+    assert data["checks"]["firestore"]["status"] == firestore_status
+    assert ("error" in data["checks"]["firestore"]) == (firestore_effect is not None)
     assert data["checks"]["bigquery"]["status"] == "healthy"
     assert data["checks"]["cloud_tasks"]["status"] == "healthy"
 
 
-def test_deep_health_check_degraded_on_failure(
-    mock_settings: BackendSettings,
+async def test_deep_health_check_degraded_on_bigquery_failure(
+    deep_health_client_factory: Callable[[MagicMock], AsyncClient],
+    mock_firestore_service: MagicMock,
+    shared_gcp_mocks: SimpleNamespace,
 ) -> None:
-    """Test deep health check returns degraded when a service fails."""
-    from backend.api import deps
-    from backend.main import app
-
-    # Create firestore that fails
-    mock_firestore = MagicMock()
-    mock_firestore.count_documents = AsyncMock(side_effect=Exception("Connection refused"))
-
-    async def get_settings_override() -> BackendSettings:
-        return mock_settings
-
-    async def get_firestore_override() -> MagicMock:
-        return mock_firestore
+    """Test deep health check reports BigQuery failures without failing the other checks."""
+    shared_gcp_mocks.catalog.get_stats.side_effect = Exception("Quota exceeded")
+    client = deep_health_client_factory(mock_firestore_service)
 
-    app.dependency_overrides[deps.get_settings] = get_settings_override
-    app.dependency_overrides[deps.get_firestore] = get_firestore_override
+    data = (await client.get("/api/health/deep")).json()
 
-    mock_catalog = MagicMock()
-    mock_catalog.get_stats.return_value = {"total_songs": 275000}
-
-    mock_queue = MagicMock()
-    mock_queue.name = "projects/test/locations/us-central1/queues/sync-queue"
-
-    mock_tasks_client = MagicMock()
-    mock_tasks_client.queue_path.return_value = mock_queue.name
-    mock_tasks_client.get_queue.return_value = mock_queue
-
-    with (
-        patch("backend.api.routes.catalog.get_catalog_service", return_value=mock_catalog),
-        patch("google.cloud.tasks_v2.CloudTasksClient", return_value=mock_tasks_client),
-    ):
-        client = TestClient(app)
-        response = client.get("/api/health/deep")
-
-    app.dependency_overrides.clear()
-
-    assert response.status_code == 200
-    data = response.json()
     assert data["status"] == "degraded"
-    assert data["checks"]["firestore"]["status"] == "unhealthy"
-    assert "error" in data["checks"]["firestore"]
+    assert data["checks"]["bigquery"] == {"status": "unhealthy", "error": "Quota exceeded"}
+    assert data["checks"]["cloud_tasks"]["status"] == "healthy"
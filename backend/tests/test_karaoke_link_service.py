@@ -1,6 +1,7 @@
 """Unit tests for KaraokeLinkService."""
 
 from unittest.mock import MagicMock
+from urllib.parse import parse_qs, quote_plus, urlsplit
 
 import pytest
 
@@ -11,75 +12,83 @@ from backend.services.karaoke_link_service import (
 )
 
 
+def _parts(url: str) -> tuple[str, str, dict[str, list[str]]]:
+    """Split a URL into its host, path and decoded query parameters."""
+    split = urlsplit(url)
+    return split.netloc, split.path, parse_qs(split.query)
+
+
 class TestKaraokeLinkService:
     """Tests for KaraokeLinkService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_settings(self) -> MagicMock:
         """Create mock settings."""
         return MagicMock()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self, mock_settings: MagicMock) -> KaraokeLinkService:
-        """Create service with mock settings."""
+        """Create service with mock settings (stateless, so shared by the module)."""
         return KaraokeLinkService(mock_settings)
 
     def test_get_youtube_search_url(self, service: KaraokeLinkService) -> None:
         """Test YouTube search URL generation."""
-        url = service.get_youtube_search_url("Queen", "Bohemian Rhapsody")
+        netloc, path, query = _parts(service.get_youtube_search_url("Queen", "Bohemian Rhapsody"))
 
-        assert "youtube.com/results" in url
-        assert "search_query=" in url
-        assert "Queen" in url
-        assert "Bohemian" in url
-        assert "karaoke" in url
+        assert netloc == "www.youtube.com"
+        assert path == "/results"
+        assert query == {"search_query": ["Queen Bohemian Rhapsody karaoke"]}
 
     def test_get_youtube_search_url_encodes_special_chars(self, service: KaraokeLinkService) -> None:
         """Test YouTube URL properly encodes special characters."""
         url = service.get_youtube_search_url("AC/DC", "Back in Black")
 
-        assert "youtube.com/results" in url
-        # URL should be encoded (/ becomes %2F with quote_plus)
+        # / is encoded (as %2F with quote_plus) and decodes back intact
         assert "AC%2FDC" in url
+        assert _parts(url)[2] == {"search_query": ["AC/DC Back in Black karaoke"]}
 
     def test_get_generator_url(self, service: KaraokeLinkService) -> None:
         """Test Karaoke Generator URL generation."""
-        url = service.get_generator_url("Queen", "Bohemian Rhapsody")
+        netloc, _, query = _parts(service.get_generator_url("Queen", "Bohemian Rhapsody"))
 
-        assert "gen.nomadkaraoke.com" in url
-        assert "artist=" in url
-        assert "title=" in url
-        assert "Queen" in url
-        assert "Bohemian" in url
+        assert netloc == "gen.nomadkaraoke.com"
+        assert query == {"artist": ["Queen"], "title": ["Bohemian Rhapsody"]}
 
     def test_get_generator_url_encodes_special_chars(self, service: KaraokeLinkService) -> None:
         """Test Generator URL properly encodes special characters."""
         url = service.get_generator_url("Guns N' Roses", "Sweet Child O' Mine")
 
-        assert "gen.nomadkaraoke.com" in url
-        # Apostrophe should be encoded to %27
+        # Apostrophe is encoded to %27 and decodes back intact
         assert "%27" in url
         assert "'" not in url
-
-    def test_get_links_returns_all_link_types(self, service: KaraokeLinkService) -> None:
-        """Test get_links returns all available link types."""
-        links = service.get_links("Queen", "Bohemian Rhapsody")
-
-        assert len(links) == 2
-        types = {link.type for link in links}
-        assert KaraokeLinkType.YOUTUBE_SEARCH in types
-        assert KaraokeLinkType.KARAOKE_GENERATOR in types
-
-    def test_get_links_structure(self, service: KaraokeLinkService) -> None:
-        """Test get_links returns properly structured KaraokeLink objects."""
-        links = service.get_links("Queen", "Bohemian Rhapsody")
-
+        assert _parts(url)[2] == {"artist": ["Guns N' Roses"], "title": ["Sweet Child O' Mine"]}
+
+    @pytest.mark.parametrize(
+        ("artist", "title"),
+        [
+            ("Queen", "Bohemian Rhapsody"),
+            ("AC/DC", "Back in Black"),
+            ("Guns N' Roses", "Sweet Child O' Mine"),
+            ("Björk", "Jóga"),
+            ("", "Bohemian Rhapsody"),
+            ("Queen", ""),
+        ],
+    )
+    def test_links_structure_and_encoding(self, service: KaraokeLinkService, artist: str, title: str) -> None:
+        """Test get_links returns one well-formed, fully encoded link of each type."""
+        links = service.get_links(artist, title)
+
+        assert [link.type for link in links] == [KaraokeLinkType.YOUTUBE_SEARCH, KaraokeLinkType.KARAOKE_GENERATOR]
         for link in links:
             assert isinstance(link, KaraokeLink)
-            assert link.url is not None
-            assert link.label is not None
-            assert link.description is not None
-            assert link.type in KaraokeLinkType
+            assert link.label
+            assert link.description
+            assert link.url.isascii()
+            assert " " not in link.url
+            assert "'" not in link.url
+            for part in (artist, title):
+                if part:
+                    assert quote_plus(part) in link.url
 
     def test_youtube_link_has_correct_metadata(self, service: KaraokeLinkService) -> None:
         """Test YouTube link has correct label and description."""
@@ -97,31 +106,6 @@ class TestKaraokeLinkService:
         assert "Generator" in gen_link.label or "Create" in gen_link.label
         assert "generate" in gen_link.description.lower() or "custom" in gen_link.description.lower()
 
-    def test_handles_empty_artist(self, service: KaraokeLinkService) -> None:
-        """Test service handles empty artist gracefully."""
-        links = service.get_links("", "Bohemian Rhapsody")
-
-        assert len(links) == 2
-        for link in links:
-            assert "Bohemian" in link.url
-
-    def test_handles_empty_title(self, service: KaraokeLinkService) -> None:
-        """Test service handles empty title gracefully."""
-        links = service.get_links("Queen", "")
-
-        assert len(links) == 2
-        for link in links:
-            assert "Queen" in link.url
-
-    def test_handles_unicode_characters(self, service: KaraokeLinkService) -> None:
-        """Test service handles unicode characters."""
-        links = service.get_links("Björk", "Jóga")
-
-        assert len(links) == 2
-        # URLs should be properly encoded
-        for link in links:
-            assert link.url is not None
-
 
 class TestKaraokeLinkType:
     """Tests for KaraokeLinkType enum."""
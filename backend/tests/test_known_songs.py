@@ -1,12 +1,20 @@
 """Tests for known songs routes and service."""
 
-from collections.abc import Generator
-from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
-
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import AbstractContextManager
+from dataclasses import asdict, dataclass, replace
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import ANY, AsyncMock, MagicMock
+
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+from google.cloud import bigquery
+from httpx import URL, ASGITransport, AsyncClient, Headers, Request, Response
 
+from backend.api import deps
+from backend.config import BackendSettings
+from backend.main import app
 from backend.services.known_songs_service import (
     AddKnownSongResult,
     KnownSongsListResult,
@@ -15,125 +23,275 @@ from backend.services.known_songs_service import (
 )
 
 
-@pytest.fixture
-def sample_known_songs() -> list[dict]:
-    """Sample known songs for testing."""
-    return [
-        {
-            "id": "user_abc123def456:1",
-            "user_id": "user_abc123def456",
-            "song_id": "1",
-            "source": "known_songs",
-            "is_saved": True,
-            "artist": "Queen",
-            "title": "Bohemian Rhapsody",
-            "created_at": "2024-01-01T12:00:00+00:00",
-            "updated_at": "2024-01-01T12:00:00+00:00",
-        },
-        {
-            "id": "user_abc123def456:2",
-            "user_id": "user_abc123def456",
-            "song_id": "2",
-            "source": "known_songs",
-            "is_saved": True,
-            "artist": "Journey",
-            "title": "Don't Stop Believin'",
-            "created_at": "2024-01-02T12:00:00+00:00",
-            "updated_at": "2024-01-02T12:00:00+00:00",
-        },
-    ]
+class OrjsonAsyncClient(AsyncClient):
+    """AsyncClient that encodes ``json=`` request bodies with orjson."""
+
+    def build_request(
+        self,
+        method: str,
+        url: URL | str,
+        *,
+        json: Any = None,
+        content: Any = None,
+        headers: Any = None,
+        **kwargs: Any,
+    ) -> Request:
+        if json is not None:
+            content = orjson.dumps(json)
+            headers = Headers(headers)
+            headers["Content-Type"] = "application/json"
+        return super().build_request(method, url, content=content, headers=headers, **kwargs)
+
+
+class FakeBigQueryClient:
+    """Stand-in BigQuery client whose queries all return ``rows``."""
+
+    def __init__(self) -> None:
+        self.rows: list[Any] = []
+
+    def query(self, sql: str, job_config: Any = None) -> "FakeBigQueryClient":
+        return self
+
+    def result(self) -> list[Any]:
+        return list(self.rows)
+
+
+# Catalog rows as returned by BigQuery
+QUEEN_ROW = SimpleNamespace(id="1", artist="Queen", title="Bohemian Rhapsody")
+JOURNEY_ROW = SimpleNamespace(id="2", artist="Journey", title="Don't Stop Believin'")
+
+
+@pytest.fixture(scope="module")
+def shared_fake_bigquery() -> FakeBigQueryClient:
+    """Fake BigQuery client built once per module."""
+    return FakeBigQueryClient()
 
 
 @pytest.fixture
-def mock_known_songs_service(sample_known_songs: list[dict]) -> MagicMock:
-    """Mock known songs service for API tests."""
+def fake_bigquery(shared_fake_bigquery: FakeBigQueryClient) -> FakeBigQueryClient:
+    """The shared fake BigQuery client, emptied of rows left by the last test."""
+    shared_fake_bigquery.rows = []
+    return shared_fake_bigquery
+
+
+@pytest.fixture(scope="module")
+def shared_firestore_service() -> MagicMock:
+    """Firestore service mock for the service unit tests, built once per module."""
     mock = MagicMock()
-    mock.get_known_songs = AsyncMock(
-        return_value=KnownSongsListResult(
-            songs=sample_known_songs,
-            total=2,
-            page=1,
-            per_page=20,
-        )
-    )
-    mock.add_known_song = AsyncMock(
-        return_value=AddKnownSongResult(
-            added=True,
-            song_id="1",
-            artist="Queen",
-            title="Bohemian Rhapsody",
-            already_existed=False,
-        )
-    )
-    mock.remove_known_song = AsyncMock(return_value=True)
-    mock.bulk_add_known_songs = AsyncMock(
-        return_value={
-            "added": 2,
-            "already_existed": 1,
-            "not_found": 0,
-            "total_requested": 3,
-        }
-    )
-    mock.set_enjoy_singing = AsyncMock(
-        return_value=SetEnjoySingingResult(
-            success=True,
-            song_id="1",
-            artist="Queen",
-            title="Bohemian Rhapsody",
-            enjoy_singing=True,
-            singing_tags=["crowd_pleaser", "shows_range"],
-            singing_energy="emotional_powerhouse",
-            vocal_comfort="challenging",
-            notes="Great song for the finale!",
-            created_new=False,
-        )
-    )
-    mock.remove_enjoy_singing = AsyncMock(return_value=True)
+    for name in (
+        "get_document",
+        "set_document",
+        "update_document",
+        "delete_document",
+        "query_documents",
+        "count_documents",
+    ):
+        setattr(mock, name, AsyncMock())
     return mock
 
 
 @pytest.fixture
-def known_songs_client(
-    mock_catalog_service: MagicMock,
-    mock_auth_service: MagicMock,
+def mock_firestore_service(shared_firestore_service: MagicMock, fake_bigquery: FakeBigQueryClient) -> MagicMock:
+    """The shared Firestore mock, cleared of the last test's calls and results.
+
+    Overrides the conftest fixture for this module. Requesting fake_bigquery
+    empties its rows as well.
+    """
+    shared_firestore_service.reset_mock(return_value=True, side_effect=True)
+    shared_firestore_service.get_document.return_value = None
+    shared_firestore_service.query_documents.return_value = []
+    return shared_firestore_service
+
+
+@pytest.fixture(scope="module")
+def known_songs_service(
+    shared_firestore_service: MagicMock,
+    shared_fake_bigquery: FakeBigQueryClient,
+) -> KnownSongsService:
+    """Create known songs service with mocked dependencies, once per module.
+
+    The service keeps no state between calls, so only its mocks are reset.
+    """
+    return KnownSongsService(
+        BackendSettings(environment="development", google_cloud_project="test-project"),
+        shared_firestore_service,
+        bigquery_client=cast(bigquery.Client, shared_fake_bigquery),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class KnownSongRow:
+    """A known song as stored in Firestore."""
+
+    id: str
+    user_id: str
+    song_id: str
+    source: str
+    is_saved: bool
+    artist: str
+    title: str
+    created_at: str
+    updated_at: str
+
+
+SAMPLE_KNOWN_SONGS = (
+    KnownSongRow(
+        id="user_abc123def456:1",
+        user_id="user_abc123def456",
+        song_id="1",
+        source="known_songs",
+        is_saved=True,
+        artist="Queen",
+        title="Bohemian Rhapsody",
+        created_at="2024-01-01T12:00:00+00:00",
+        updated_at="2024-01-01T12:00:00+00:00",
+    ),
+    KnownSongRow(
+        id="user_abc123def456:2",
+        user_id="user_abc123def456",
+        song_id="2",
+        source="known_songs",
+        is_saved=True,
+        artist="Journey",
+        title="Don't Stop Believin'",
+        created_at="2024-01-02T12:00:00+00:00",
+        updated_at="2024-01-02T12:00:00+00:00",
+    ),
+)
+
+
+AUTH_HEADERS = {"Authorization": "Bearer test-token"}
+SONG_1_PARAMS = {"song_id": "1"}
+
+# Song 1 as stored in user-123's library, before any source or enjoy singing fields
+LIBRARY_DOC = {"id": "user-123:1", "song_id": "1", "artist": "Queen", "title": "Bohemian Rhapsody"}
+
+
+def assert_status(response: Response, expected: int) -> None:
+    """Assert a response's status code, decoding the body only to report a mismatch."""
+    assert response.status_code == expected, response.text
+
+
+# Enjoy singing result with no optional metadata; tests derive variants with replace()
+MINIMAL_ENJOY_SINGING_RESULT = SetEnjoySingingResult(
+    success=True,
+    song_id="1",
+    artist="Queen",
+    title="Bohemian Rhapsody",
+    enjoy_singing=True,
+    singing_tags=[],
+    singing_energy=None,
+    vocal_comfort=None,
+    notes=None,
+    created_new=False,
+)
+
+# Default return values of the shared known songs service mock
+KNOWN_SONGS_SERVICE_DEFAULTS: dict[str, Any] = {
+    "get_known_songs": KnownSongsListResult(
+        songs=[asdict(row) for row in SAMPLE_KNOWN_SONGS],
+        total=2,
+        page=1,
+        per_page=20,
+    ),
+    "add_known_song": AddKnownSongResult(
+        added=True,
+        song_id="1",
+        artist="Queen",
+        title="Bohemian Rhapsody",
+        already_existed=False,
+    ),
+    "remove_known_song": True,
+    "bulk_add_known_songs": {
+        "added": 2,
+        "already_existed": 1,
+        "not_found": 0,
+        "total_requested": 3,
+    },
+    "set_enjoy_singing": replace(
+        MINIMAL_ENJOY_SINGING_RESULT,
+        singing_tags=["crowd_pleaser", "shows_range"],
+        singing_energy="emotional_powerhouse",
+        vocal_comfort="challenging",
+        notes="Great song for the finale!",
+    ),
+    "remove_enjoy_singing": True,
+}
+
+
+@pytest.fixture(scope="module")
+def mock_known_songs_service() -> MagicMock:
+    """Mock known songs service for API tests, built once per module.
+
+    reset_known_songs_service restores its default return values before each test.
+    """
+    mock = MagicMock()
+    for name in KNOWN_SONGS_SERVICE_DEFAULTS:
+        setattr(mock, name, AsyncMock())
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def reset_known_songs_service(mock_known_songs_service: MagicMock) -> None:
+    """Clear calls, return values and side effects left on the shared mock by the last test."""
+    mock_known_songs_service.reset_mock(return_value=True, side_effect=True)
+    for name, value in KNOWN_SONGS_SERVICE_DEFAULTS.items():
+        getattr(mock_known_songs_service, name).return_value = value
+
+
+@pytest.fixture(scope="module")
+def known_songs_overrides(
     mock_known_songs_service: MagicMock,
-) -> Generator[TestClient, None, None]:
-    """Create test client with mocked known songs service."""
-    with (
-        patch(
-            "backend.api.routes.catalog.get_catalog_service",
-            return_value=mock_catalog_service,
-        ),
-        patch(
-            "backend.api.deps.get_auth_service",
-            return_value=mock_auth_service,
-        ),
-        patch(
-            "backend.api.deps.get_known_songs_service",
-            return_value=mock_known_songs_service,
-        ),
+    shared_auth_service_mock: MagicMock,
+    override_deps: Callable[..., AbstractContextManager[None]],
+) -> Generator[None, None, None]:
+    """Serve the shared known songs and auth mocks through dependency overrides, once per module."""
+
+    async def get_known_songs_service_override() -> MagicMock:
+        return mock_known_songs_service
+
+    async def get_auth_service_override() -> MagicMock:
+        return shared_auth_service_mock
+
+    with override_deps(
+        {
+            deps.get_known_songs_service_dep: get_known_songs_service_override,
+            deps.get_auth_service_dep: get_auth_service_override,
+        }
     ):
-        from backend.main import app
+        yield
 
-        yield TestClient(app)
+
+@pytest.fixture(scope="module")
+async def known_songs_http(known_songs_overrides: None) -> AsyncGenerator[AsyncClient, None]:
+    """Async client for the overridden app, shared by the module's tests."""
+    async with OrjsonAsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        yield client
+
+
+@pytest.fixture
+def known_songs_client(known_songs_http: AsyncClient, mock_auth_service: MagicMock) -> AsyncClient:
+    """The shared async client.
+
+    Requesting mock_auth_service resets the shared auth mock to its defaults.
+    """
+    return known_songs_http
 
 
 class TestListKnownSongs:
     """Tests for GET /api/known-songs."""
 
-    def test_list_known_songs_success(
+    async def test_list_known_songs_success(
         self,
-        known_songs_client: TestClient,
-        mock_known_songs_service: MagicMock,
-        sample_known_songs: list[dict],
+        known_songs_client: AsyncClient,
     ) -> None:
         """Test listing known songs returns user's songs."""
-        response = known_songs_client.get(
+        response = await known_songs_client.get(
             "/api/known-songs",
-            headers={"Authorization": "Bearer test-token"},
+            headers=AUTH_HEADERS,
         )
 
-        assert response.status_code == 200
+        assert_status(response, 200)
         data = response.json()
         assert "songs" in data
         assert len(data["songs"]) == 2
@@ -141,57 +299,53 @@ class TestListKnownSongs:
         assert data["songs"][0]["source"] == "known_songs"
         assert data["total"] == 2
 
-    def test_list_known_songs_requires_auth(
+    async def test_list_known_songs_requires_auth(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
     ) -> None:
         """Test listing known songs requires authentication."""
-        response = known_songs_client.get("/api/known-songs")
+        response = await known_songs_client.get("/api/known-songs")
 
-        assert response.status_code == 401
+        assert_status(response, 401)
 
-    def test_list_known_songs_with_pagination(
+    async def test_list_known_songs_with_pagination(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
         mock_known_songs_service: MagicMock,
     ) -> None:
         """Test listing known songs with pagination parameters."""
-        response = known_songs_client.get(
+        response = await known_songs_client.get(
             "/api/known-songs?page=2&per_page=10",
-            headers={"Authorization": "Bearer test-token"},
+            headers=AUTH_HEADERS,
         )
 
-        assert response.status_code == 200
-        mock_known_songs_service.get_known_songs.assert_called_once()
-        call_kwargs = mock_known_songs_service.get_known_songs.call_args.kwargs
-        assert call_kwargs["page"] == 2
-        assert call_kwargs["per_page"] == 10
+        assert_status(response, 200)
+        mock_known_songs_service.get_known_songs.assert_called_once_with(user_id=ANY, page=2, per_page=10)
 
 
 class TestAddKnownSong:
     """Tests for POST /api/known-songs."""
 
-    def test_add_known_song_success(
+    async def test_add_known_song_success(
         self,
-        known_songs_client: TestClient,
-        mock_known_songs_service: MagicMock,
+        known_songs_client: AsyncClient,
     ) -> None:
         """Test adding a known song successfully."""
-        response = known_songs_client.post(
+        response = await known_songs_client.post(
             "/api/known-songs",
-            headers={"Authorization": "Bearer test-token"},
+            headers=AUTH_HEADERS,
             json={"song_id": 1},
         )
 
-        assert response.status_code == 201
+        assert_status(response, 201)
         data = response.json()
         assert data["added"] is True
         assert data["artist"] == "Queen"
         assert data["title"] == "Bohemian Rhapsody"
 
-    def test_add_known_song_already_exists(
+    async def test_add_known_song_already_exists(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
         mock_known_songs_service: MagicMock,
     ) -> None:
         """Test adding a song that already exists."""
@@ -203,279 +357,201 @@ class TestAddKnownSong:
             already_existed=True,
         )
 
-        response = known_songs_client.post(
+        response = await known_songs_client.post(
             "/api/known-songs",
-            headers={"Authorization": "Bearer test-token"},
+            headers=AUTH_HEADERS,
             json={"song_id": 1},
         )
 
-        assert response.status_code == 201
+        assert_status(response, 201)
         data = response.json()
         assert data["added"] is False
         assert data["already_existed"] is True
 
-    def test_add_known_song_not_found(
+    async def test_add_known_song_not_found(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
         mock_known_songs_service: MagicMock,
     ) -> None:
         """Test adding a song that doesn't exist in catalog."""
         mock_known_songs_service.add_known_song.side_effect = ValueError("Song with ID 999 not found in catalog")
 
-        response = known_songs_client.post(
+        response = await known_songs_client.post(
             "/api/known-songs",
-            headers={"Authorization": "Bearer test-token"},
+            headers=AUTH_HEADERS,
             json={"song_id": 999},
         )
 
-        assert response.status_code == 404
+        assert_status(response, 404)
 
-    def test_add_known_song_requires_auth(
+    async def test_add_known_song_requires_auth(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
     ) -> None:
         """Test adding known song requires authentication."""
-        response = known_songs_client.post(
+        response = await known_songs_client.post(
             "/api/known-songs",
             json={"song_id": 1},
         )
 
-        assert response.status_code == 401
+        assert_status(response, 401)
 
 
 class TestBulkAddKnownSongs:
     """Tests for POST /api/known-songs/bulk."""
 
-    def test_bulk_add_success(
+    async def test_bulk_add_success(
         self,
-        known_songs_client: TestClient,
-        mock_known_songs_service: MagicMock,
+        known_songs_client: AsyncClient,
     ) -> None:
         """Test bulk adding known songs."""
-        response = known_songs_client.post(
+        response = await known_songs_client.post(
             "/api/known-songs/bulk",
-            headers={"Authorization": "Bearer test-token"},
+            headers=AUTH_HEADERS,
             json={"song_ids": [1, 2, 3]},
         )
 
-        assert response.status_code == 200
+        assert_status(response, 200)
         data = response.json()
         assert data["added"] == 2
         assert data["already_existed"] == 1
         assert data["not_found"] == 0
         assert data["total_requested"] == 3
 
-    def test_bulk_add_empty_list(
+    async def test_bulk_add_empty_list(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
     ) -> None:
         """Test bulk add with empty list fails validation."""
-        response = known_songs_client.post(
+        response = await known_songs_client.post(
             "/api/known-songs/bulk",
-            headers={"Authorization": "Bearer test-token"},
+            headers=AUTH_HEADERS,
             json={"song_ids": []},
         )
 
-        assert response.status_code == 422
+        assert_status(response, 422)
 
 
 class TestRemoveKnownSong:
     """Tests for DELETE /api/known-songs/{song_id}."""
 
-    def test_remove_known_song_success(
+    async def test_remove_known_song_success(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
         mock_known_songs_service: MagicMock,
     ) -> None:
         """Test removing a known song."""
-        response = known_songs_client.delete(
+        response = await known_songs_client.delete(
             "/api/known-songs/1",
-            headers={"Authorization": "Bearer test-token"},
+            headers=AUTH_HEADERS,
         )
 
-        assert response.status_code == 204
-        mock_known_songs_service.remove_known_song.assert_called_once()
+        assert_status(response, 204)
+        mock_known_songs_service.remove_known_song.assert_called_once_with(user_id=ANY, song_id=1)
 
-    def test_remove_known_song_not_found(
+    async def test_remove_known_song_not_found(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
         mock_known_songs_service: MagicMock,
     ) -> None:
         """Test removing a song that doesn't exist."""
         mock_known_songs_service.remove_known_song.return_value = False
 
-        response = known_songs_client.delete(
+        response = await known_songs_client.delete(
             "/api/known-songs/999",
-            headers={"Authorization": "Bearer test-token"},
+            headers=AUTH_HEADERS,
         )
 
-        assert response.status_code == 404
+        assert_status(response, 404)
 
 
 class TestKnownSongsServiceUnit:
     """Unit tests for KnownSongsService."""
 
-    @pytest.fixture
-    def known_songs_service(
-        self,
-        mock_backend_settings: MagicMock,
-        mock_firestore_service: MagicMock,
-    ) -> KnownSongsService:
-        """Create known songs service with mocked dependencies."""
-        mock_bigquery = MagicMock()
-        return KnownSongsService(
-            mock_backend_settings,
-            mock_firestore_service,
-            bigquery_client=mock_bigquery,
-        )
-
-    @pytest.mark.asyncio
     async def test_add_known_song_creates_user_song(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
+        fake_bigquery: FakeBigQueryClient,
     ) -> None:
-        """Test adding a known song creates a UserSong record."""
-        # Mock BigQuery to return song details
-        mock_result = MagicMock()
-        mock_result.id = "1"
-        mock_result.artist = "Queen"
-        mock_result.title = "Bohemian Rhapsody"
-        known_songs_service._bigquery_client.query.return_value.result.return_value = [mock_result]  # type: ignore[union-attr]
+        """Test adding a new catalog song creates a UserSong record."""
+        fake_bigquery.rows = [QUEEN_ROW]
 
-        # Mock Firestore to return no existing document
-        mock_firestore_service.get_document.return_value = None
+        result = await known_songs_service.add_known_song(user_id="user-123", song_id=1)
 
-        result = await known_songs_service.add_known_song(
-            user_id="user-123",
-            song_id=1,
-        )
-
-        assert result.added is True
-        assert result.song_id == "1"
-        assert result.artist == "Queen"
+        assert (result.added, result.already_existed, result.song_id, result.artist) == (True, False, "1", "Queen")
         mock_firestore_service.set_document.assert_called_once()
-
-        # Verify the document data
-        call_args = mock_firestore_service.set_document.call_args
-        doc_data = call_args[0][2]  # Third positional argument is the data
+        doc_data = mock_firestore_service.set_document.call_args[0][2]  # Third positional argument is the data
         assert doc_data["source"] == "known_songs"
         assert doc_data["is_saved"] is True
 
-    @pytest.mark.asyncio
     async def test_add_known_song_existing(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
+        fake_bigquery: FakeBigQueryClient,
     ) -> None:
-        """Test adding a song that already exists."""
-        # Mock BigQuery to return song details
-        mock_result = MagicMock()
-        mock_result.id = "1"
-        mock_result.artist = "Queen"
-        mock_result.title = "Bohemian Rhapsody"
-        known_songs_service._bigquery_client.query.return_value.result.return_value = [mock_result]  # type: ignore[union-attr]
+        """Test adding a song already in the library leaves it untouched."""
+        fake_bigquery.rows = [QUEEN_ROW]
+        mock_firestore_service.get_document.return_value = dict(LIBRARY_DOC)
 
-        # Mock Firestore to return existing document
-        mock_firestore_service.get_document.return_value = {
-            "id": "user-123:1",
-            "song_id": "1",
-            "artist": "Queen",
-            "title": "Bohemian Rhapsody",
-        }
+        result = await known_songs_service.add_known_song(user_id="user-123", song_id=1)
 
-        result = await known_songs_service.add_known_song(
-            user_id="user-123",
-            song_id=1,
-        )
-
-        assert result.added is False
-        assert result.already_existed is True
+        assert (result.added, result.already_existed) == (False, True)
         mock_firestore_service.set_document.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_add_known_song_not_in_catalog(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
+        fake_bigquery: FakeBigQueryClient,
     ) -> None:
-        """Test adding a song that doesn't exist in catalog."""
-        # Mock BigQuery to return no results
-        known_songs_service._bigquery_client.query.return_value.result.return_value = []  # type: ignore[union-attr]
+        """Test adding a song missing from the catalog raises ValueError."""
+        # An empty BigQuery result means the song is not in the catalog
+        fake_bigquery.rows = []
 
         with pytest.raises(ValueError, match="not found in catalog"):
-            await known_songs_service.add_known_song(
-                user_id="user-123",
-                song_id=999,
-            )
-
-    @pytest.mark.asyncio
-    async def test_remove_known_song_success(
-        self,
-        known_songs_service: KnownSongsService,
-        mock_firestore_service: MagicMock,
-    ) -> None:
-        """Test removing a known song."""
-        mock_firestore_service.get_document.return_value = {
-            "id": "user-123:1",
-            "source": "known_songs",
-        }
-
-        result = await known_songs_service.remove_known_song(
-            user_id="user-123",
-            song_id=1,
-        )
-
-        assert result is True
-        mock_firestore_service.delete_document.assert_called_once()
+            await known_songs_service.add_known_song(user_id="user-123", song_id=1)
+        mock_firestore_service.set_document.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_remove_known_song_wrong_source(
+    @pytest.mark.parametrize(
+        ("stored_doc", "expected", "delete_called"),
+        [
+            pytest.param({"id": "user-123:1", "source": "known_songs"}, True, True, id="success"),
+            # Songs synced from another source are not removable here
+            pytest.param({"id": "user-123:1", "source": "spotify"}, False, False, id="wrong_source"),
+            pytest.param(None, False, False, id="not_found"),
+        ],
+    )
+    async def test_remove_known_song(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
+        stored_doc: dict[str, str] | None,
+        expected: bool,
+        delete_called: bool,
     ) -> None:
-        """Test removing a song from a different source fails."""
-        mock_firestore_service.get_document.return_value = {
-            "id": "user-123:1",
-            "source": "spotify",  # Not "known_songs"
-        }
+        """Test removing a known song only deletes manually added songs."""
+        mock_firestore_service.get_document.return_value = stored_doc
 
         result = await known_songs_service.remove_known_song(
             user_id="user-123",
             song_id=1,
         )
 
-        assert result is False
-        mock_firestore_service.delete_document.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_remove_known_song_not_found(
-        self,
-        known_songs_service: KnownSongsService,
-        mock_firestore_service: MagicMock,
-    ) -> None:
-        """Test removing a non-existent song."""
-        mock_firestore_service.get_document.return_value = None
-
-        result = await known_songs_service.remove_known_song(
-            user_id="user-123",
-            song_id=999,
-        )
-
-        assert result is False
+        assert result is expected
+        assert mock_firestore_service.delete_document.called is delete_called
 
-    @pytest.mark.asyncio
     async def test_get_known_songs_pagination(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
     ) -> None:
         """Test listing known songs with pagination."""
-        mock_firestore_service.count_documents = AsyncMock(return_value=25)
-        mock_firestore_service.query_documents = AsyncMock(
-            return_value=[{"id": "user-123:1", "song_id": "1", "artist": "Queen", "title": "Test"}]
-        )
+        mock_firestore_service.count_documents.return_value = 25
+        mock_firestore_service.query_documents.return_value = [
+            {"id": "user-123:1", "song_id": "1", "artist": "Queen", "title": "Test"}
+        ]
 
         result = await known_songs_service.get_known_songs(
             user_id="user-123",
@@ -492,31 +568,15 @@ class TestKnownSongsServiceUnit:
         assert call_kwargs["offset"] == 10  # (page-1) * per_page
         assert call_kwargs["limit"] == 10
 
-    @pytest.mark.asyncio
     async def test_bulk_add_known_songs(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
+        fake_bigquery: FakeBigQueryClient,
     ) -> None:
         """Test bulk adding known songs."""
-
         # Mock BigQuery to return song details for both songs
-        def mock_query(sql: str, job_config: Any = None) -> MagicMock:
-            result = MagicMock()
-            # Return result for songs 1 and 2
-            mock_row_1 = MagicMock()
-            mock_row_1.id = "1"
-            mock_row_1.artist = "Queen"
-            mock_row_1.title = "Bohemian Rhapsody"
-            mock_row_2 = MagicMock()
-            mock_row_2.id = "2"
-            mock_row_2.artist = "Journey"
-            mock_row_2.title = "Don't Stop Believin'"
-
-            result.result.return_value = [mock_row_1, mock_row_2]
-            return result
-
-        known_songs_service._bigquery_client.query.side_effect = mock_query  # type: ignore[union-attr]
+        fake_bigquery.rows = [QUEEN_ROW, JOURNEY_ROW]
 
         # First call returns None (new), second call returns existing
         mock_firestore_service.get_document.side_effect = [None, {"id": "existing"}]
@@ -539,208 +599,160 @@ class TestKnownSongsServiceUnit:
 class TestSetEnjoySinging:
     """Tests for POST /api/known-songs/enjoy-singing."""
 
-    def test_set_enjoy_singing_success(
+    async def _post(
         self,
-        known_songs_client: TestClient,
-        mock_known_songs_service: MagicMock,
-    ) -> None:
-        """Test setting enjoy singing metadata on a song."""
-        response = known_songs_client.post(
+        client: AsyncClient,
+        song_id: str,
+        payload: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """POST to the enjoy singing endpoint for ``song_id``."""
+        return await client.post(
             "/api/known-songs/enjoy-singing",
-            headers={"Authorization": "Bearer test-token"},
-            params={"song_id": "1"},
-            json={
-                "singing_tags": ["crowd_pleaser", "shows_range"],
-                "singing_energy": "emotional_powerhouse",
-                "vocal_comfort": "challenging",
-                "notes": "Great song for the finale!",
-            },
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["success"] is True
-        assert data["song_id"] == "1"
-        assert data["enjoy_singing"] is True
-        assert "crowd_pleaser" in data["singing_tags"]
-        assert data["singing_energy"] == "emotional_powerhouse"
-        assert data["vocal_comfort"] == "challenging"
-
-    def test_set_enjoy_singing_minimal_data(
+            headers=headers,
+            params={"song_id": song_id},
+            json=payload,
+        )
+
+    @pytest.mark.parametrize(
+        ("payload", "service_result", "expected_data"),
+        [
+            pytest.param(
+                {
+                    "singing_tags": ["crowd_pleaser", "shows_range"],
+                    "singing_energy": "emotional_powerhouse",
+                    "vocal_comfort": "challenging",
+                    "notes": "Great song for the finale!",
+                },
+                KNOWN_SONGS_SERVICE_DEFAULTS["set_enjoy_singing"],
+                {
+                    "success": True,
+                    "song_id": "1",
+                    "enjoy_singing": True,
+                    "singing_tags": ["crowd_pleaser", "shows_range"],
+                    "singing_energy": "emotional_powerhouse",
+                    "vocal_comfort": "challenging",
+                },
+                id="success",
+            ),
+            pytest.param(
+                {},  # No optional fields
+                MINIMAL_ENJOY_SINGING_RESULT,
+                {"success": True, "singing_tags": [], "singing_energy": None},
+                id="minimal_data",
+            ),
+            pytest.param(
+                {"singing_tags": ["easy_to_sing"]},
+                replace(MINIMAL_ENJOY_SINGING_RESULT, singing_tags=["easy_to_sing"], created_new=True),
+                {"created_new": True},
+                id="creates_new_song",
+            ),
+        ],
+    )
+    async def test_set_enjoy_singing(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
         mock_known_songs_service: MagicMock,
+        payload: dict[str, Any],
+        service_result: SetEnjoySingingResult,
+        expected_data: dict[str, Any],
     ) -> None:
-        """Test setting enjoy singing with minimal/empty metadata."""
-        mock_known_songs_service.set_enjoy_singing.return_value = SetEnjoySingingResult(
-            success=True,
-            song_id="1",
-            artist="Queen",
-            title="Bohemian Rhapsody",
-            enjoy_singing=True,
-            singing_tags=[],
-            singing_energy=None,
-            vocal_comfort=None,
-            notes=None,
-            created_new=False,
-        )
+        """Test setting enjoy singing metadata returns the service result."""
+        mock_known_songs_service.set_enjoy_singing.return_value = service_result
 
-        response = known_songs_client.post(
-            "/api/known-songs/enjoy-singing",
-            headers={"Authorization": "Bearer test-token"},
-            params={"song_id": "1"},
-            json={},  # No optional fields
-        )
+        response = await self._post(known_songs_client, "1", payload, AUTH_HEADERS)
 
-        assert response.status_code == 201
+        assert_status(response, 201)
         data = response.json()
-        assert data["success"] is True
-        assert data["singing_tags"] == []
-        assert data["singing_energy"] is None
-
-    def test_set_enjoy_singing_creates_new_song(
-        self,
-        known_songs_client: TestClient,
-        mock_known_songs_service: MagicMock,
-    ) -> None:
-        """Test enjoy singing creates song if it doesn't exist."""
-        mock_known_songs_service.set_enjoy_singing.return_value = SetEnjoySingingResult(
-            success=True,
-            song_id="1",
-            artist="Queen",
-            title="Bohemian Rhapsody",
-            enjoy_singing=True,
-            singing_tags=["easy_to_sing"],
-            singing_energy=None,
-            vocal_comfort=None,
-            notes=None,
-            created_new=True,
-        )
-
-        response = known_songs_client.post(
-            "/api/known-songs/enjoy-singing",
-            headers={"Authorization": "Bearer test-token"},
-            params={"song_id": "1"},
-            json={"singing_tags": ["easy_to_sing"]},
-        )
-
-        assert response.status_code == 201
-        data = response.json()
-        assert data["created_new"] is True
-
-    def test_set_enjoy_singing_invalid_tag(
+        assert {key: data[key] for key in expected_data} == expected_data
+
+    @pytest.mark.parametrize(
+        ("song_id", "payload", "error"),
+        [
+            pytest.param(
+                "1", {"singing_tags": ["invalid_tag"]}, ValueError("Invalid singing tag: invalid_tag"), id="invalid_tag"
+            ),
+            pytest.param("999", {}, ValueError("Song with ID 999 not found"), id="song_not_found"),
+        ],
+    )
+    async def test_set_enjoy_singing_service_error_returns_400(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
         mock_known_songs_service: MagicMock,
+        song_id: str,
+        payload: dict[str, Any],
+        error: ValueError,
     ) -> None:
-        """Test setting enjoy singing with invalid tag returns error."""
-        mock_known_songs_service.set_enjoy_singing.side_effect = ValueError("Invalid singing tag: invalid_tag")
+        """Test a ValueError from the service becomes a 400 carrying its message."""
+        mock_known_songs_service.set_enjoy_singing.side_effect = error
 
-        response = known_songs_client.post(
-            "/api/known-songs/enjoy-singing",
-            headers={"Authorization": "Bearer test-token"},
-            params={"song_id": "1"},
-            json={"singing_tags": ["invalid_tag"]},
-        )
+        response = await self._post(known_songs_client, song_id, payload, AUTH_HEADERS)
 
-        assert response.status_code == 400
+        assert_status(response, 400)
+        assert response.json()["detail"] == str(error)
 
-    def test_set_enjoy_singing_song_not_found(
+    async def test_set_enjoy_singing_requires_auth(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
         mock_known_songs_service: MagicMock,
     ) -> None:
-        """Test setting enjoy singing on non-existent song returns 400."""
-        mock_known_songs_service.set_enjoy_singing.side_effect = ValueError("Song with ID 999 not found")
+        """Test setting enjoy singing without a token is rejected before reaching the service."""
+        response = await self._post(known_songs_client, "1", {})
 
-        response = known_songs_client.post(
-            "/api/known-songs/enjoy-singing",
-            headers={"Authorization": "Bearer test-token"},
-            params={"song_id": "999"},
-            json={},
-        )
-
-        assert response.status_code == 400
-
-    def test_set_enjoy_singing_requires_auth(
-        self,
-        known_songs_client: TestClient,
-    ) -> None:
-        """Test setting enjoy singing requires authentication."""
-        response = known_songs_client.post(
-            "/api/known-songs/enjoy-singing",
-            params={"song_id": "1"},
-            json={},
-        )
-
-        assert response.status_code == 401
+        assert_status(response, 401)
+        mock_known_songs_service.set_enjoy_singing.assert_not_called()
 
 
 class TestRemoveEnjoySinging:
     """Tests for DELETE /api/known-songs/enjoy-singing."""
 
-    def test_remove_enjoy_singing_success(
+    async def test_remove_enjoy_singing_success(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
         mock_known_songs_service: MagicMock,
     ) -> None:
         """Test removing enjoy singing from a song."""
-        response = known_songs_client.delete(
+        response = await known_songs_client.delete(
             "/api/known-songs/enjoy-singing",
-            headers={"Authorization": "Bearer test-token"},
-            params={"song_id": "1"},
+            headers=AUTH_HEADERS,
+            params=SONG_1_PARAMS,
         )
 
-        assert response.status_code == 204
-        mock_known_songs_service.remove_enjoy_singing.assert_called_once()
+        assert_status(response, 204)
+        mock_known_songs_service.remove_enjoy_singing.assert_called_once_with(user_id=ANY, song_id="1")
 
-    def test_remove_enjoy_singing_not_found(
+    async def test_remove_enjoy_singing_not_found(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
         mock_known_songs_service: MagicMock,
     ) -> None:
         """Test removing enjoy singing from non-existent song."""
         mock_known_songs_service.remove_enjoy_singing.return_value = False
 
-        response = known_songs_client.delete(
+        response = await known_songs_client.delete(
             "/api/known-songs/enjoy-singing",
-            headers={"Authorization": "Bearer test-token"},
+            headers=AUTH_HEADERS,
             params={"song_id": "999"},
         )
 
-        assert response.status_code == 404
+        assert_status(response, 404)
 
-    def test_remove_enjoy_singing_requires_auth(
+    async def test_remove_enjoy_singing_requires_auth(
         self,
-        known_songs_client: TestClient,
+        known_songs_client: AsyncClient,
     ) -> None:
         """Test removing enjoy singing requires authentication."""
-        response = known_songs_client.delete(
+        response = await known_songs_client.delete(
             "/api/known-songs/enjoy-singing",
-            params={"song_id": "1"},
+            params=SONG_1_PARAMS,
         )
 
-        assert response.status_code == 401
+        assert_status(response, 401)
 
 
 class TestEnjoySingingServiceUnit:
     """Unit tests for enjoy singing methods in KnownSongsService."""
 
-    @pytest.fixture
-    def known_songs_service(
-        self,
-        mock_backend_settings: MagicMock,
-        mock_firestore_service: MagicMock,
-    ) -> KnownSongsService:
-        """Create known songs service with mocked dependencies."""
-        mock_bigquery = MagicMock()
-        return KnownSongsService(
-            mock_backend_settings,
-            mock_firestore_service,
-            bigquery_client=mock_bigquery,
-        )
-
-    @pytest.mark.asyncio
     async def test_set_enjoy_singing_existing_song(
         self,
         known_songs_service: KnownSongsService,
@@ -749,10 +761,7 @@ class TestEnjoySingingServiceUnit:
         """Test setting enjoy singing on an existing song updates it."""
         # Mock existing song in user's library
         mock_firestore_service.get_document.return_value = {
-            "id": "user-123:1",
-            "song_id": "1",
-            "artist": "Queen",
-            "title": "Bohemian Rhapsody",
+            **LIBRARY_DOC,
             "source": "known_songs",
             "enjoy_singing": False,
             "singing_tags": [],
@@ -779,22 +788,18 @@ class TestEnjoySingingServiceUnit:
         assert "crowd_pleaser" in doc_data["singing_tags"]
         assert doc_data["singing_energy"] == "emotional_powerhouse"
 
-    @pytest.mark.asyncio
     async def test_set_enjoy_singing_new_song_from_catalog(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
+        fake_bigquery: FakeBigQueryClient,
     ) -> None:
         """Test setting enjoy singing on a new song creates it."""
         # Mock song not in user's library
         mock_firestore_service.get_document.return_value = None
 
         # Mock BigQuery to return song details
-        mock_result = MagicMock()
-        mock_result.id = "1"
-        mock_result.artist = "Queen"
-        mock_result.title = "Bohemian Rhapsody"
-        known_songs_service._bigquery_client.query.return_value.result.return_value = [mock_result]  # type: ignore[union-attr]
+        fake_bigquery.rows = [QUEEN_ROW]
 
         result = await known_songs_service.set_enjoy_singing(
             user_id="user-123",
@@ -813,114 +818,76 @@ class TestEnjoySingingServiceUnit:
         assert doc_data["source"] == "enjoy_singing"
         assert doc_data["enjoy_singing"] is True
 
-    @pytest.mark.asyncio
-    async def test_set_enjoy_singing_invalid_tag_raises(
-        self,
-        known_songs_service: KnownSongsService,
-        mock_firestore_service: MagicMock,
-    ) -> None:
-        """Test setting enjoy singing with invalid tag raises ValueError."""
-        mock_firestore_service.get_document.return_value = {
-            "id": "user-123:1",
-            "song_id": "1",
-            "artist": "Queen",
-            "title": "Bohemian Rhapsody",
-        }
-
-        with pytest.raises(ValueError, match="Invalid singing tag"):
-            await known_songs_service.set_enjoy_singing(
-                user_id="user-123",
-                song_id="1",
-                singing_tags=["invalid_tag"],
-            )
-
-    @pytest.mark.asyncio
-    async def test_set_enjoy_singing_invalid_energy_raises(
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            pytest.param({"singing_tags": ["invalid_tag"]}, "Invalid singing tag", id="tag"),
+            pytest.param({"singing_energy": "invalid_energy"}, "Invalid singing_energy", id="energy"),
+        ],
+    )
+    async def test_set_enjoy_singing_invalid_value_raises(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
+        kwargs: dict[str, Any],
+        match: str,
     ) -> None:
-        """Test setting enjoy singing with invalid energy raises ValueError."""
-        mock_firestore_service.get_document.return_value = {
-            "id": "user-123:1",
-            "song_id": "1",
-            "artist": "Queen",
-            "title": "Bohemian Rhapsody",
-        }
+        """Test setting enjoy singing with an invalid tag or energy raises ValueError."""
+        mock_firestore_service.get_document.return_value = dict(LIBRARY_DOC)
 
-        with pytest.raises(ValueError, match="Invalid singing_energy"):
-            await known_songs_service.set_enjoy_singing(
-                user_id="user-123",
-                song_id="1",
-                singing_energy="invalid_energy",
-            )
+        with pytest.raises(ValueError, match=match):
+            await known_songs_service.set_enjoy_singing(user_id="user-123", song_id="1", **kwargs)
 
-    @pytest.mark.asyncio
     async def test_remove_enjoy_singing_clears_metadata(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
     ) -> None:
-        """Test removing enjoy singing clears metadata but keeps song."""
-        # Mock song from spotify (should not be deleted)
+        """Test songs from another source keep the song and only clear the metadata."""
         mock_firestore_service.get_document.return_value = {
-            "id": "user-123:1",
-            "song_id": "1",
+            **LIBRARY_DOC,
             "source": "spotify",
             "enjoy_singing": True,
             "singing_tags": ["crowd_pleaser"],
         }
 
-        result = await known_songs_service.remove_enjoy_singing(
-            user_id="user-123",
-            song_id="1",
-        )
+        result = await known_songs_service.remove_enjoy_singing(user_id="user-123", song_id="1")
 
         assert result is True
         mock_firestore_service.update_document.assert_called_once()
         mock_firestore_service.delete_document.assert_not_called()
-
-        # Verify metadata was cleared
-        call_args = mock_firestore_service.update_document.call_args
-        doc_data = call_args[0][2]
+        doc_data = mock_firestore_service.update_document.call_args[0][2]
         assert doc_data["enjoy_singing"] is False
         assert doc_data["singing_tags"] == []
 
-    @pytest.mark.asyncio
     async def test_remove_enjoy_singing_deletes_if_enjoy_source(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
     ) -> None:
-        """Test removing enjoy singing deletes song if source was enjoy_singing."""
-        # Mock song with enjoy_singing source (should be deleted)
+        """Test songs added only for enjoy singing are deleted outright."""
         mock_firestore_service.get_document.return_value = {
-            "id": "user-123:1",
-            "song_id": "1",
+            **LIBRARY_DOC,
             "source": "enjoy_singing",
             "enjoy_singing": True,
         }
 
-        result = await known_songs_service.remove_enjoy_singing(
-            user_id="user-123",
-            song_id="1",
-        )
+        result = await known_songs_service.remove_enjoy_singing(user_id="user-123", song_id="1")
 
         assert result is True
         mock_firestore_service.delete_document.assert_called_once()
+        mock_firestore_service.update_document.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_remove_enjoy_singing_not_found(
         self,
         known_songs_service: KnownSongsService,
         mock_firestore_service: MagicMock,
     ) -> None:
-        """Test removing enjoy singing from non-existent song."""
+        """Test removing enjoy singing from a song not in the library writes nothing."""
         mock_firestore_service.get_document.return_value = None
 
-        result = await known_songs_service.remove_enjoy_singing(
-            user_id="user-123",
-            song_id="999",
-        )
+        result = await known_songs_service.remove_enjoy_singing(user_id="user-123", song_id="1")
 
         assert result is False
+        mock_firestore_service.update_document.assert_not_called()
+        mock_firestore_service.delete_document.assert_not_called()
@@ -1,6 +1,7 @@
 """Tests for music service service."""
 
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,8 +11,103 @@ from backend.services.music_service_service import MusicServiceError, MusicServi
 from karaoke_decide.core.exceptions import ExternalServiceError, NotFoundError, ValidationError
 from karaoke_decide.core.models import MusicService
 
+# Fixed timestamps for stored documents whose dates are never compared to the clock
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+NOW_ISO = NOW.isoformat()
+PAST_ISO = (NOW - timedelta(hours=1)).isoformat()
+
+SPOTIFY_SERVICE_DOC = {
+    "id": "user_123_spotify",
+    "user_id": "user_123",
+    "service_type": "spotify",
+    "service_user_id": "spotify-123",
+    "service_username": "SpotifyUser",
+    "created_at": NOW_ISO,
+    "updated_at": NOW_ISO,
+}
+LASTFM_SERVICE_DOC = {
+    "id": "user_123_lastfm",
+    "user_id": "user_123",
+    "service_type": "lastfm",
+    "service_user_id": "lastfm-user",
+    "service_username": "LastFmUser",
+    "created_at": NOW_ISO,
+    "updated_at": NOW_ISO,
+}
+
+# Stored OAuth states, fixed far before and after any test run
+VALID_OAUTH_STATE = {
+    "user_id": "user_123",
+    "service_type": "spotify",
+    "created_at": datetime(2024, 1, 1, 12, 0, tzinfo=UTC).isoformat(),
+    "expires_at": datetime(2100, 1, 1, tzinfo=UTC).isoformat(),
+}
+EXPIRED_OAUTH_STATE = {
+    **VALID_OAUTH_STATE,
+    "expires_at": datetime(2024, 1, 1, 12, 10, tzinfo=UTC).isoformat(),
+}
+
+
+def make_spotify_service(expires_in: timedelta, refresh_token: str | None = "refresh-token") -> MusicService:
+    """Build a Spotify connection whose access token expires ``expires_in`` from now."""
+    return MusicService(
+        id="user_123_spotify",
+        user_id="user_123",
+        service_type="spotify",
+        service_user_id="spotify-123",
+        service_username="User",
+        access_token="old-token",
+        refresh_token=refresh_token,
+        token_expires_at=datetime.now(UTC) + expires_in,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+# Default return values of the shared client mocks, restored before each test
+FIRESTORE_RETURNS: dict[str, Any] = {
+    "get_document": None,
+    "set_document": None,
+    "update_document": None,
+    "delete_document": None,
+    "delete_document_atomically": None,
+    "query_documents": [],
+}
+SPOTIFY_RETURNS: dict[str, Any] = {
+    "get_auth_url": "https://accounts.spotify.com/authorize?...",
+    "exchange_code": {
+        "access_token": "test-access-token",
+        "refresh_token": "test-refresh-token",
+        "expires_in": 3600,
+    },
+    "refresh_token": {
+        "access_token": "new-access-token",
+        "expires_in": 3600,
+    },
+    "get_current_user": {
+        "id": "spotify-user-123",
+        "display_name": "Test Spotify User",
+    },
+}
+LASTFM_RETURNS: dict[str, Any] = {
+    "get_user_info": {
+        "user": {
+            "name": "testlastfmuser",
+            "playcount": "12345",
+        }
+    },
+}
+
+
+def build_client_mock(returns: dict[str, Any], sync_methods: frozenset[str] = frozenset()) -> MagicMock:
+    """Build a mock with an AsyncMock (or MagicMock for ``sync_methods``) per method in ``returns``."""
+    mock = MagicMock()
+    for name in returns:
+        setattr(mock, name, MagicMock() if name in sync_methods else AsyncMock())
+    return mock
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_settings() -> BackendSettings:
     """Create mock backend settings."""
     return BackendSettings(
@@ -25,68 +121,49 @@ def mock_settings() -> BackendSettings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_firestore() -> MagicMock:
-    """Create mock Firestore service."""
-    mock = MagicMock()
-    mock.get_document = AsyncMock(return_value=None)
-    mock.set_document = AsyncMock(return_value=None)
-    mock.update_document = AsyncMock(return_value=None)
-    mock.delete_document = AsyncMock(return_value=None)
-    mock.query_documents = AsyncMock(return_value=[])
-    return mock
+    """Create mock Firestore service, once per module."""
+    return build_client_mock(FIRESTORE_RETURNS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_spotify_client() -> MagicMock:
-    """Create mock Spotify client."""
-    mock = MagicMock()
-    mock.get_auth_url = MagicMock(return_value="https://accounts.spotify.com/authorize?...")
-    mock.exchange_code = AsyncMock(
-        return_value={
-            "access_token": "test-access-token",
-            "refresh_token": "test-refresh-token",
-            "expires_in": 3600,
-        }
-    )
-    mock.refresh_token = AsyncMock(
-        return_value={
-            "access_token": "new-access-token",
-            "expires_in": 3600,
-        }
-    )
-    mock.get_current_user = AsyncMock(
-        return_value={
-            "id": "spotify-user-123",
-            "display_name": "Test Spotify User",
-        }
-    )
-    return mock
+    """Create mock Spotify client, once per module."""
+    return build_client_mock(SPOTIFY_RETURNS, sync_methods=frozenset({"get_auth_url"}))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_lastfm_client() -> MagicMock:
-    """Create mock Last.fm client."""
-    mock = MagicMock()
-    mock.get_user_info = AsyncMock(
-        return_value={
-            "user": {
-                "name": "testlastfmuser",
-                "playcount": "12345",
-            }
-        }
-    )
-    return mock
+    """Create mock Last.fm client, once per module."""
+    return build_client_mock(LASTFM_RETURNS)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_client_mocks(
+    mock_firestore: MagicMock,
+    mock_spotify_client: MagicMock,
+    mock_lastfm_client: MagicMock,
+) -> None:
+    """Clear calls and side effects left on the shared mocks and restore their return values."""
+    for mock, returns in (
+        (mock_firestore, FIRESTORE_RETURNS),
+        (mock_spotify_client, SPOTIFY_RETURNS),
+        (mock_lastfm_client, LASTFM_RETURNS),
+    ):
+        mock.reset_mock(return_value=True, side_effect=True)
+        for name, value in returns.items():
+            getattr(mock, name).return_value = value
+
+
+@pytest.fixture(scope="module")
 def service(
     mock_settings: BackendSettings,
     mock_firestore: MagicMock,
     mock_spotify_client: MagicMock,
     mock_lastfm_client: MagicMock,
 ) -> MusicServiceService:
-    """Create MusicServiceService with all mocks."""
+    """Create MusicServiceService with all mocks, once per module."""
     return MusicServiceService(
         settings=mock_settings,
         firestore=mock_firestore,
@@ -95,10 +172,12 @@ def service(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_spotify_service() -> MusicService:
-    """Create a sample Spotify service."""
-    now = datetime.now(UTC)
+    """Create a sample Spotify service whose token expires an hour from now, once per module.
+
+    Tests only read it; the service never mutates the connections it is given.
+    """
     return MusicService(
         id="user_123_spotify",
         user_id="user_123",
@@ -107,21 +186,20 @@ def sample_spotify_service() -> MusicService:
         service_username="Test User",
         access_token="valid-token",
         refresh_token="refresh-token",
-        token_expires_at=now + timedelta(hours=1),
+        token_expires_at=datetime.now(UTC) + timedelta(hours=1),
         last_sync_at=None,
         sync_status="idle",
         sync_error=None,
         tracks_synced=0,
         songs_synced=0,
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
 class TestOAuthStateManagement:
     """Tests for OAuth state creation and verification."""
 
-    @pytest.mark.asyncio
     async def test_create_oauth_state(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
         """OAuth state is created and stored."""
         state = await service.create_oauth_state("user_123", "spotify")
@@ -137,139 +215,82 @@ class TestOAuthStateManagement:
         assert stored_data["user_id"] == "user_123"
         assert stored_data["service_type"] == "spotify"
 
-    @pytest.mark.asyncio
-    async def test_verify_oauth_state_valid(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
-        """Valid OAuth state returns user_id and service_type."""
-        now = datetime.now(UTC)
-        mock_firestore.delete_document_atomically = AsyncMock(
-            return_value={
-                "user_id": "user_123",
-                "service_type": "spotify",
-                "created_at": now.isoformat(),
-                "expires_at": (now + timedelta(minutes=5)).isoformat(),
-            }
-        )
-
-        result = await service.verify_oauth_state("valid-state")
-
-        assert result is not None
-        assert result["user_id"] == "user_123"
-        assert result["service_type"] == "spotify"
-        # State should be atomically deleted during verification
-        mock_firestore.delete_document_atomically.assert_called_once_with("oauth_states", "valid-state")
-
-    @pytest.mark.asyncio
-    async def test_verify_oauth_state_not_found(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
-        """Non-existent OAuth state returns None."""
-        mock_firestore.delete_document_atomically = AsyncMock(return_value=None)
-
-        result = await service.verify_oauth_state("invalid-state")
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_verify_oauth_state_expired(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
-        """Expired OAuth state returns None (already deleted atomically)."""
-        past = datetime.now(UTC) - timedelta(minutes=15)
-        mock_firestore.delete_document_atomically = AsyncMock(
-            return_value={
-                "user_id": "user_123",
-                "service_type": "spotify",
-                "created_at": past.isoformat(),
-                "expires_at": (past + timedelta(minutes=10)).isoformat(),
-            }
-        )
+    @pytest.mark.parametrize(
+        ("stored_state", "expected"),
+        [
+            pytest.param(VALID_OAUTH_STATE, {"user_id": "user_123", "service_type": "spotify"}, id="valid"),
+            pytest.param(None, None, id="not_found"),
+            # Expired states are still consumed by the atomic delete
+            pytest.param(EXPIRED_OAUTH_STATE, None, id="expired"),
+        ],
+    )
+    async def test_verify_oauth_state(
+        self,
+        service: MusicServiceService,
+        mock_firestore: MagicMock,
+        stored_state: dict[str, str] | None,
+        expected: dict[str, str] | None,
+    ) -> None:
+        """OAuth state verification returns user_id and service_type only for unexpired states."""
+        mock_firestore.delete_document_atomically.return_value = stored_state
 
-        result = await service.verify_oauth_state("expired-state")
+        result = await service.verify_oauth_state("oauth-state")
 
-        assert result is None
-        # Document was already deleted atomically, even though expired
-        mock_firestore.delete_document_atomically.assert_called_once()
+        assert result == expected
+        # State should be atomically deleted during verification
+        mock_firestore.delete_document_atomically.assert_called_once_with("oauth_states", "oauth-state")
 
 
 class TestServiceCRUD:
     """Tests for service CRUD operations."""
 
-    @pytest.mark.asyncio
-    async def test_get_user_services_empty(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
-        """Returns empty list when no services connected."""
-        mock_firestore.query_documents = AsyncMock(return_value=[])
+    @pytest.mark.parametrize(
+        ("docs", "expected_types"),
+        [
+            pytest.param([], [], id="empty"),
+            pytest.param([SPOTIFY_SERVICE_DOC, LASTFM_SERVICE_DOC], ["spotify", "lastfm"], id="two_services"),
+        ],
+    )
+    async def test_get_user_services(
+        self,
+        service: MusicServiceService,
+        mock_firestore: MagicMock,
+        docs: list[dict[str, str]],
+        expected_types: list[str],
+    ) -> None:
+        """Returns the user's connected services in stored order."""
+        mock_firestore.query_documents.return_value = docs
 
         result = await service.get_user_services("user_123")
 
-        assert result == []
+        assert [music_service.service_type for music_service in result] == expected_types
         mock_firestore.query_documents.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_get_user_services_with_services(
-        self, service: MusicServiceService, mock_firestore: MagicMock
+    @pytest.mark.parametrize(
+        ("doc", "expected_service_type"),
+        [
+            pytest.param(SPOTIFY_SERVICE_DOC, "spotify", id="found"),
+            pytest.param(None, None, id="not_found"),
+        ],
+    )
+    async def test_get_service(
+        self,
+        service: MusicServiceService,
+        mock_firestore: MagicMock,
+        doc: dict[str, str] | None,
+        expected_service_type: str | None,
     ) -> None:
-        """Returns list of connected services."""
-        now = datetime.now(UTC)
-        mock_firestore.query_documents = AsyncMock(
-            return_value=[
-                {
-                    "id": "user_123_spotify",
-                    "user_id": "user_123",
-                    "service_type": "spotify",
-                    "service_user_id": "spotify-123",
-                    "service_username": "SpotifyUser",
-                    "created_at": now.isoformat(),
-                    "updated_at": now.isoformat(),
-                },
-                {
-                    "id": "user_123_lastfm",
-                    "user_id": "user_123",
-                    "service_type": "lastfm",
-                    "service_user_id": "lastfm-user",
-                    "service_username": "LastFmUser",
-                    "created_at": now.isoformat(),
-                    "updated_at": now.isoformat(),
-                },
-            ]
-        )
-
-        result = await service.get_user_services("user_123")
-
-        assert len(result) == 2
-        assert result[0].service_type == "spotify"
-        assert result[1].service_type == "lastfm"
-
-    @pytest.mark.asyncio
-    async def test_get_service_found(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
-        """Returns service when found."""
-        now = datetime.now(UTC)
-        mock_firestore.get_document = AsyncMock(
-            return_value={
-                "id": "user_123_spotify",
-                "user_id": "user_123",
-                "service_type": "spotify",
-                "service_user_id": "spotify-123",
-                "service_username": "SpotifyUser",
-                "created_at": now.isoformat(),
-                "updated_at": now.isoformat(),
-            }
-        )
+        """Returns the stored service, or None when there is none."""
+        mock_firestore.get_document.return_value = doc
 
         result = await service.get_service("user_123", "spotify")
 
-        assert result is not None
-        assert result.service_type == "spotify"
+        assert (result.service_type if result else None) == expected_service_type
         mock_firestore.get_document.assert_called_once_with("music_services", "user_123_spotify")
 
-    @pytest.mark.asyncio
-    async def test_get_service_not_found(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
-        """Returns None when service not found."""
-        mock_firestore.get_document = AsyncMock(return_value=None)
-
-        result = await service.get_service("user_123", "spotify")
-
-        assert result is None
-
-    @pytest.mark.asyncio
     async def test_create_spotify_service_new(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
         """Creates new Spotify service connection."""
-        mock_firestore.get_document = AsyncMock(return_value=None)  # No existing service
+        mock_firestore.get_document.return_value = None  # No existing service
 
         tokens = {
             "access_token": "new-access-token",
@@ -289,7 +310,6 @@ class TestServiceCRUD:
         assert result.access_token == "new-access-token"
         mock_firestore.set_document.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_spotify_service_update_existing(
         self,
         service: MusicServiceService,
@@ -298,21 +318,18 @@ class TestServiceCRUD:
     ) -> None:
         """Updates existing Spotify service connection."""
         # Mock existing service
-        now = datetime.now(UTC)
-        mock_firestore.get_document = AsyncMock(
-            return_value={
-                "id": sample_spotify_service.id,
-                "user_id": sample_spotify_service.user_id,
-                "service_type": "spotify",
-                "service_user_id": sample_spotify_service.service_user_id,
-                "service_username": sample_spotify_service.service_username,
-                "access_token": "old-token",
-                "refresh_token": sample_spotify_service.refresh_token,
-                "token_expires_at": (now - timedelta(hours=1)).isoformat(),
-                "created_at": sample_spotify_service.created_at.isoformat(),
-                "updated_at": sample_spotify_service.updated_at.isoformat(),
-            }
-        )
+        mock_firestore.get_document.return_value = {
+            "id": sample_spotify_service.id,
+            "user_id": sample_spotify_service.user_id,
+            "service_type": "spotify",
+            "service_user_id": sample_spotify_service.service_user_id,
+            "service_username": sample_spotify_service.service_username,
+            "access_token": "old-token",
+            "refresh_token": sample_spotify_service.refresh_token,
+            "token_expires_at": PAST_ISO,
+            "created_at": sample_spotify_service.created_at.isoformat(),
+            "updated_at": sample_spotify_service.updated_at.isoformat(),
+        }
 
         tokens = {
             "access_token": "updated-access-token",
@@ -328,10 +345,9 @@ class TestServiceCRUD:
         assert result.refresh_token == sample_spotify_service.refresh_token
         mock_firestore.update_document.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_lastfm_service(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
         """Creates Last.fm service connection."""
-        mock_firestore.get_document = AsyncMock(return_value=None)  # No existing service
+        mock_firestore.get_document.return_value = None  # No existing service
 
         result = await service.create_lastfm_service("user_123", "testlastfmuser")
 
@@ -340,195 +356,127 @@ class TestServiceCRUD:
         assert result.access_token is None  # Last.fm doesn't use OAuth tokens
         mock_firestore.set_document.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_create_lastfm_service_invalid_user(
         self, service: MusicServiceService, mock_lastfm_client: MagicMock
     ) -> None:
         """Raises ValidationError for invalid Last.fm username."""
-        mock_lastfm_client.get_user_info = AsyncMock(side_effect=ExternalServiceError("Last.fm", "User not found"))
+        mock_lastfm_client.get_user_info.side_effect = ExternalServiceError("Last.fm", "User not found")
 
         with pytest.raises(ValidationError, match="Invalid Last.fm username"):
             await service.create_lastfm_service("user_123", "nonexistentuser")
 
-    @pytest.mark.asyncio
-    async def test_delete_service(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
-        """Deletes service connection."""
-        now = datetime.now(UTC)
-        mock_firestore.get_document = AsyncMock(
-            return_value={
-                "id": "user_123_spotify",
-                "user_id": "user_123",
-                "service_type": "spotify",
-                "created_at": now.isoformat(),
-                "updated_at": now.isoformat(),
-            }
-        )
+    @pytest.mark.parametrize(
+        "doc",
+        [
+            pytest.param(SPOTIFY_SERVICE_DOC, id="found"),
+            pytest.param(None, id="not_found"),
+        ],
+    )
+    async def test_delete_service(
+        self,
+        service: MusicServiceService,
+        mock_firestore: MagicMock,
+        doc: dict[str, str] | None,
+    ) -> None:
+        """Deletes an existing service connection and raises NotFoundError for a missing one."""
+        mock_firestore.get_document.return_value = doc
+
+        if doc is None:
+            with pytest.raises(NotFoundError):
+                await service.delete_service("user_123", "spotify")
+            mock_firestore.delete_document.assert_not_called()
+            return
 
         await service.delete_service("user_123", "spotify")
 
         mock_firestore.delete_document.assert_called_once_with("music_services", "user_123_spotify")
 
-    @pytest.mark.asyncio
-    async def test_delete_service_not_found(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
-        """Raises NotFoundError when deleting non-existent service."""
-        mock_firestore.get_document = AsyncMock(return_value=None)
-
-        with pytest.raises(NotFoundError):
-            await service.delete_service("user_123", "spotify")
-
 
 class TestSyncStatus:
     """Tests for sync status updates."""
 
-    @pytest.mark.asyncio
-    async def test_update_sync_status_syncing(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
-        """Updates sync status to syncing."""
-        await service.update_sync_status("user_123", "spotify", "syncing")
-
-        mock_firestore.update_document.assert_called_once()
-        call_args = mock_firestore.update_document.call_args
-        assert call_args[0][2]["sync_status"] == "syncing"
-
-    @pytest.mark.asyncio
-    async def test_update_sync_status_error(self, service: MusicServiceService, mock_firestore: MagicMock) -> None:
-        """Updates sync status to error with message."""
-        await service.update_sync_status("user_123", "spotify", "error", error="Rate limited")
-
-        call_args = mock_firestore.update_document.call_args
-        assert call_args[0][2]["sync_status"] == "error"
-        assert call_args[0][2]["sync_error"] == "Rate limited"
-
-    @pytest.mark.asyncio
-    async def test_update_sync_status_idle_with_count(
-        self, service: MusicServiceService, mock_firestore: MagicMock
+    @pytest.mark.parametrize(
+        ("call_kwargs", "expected"),
+        [
+            pytest.param({"status": "syncing"}, {"sync_status": "syncing"}, id="syncing"),
+            pytest.param(
+                {"status": "error", "error": "Rate limited"},
+                {"sync_status": "error", "sync_error": "Rate limited"},
+                id="error",
+            ),
+            pytest.param(
+                {"status": "idle", "tracks_synced": 150},
+                {"sync_status": "idle", "tracks_synced": 150},
+                id="idle_with_count",
+            ),
+        ],
+    )
+    async def test_update_sync_status(
+        self,
+        service: MusicServiceService,
+        mock_firestore: MagicMock,
+        call_kwargs: dict[str, Any],
+        expected: dict[str, Any],
     ) -> None:
-        """Updates sync status to idle with track count."""
-        await service.update_sync_status("user_123", "spotify", "idle", tracks_synced=150)
+        """Writes the new sync status, plus the error or track count and sync time when given."""
+        await service.update_sync_status("user_123", "spotify", **call_kwargs)
 
-        call_args = mock_firestore.update_document.call_args
-        assert call_args[0][2]["sync_status"] == "idle"
-        assert call_args[0][2]["tracks_synced"] == 150
-        assert "last_sync_at" in call_args[0][2]
+        mock_firestore.update_document.assert_called_once()
+        update_data = mock_firestore.update_document.call_args[0][2]
+        assert expected.items() <= update_data.items()
+        assert ("last_sync_at" in update_data) == (call_kwargs["status"] == "idle")
 
 
 class TestTokenRefresh:
     """Tests for token refresh functionality."""
 
-    @pytest.mark.asyncio
-    async def test_refresh_token_when_expired(
+    @pytest.mark.parametrize(
+        ("expires_in", "refresh_token", "refresh_error", "expected_token", "error_match"),
+        [
+            pytest.param(timedelta(hours=1), "refresh-token", None, "old-token", None, id="valid"),
+            pytest.param(-timedelta(minutes=10), "refresh-token", None, "new-access-token", None, id="expired"),
+            # Tokens expiring within the 5 minute buffer are refreshed early
+            pytest.param(timedelta(minutes=2), "refresh-token", None, "new-access-token", None, id="within_buffer"),
+            pytest.param(-timedelta(minutes=10), None, None, None, "No refresh token", id="no_refresh_token"),
+            pytest.param(
+                -timedelta(minutes=10),
+                "invalid-refresh-token",
+                ExternalServiceError("Spotify", "Invalid refresh token"),
+                None,
+                "Failed to refresh",
+                id="spotify_error",
+            ),
+        ],
+    )
+    async def test_refresh_spotify_token_if_needed(
         self,
         service: MusicServiceService,
         mock_firestore: MagicMock,
         mock_spotify_client: MagicMock,
+        expires_in: timedelta,
+        refresh_token: str | None,
+        refresh_error: Exception | None,
+        expected_token: str | None,
+        error_match: str | None,
     ) -> None:
-        """Refreshes token when expired."""
-        now = datetime.now(UTC)
-        expired_service = MusicService(
-            id="user_123_spotify",
-            user_id="user_123",
-            service_type="spotify",
-            service_user_id="spotify-123",
-            service_username="User",
-            access_token="old-token",
-            refresh_token="refresh-token",
-            token_expires_at=now - timedelta(minutes=10),  # Expired
-            created_at=now,
-            updated_at=now,
-        )
-
-        result = await service.refresh_spotify_token_if_needed(expired_service)
-
-        assert result.access_token == "new-access-token"
-        mock_spotify_client.refresh_token.assert_called_once_with("refresh-token")
-        mock_firestore.update_document.assert_called_once()
+        """Refreshes the token only when expired or nearly so, and surfaces refresh failures."""
+        mock_spotify_client.refresh_token.side_effect = refresh_error
+        spotify_service = make_spotify_service(expires_in, refresh_token)
 
-    @pytest.mark.asyncio
-    async def test_no_refresh_when_valid(
-        self,
-        service: MusicServiceService,
-        mock_spotify_client: MagicMock,
-        sample_spotify_service: MusicService,
-    ) -> None:
-        """Does not refresh token when still valid."""
-        result = await service.refresh_spotify_token_if_needed(sample_spotify_service)
+        if error_match is not None:
+            with pytest.raises(MusicServiceError, match=error_match):
+                await service.refresh_spotify_token_if_needed(spotify_service)
+            return
 
-        assert result.access_token == sample_spotify_service.access_token
-        mock_spotify_client.refresh_token.assert_not_called()
+        result = await service.refresh_spotify_token_if_needed(spotify_service)
 
-    @pytest.mark.asyncio
-    async def test_refresh_within_buffer(
-        self,
-        service: MusicServiceService,
-        mock_firestore: MagicMock,
-        mock_spotify_client: MagicMock,
-    ) -> None:
-        """Refreshes token when within buffer window."""
-        now = datetime.now(UTC)
-        expiring_soon = MusicService(
-            id="user_123_spotify",
-            user_id="user_123",
-            service_type="spotify",
-            service_user_id="spotify-123",
-            service_username="User",
-            access_token="old-token",
-            refresh_token="refresh-token",
-            token_expires_at=now + timedelta(minutes=2),  # Within 5 min buffer
-            created_at=now,
-            updated_at=now,
-        )
-
-        result = await service.refresh_spotify_token_if_needed(expiring_soon)
+        assert result.access_token == expected_token
+        if expected_token == "old-token":
+            mock_spotify_client.refresh_token.assert_not_called()
+        else:
+            mock_spotify_client.refresh_token.assert_called_once_with(refresh_token)
+            mock_firestore.update_document.assert_called_once()
 
-        assert result.access_token == "new-access-token"
-        mock_spotify_client.refresh_token.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_refresh_fails_no_refresh_token(self, service: MusicServiceService) -> None:
-        """Raises error when no refresh token available."""
-        now = datetime.now(UTC)
-        no_refresh = MusicService(
-            id="user_123_spotify",
-            user_id="user_123",
-            service_type="spotify",
-            service_user_id="spotify-123",
-            service_username="User",
-            access_token="old-token",
-            refresh_token=None,  # No refresh token
-            token_expires_at=now - timedelta(minutes=10),
-            created_at=now,
-            updated_at=now,
-        )
-
-        with pytest.raises(MusicServiceError, match="No refresh token"):
-            await service.refresh_spotify_token_if_needed(no_refresh)
-
-    @pytest.mark.asyncio
-    async def test_refresh_fails_spotify_error(
-        self, service: MusicServiceService, mock_spotify_client: MagicMock
-    ) -> None:
-        """Raises error when Spotify refresh fails."""
-        now = datetime.now(UTC)
-        expired_service = MusicService(
-            id="user_123_spotify",
-            user_id="user_123",
-            service_type="spotify",
-            service_user_id="spotify-123",
-            service_username="User",
-            access_token="old-token",
-            refresh_token="invalid-refresh-token",
-            token_expires_at=now - timedelta(minutes=10),
-            created_at=now,
-            updated_at=now,
-        )
-
-        mock_spotify_client.refresh_token = AsyncMock(
-            side_effect=ExternalServiceError("Spotify", "Invalid refresh token")
-        )
-
-        with pytest.raises(MusicServiceError, match="Failed to refresh"):
-            await service.refresh_spotify_token_if_needed(expired_service)
-
-    @pytest.mark.asyncio
     async def test_get_valid_spotify_token(
         self,
         service: MusicServiceService,
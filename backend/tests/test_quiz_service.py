@@ -24,6 +24,7 @@ def mock_firestore() -> MagicMock:
     """Create mock Firestore service."""
     mock = MagicMock()
     mock.get_document = AsyncMock(return_value=None)
+    mock.get_documents = AsyncMock(return_value=[])
     mock.set_document = AsyncMock(return_value=None)
     mock.update_document = AsyncMock(return_value=None)
     mock.query_documents = AsyncMock(return_value=[])
@@ -173,12 +174,14 @@ class TestSubmitQuiz:
     ) -> None:
         """Doesn't duplicate existing UserSong records."""
         # Mock song already exists
-        mock_firestore.get_document = AsyncMock(
-            return_value={
-                "id": "user_123:1",
-                "user_id": "user_123",
-                "song_id": "1",
-            }
+        mock_firestore.get_documents = AsyncMock(
+            return_value=[
+                {
+                    "id": "user_123:1",
+                    "user_id": "user_123",
+                    "song_id": "1",
+                }
+            ]
         )
 
         # Mock BigQuery
@@ -206,6 +209,7 @@ class TestSubmitQuiz:
         )
 
         assert result.songs_added == 0
+        mock_firestore.get_documents.assert_awaited_once_with("user_songs", ["user_123:1"])
 
     @pytest.mark.asyncio
     async def test_updates_user_profile(
@@ -1,6 +1,7 @@
 """Tests for services API routes."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -193,6 +194,7 @@ def auth_client(
     mock_catalog_service: MagicMock,
     mock_firestore_service: MagicMock,
     mock_cloud_tasks_service: MagicMock,
+    override_deps: Callable[..., AbstractContextManager[None]],
 ) -> Generator[TestClient, None, None]:
     """Create test client with mocked services."""
     from backend.api import deps
@@ -205,10 +207,8 @@ def auth_client(
     async def get_firestore_override() -> MagicMock:
         return mock_firestore_service
 
-    app.dependency_overrides[deps.get_settings] = get_settings_override
-    app.dependency_overrides[deps.get_firestore] = get_firestore_override
-
     with (
+        override_deps({deps.get_settings: get_settings_override, deps.get_firestore: get_firestore_override}),
         patch("backend.api.deps.get_backend_settings", return_value=mock_settings),
         patch("backend.api.deps.get_music_service_service", return_value=mock_music_service_service),
         patch("backend.api.deps.get_sync_service", return_value=mock_sync_service),
@@ -218,9 +218,6 @@ def auth_client(
     ):
         yield TestClient(app)
 
-    # Clean up overrides
-    app.dependency_overrides.clear()
-
 
 class TestListServices:
     """Tests for GET /api/services."""
@@ -215,10 +215,11 @@ export const api = {
           brand_count: number;
           is_popular: boolean;
         }>;
-        total: number;
+        total: number | null;
         page: number;
         per_page: number;
         has_more: boolean;
+        next_cursor: string | null;
       }>(`/api/catalog/songs?q=${encodeURIComponent(query)}&per_page=${perPage}`),
 
     getPopularSongs: (limit: number = 20) =>
@@ -167,18 +167,42 @@ class BigQueryCatalogService:
         limit: int = 20,
         offset: int = 0,
         min_brands: int = 0,
+        after: tuple[int, int] | None = None,
     ) -> list[SongResult]:
         """Search songs by artist or title.
 
+        Results are ordered by (brand_count, id) descending so they can be paged
+        with a keyset cursor: pass the last row's ``(brand_count, id)`` as
+        ``after`` to continue from it without scanning and discarding
+        ``offset`` rows.
+
         Args:
             query: Search term (matches artist or title)
             limit: Max results to return
-            offset: Pagination offset
+            offset: Pagination offset (deprecated; ignored when ``after`` is set)
             min_brands: Minimum number of karaoke brands (popularity filter)
+            after: Keyset cursor ``(brand_count, id)`` of the last row already seen
 
         Returns:
             List of matching songs
         """
+        keyset_filter = ""
+        query_parameters = [
+            bigquery.ScalarQueryParameter("query", "STRING", f"%{query}%"),
+            bigquery.ScalarQueryParameter("min_brands", "INT64", min_brands),
+            bigquery.ScalarQueryParameter("limit", "INT64", limit),
+        ]
+        if after is not None:
+            keyset_filter = (
+                "AND (brand_count < @after_brand_count OR (brand_count = @after_brand_count AND id < @after_id))"
+            )
+            query_parameters += [
+                bigquery.ScalarQueryParameter("after_brand_count", "INT64", after[0]),
+                bigquery.ScalarQueryParameter("after_id", "INT64", after[1]),
+            ]
+            offset = 0
+        query_parameters.append(bigquery.ScalarQueryParameter("offset", "INT64", offset))
+
         sql = f"""
             SELECT * FROM (
                 SELECT
@@ -193,18 +217,12 @@ class BigQueryCatalogService:
                     OR LOWER(Title) LIKE LOWER(@query)
             )
             WHERE brand_count >= @min_brands
-            ORDER BY brand_count DESC, Artist, Title
+            {keyset_filter}
+            ORDER BY brand_count DESC, id DESC
             LIMIT @limit OFFSET @offset
         """
 
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("query", "STRING", f"%{query}%"),
-                bigquery.ScalarQueryParameter("min_brands", "INT64", min_brands),
-                bigquery.ScalarQueryParameter("limit", "INT64", limit),
-                bigquery.ScalarQueryParameter("offset", "INT64", offset),
-            ]
-        )
+        job_config = bigquery.QueryJobConfig(query_parameters=query_parameters)
 
         results = self.client.query(sql, job_config=job_config).result()
         return [
@@ -331,6 +349,41 @@ class BigQueryCatalogService:
             for row in results
         ]
 
+    def count_matching_songs(
+        self,
+        query: str | None = None,
+        artist: str | None = None,
+        min_brands: int = 0,
+    ) -> int:
+        """Count songs matching the same filters as a catalog search.
+
+        Args:
+            query: Search term (matches artist or title), as in search_songs
+            artist: Exact artist match (case-insensitive), as in get_songs_by_artist
+            min_brands: Minimum number of karaoke brands
+
+        Returns:
+            Number of matching songs
+        """
+        conditions = ["ARRAY_LENGTH(SPLIT(Brands, ',')) >= @min_brands"]
+        query_parameters = [bigquery.ScalarQueryParameter("min_brands", "INT64", min_brands)]
+        if query is not None:
+            conditions.append("(LOWER(Artist) LIKE LOWER(@query) OR LOWER(Title) LIKE LOWER(@query))")
+            query_parameters.append(bigquery.ScalarQueryParameter("query", "STRING", f"%{query}%"))
+        if artist is not None:
+            conditions.append("LOWER(Artist) = LOWER(@artist)")
+            query_parameters.append(bigquery.ScalarQueryParameter("artist", "STRING", artist))
+
+        sql = f"""
+            SELECT COUNT(*) as count
+            FROM `{self.PROJECT_ID}.{self.DATASET_ID}.karaokenerds_raw`
+            WHERE {" AND ".join(conditions)}
+        """
+
+        job_config = bigquery.QueryJobConfig(query_parameters=query_parameters)
+        result = list(self.client.query(sql, job_config=job_config).result())[0]
+        return int(result.count)
+
     def count_songs(self) -> int:
         """Get total number of songs in catalog."""
         sql = f"""
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Rebuild the on-disk catalog lookup cache from BigQuery.
+
+The API memory-maps this cache at startup (CATALOG_CACHE_DIR) instead of
+reading and normalizing the whole karaoke catalog, and rebuilds it itself once
+it is older than CATALOG_SYNC_INTERVAL_HOURS. Run this after the catalog tables
+are refreshed so the next deploy or restart picks up the new songs right away.
+
+Usage:
+    # Rebuild into the directory from CATALOG_CACHE_DIR
+    python scripts/rebuild_catalog_cache.py
+
+    # Rebuild into an explicit directory
+    python scripts/rebuild_catalog_cache.py --cache-dir /var/cache/karaoke-decide
+"""
+
+import sys
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.config import get_backend_settings
+from backend.services.catalog_lookup import CatalogLookup
+from karaoke_decide.services.bigquery_catalog import BigQueryCatalogService
+
+console = Console()
+
+
+@click.command()
+@click.option("--cache-dir", default=None, help="Cache directory (defaults to CATALOG_CACHE_DIR)")
+def main(cache_dir: str | None) -> None:
+    """Load the catalog from BigQuery and write the lookup cache."""
+    cache_dir = cache_dir or get_backend_settings().catalog_cache_dir
+    if not cache_dir:
+        console.print("[red]No cache directory: pass --cache-dir or set CATALOG_CACHE_DIR[/red]")
+        sys.exit(1)
+
+    lookup = CatalogLookup()
+    lookup.load_from_bigquery(BigQueryCatalogService())
+    lookup.save_cache(cache_dir)
+    console.print(f"[green]Cached {lookup.entry_count:,} songs in {cache_dir}[/green]")
+
+
+if __name__ == "__main__":
+    main()
@@ -101,6 +101,24 @@ class TestBigQueryCatalogService:
         assert params["limit"] == 10
         assert params["offset"] == 20
 
+    @patch("karaoke_decide.services.bigquery_catalog.bigquery.Client")
+    def test_search_songs_with_keyset_cursor(self, mock_client_class: MagicMock) -> None:
+        """Test keyset cursor filters past the last seen row instead of offsetting."""
+        mock_client = mock_client_class.return_value
+        mock_client.query.return_value.result.return_value = []
+
+        service = BigQueryCatalogService()
+        service.search_songs("queen", limit=10, offset=20, after=(4, 1234))
+
+        sql = mock_client.query.call_args[0][0]
+        config = mock_client.query.call_args[1]["job_config"]
+        params = {p.name: p.value for p in config.query_parameters}
+        assert "id < @after_id" in sql
+        assert "ORDER BY brand_count DESC, id DESC" in sql
+        assert params["after_brand_count"] == 4
+        assert params["after_id"] == 1234
+        assert params["offset"] == 0
+
     @patch("karaoke_decide.services.bigquery_catalog.bigquery.Client")
     def test_search_songs_with_min_brands(self, mock_client_class: MagicMock) -> None:
         """Test filtering by minimum brand count."""
@@ -198,6 +216,24 @@ class TestBigQueryCatalogService:
 
         assert count == 275809
 
+    @patch("karaoke_decide.services.bigquery_catalog.bigquery.Client")
+    def test_count_matching_songs(self, mock_client_class: MagicMock) -> None:
+        """Test counting songs that match a search."""
+        mock_client = mock_client_class.return_value
+        mock_result = MagicMock()
+        mock_result.count = 42
+        mock_client.query.return_value.result.return_value = [mock_result]
+
+        service = BigQueryCatalogService()
+        count = service.count_matching_songs(query="love", min_brands=2)
+
+        assert count == 42
+        sql = mock_client.query.call_args[0][0]
+        assert "LIKE LOWER(@query)" in sql
+        assert "@artist" not in sql
+        params = {p.name: p.value for p in mock_client.query.call_args.kwargs["job_config"].query_parameters}
+        assert params == {"min_brands": 2, "query": "%love%"}
+
     @patch("karaoke_decide.services.bigquery_catalog.bigquery.Client")
     def test_get_stats(self, mock_client_class: MagicMock) -> None:
         """Test getting catalog statistics."""